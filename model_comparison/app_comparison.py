@@ -3,36 +3,60 @@
 여러 CNN 모델의 성능을 비교하고 리더보드를 제공합니다.
 """
 
-from flask import Flask, render_template, request, jsonify, send_from_directory, Response, stream_with_context
+import time
+PROCESS_START_TIME = time.time()
+
+import glob
+import hashlib
 import json
 import os
-import time
+import shutil
 import numpy as np
 from datetime import datetime
-from werkzeug.utils import secure_filename
 import queue
 import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
-# TensorFlow 설정
-os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
-import tensorflow as tf
-from tensorflow import keras
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import LabelEncoder
-
-# 모델 import
-from models.baseline import BaselineModel
-from models.resnet import ResNetModel
-from models.densenet import DenseNetModel
-from models.efficientnet import EfficientNetModel
-from models.slive import SLIVEModel
+from utils.lazy_import import STARTUP_PROFILER, LazyModule, LazyClassRegistry
+STARTUP_PROFILER.start_time = PROCESS_START_TIME
+STARTUP_PROFILER.record('stdlib_numpy', time.time() - PROCESS_START_TIME)
 
-# 유틸리티 import
-from utils import ResourceMonitor, TrainingResourceMonitor, measure_all_resources, get_system_info
+_phase_start = time.time()
+from flask import Flask, render_template, request, jsonify, send_from_directory, Response, stream_with_context
+from werkzeug.utils import secure_filename
+try:
+    from flask_sock import Sock, ConnectionClosed
+except ImportError:  # WebSocket 스트리밍 비활성화 (HTTP /api/live/predict 만 사용)
+    Sock = None
+STARTUP_PROFILER.record('flask', time.time() - _phase_start)
 
+# TensorFlow 설정 (TensorFlow / scikit-learn 은 처음 사용할 때 로드)
+os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
+tf = LazyModule('tensorflow')
+keras = LazyModule('keras', loader=lambda: tf.keras, depends=(tf,))
+sklearn_model_selection = LazyModule('sklearn.model_selection')
+sklearn_preprocessing = LazyModule('sklearn.preprocessing')
+
+# 유틸리티 import (TensorFlow 비의존)
+from utils import ModelMetadataCache, KerasInferenceEngine, FusedInferenceEngine, MicroBatcher, ModelCache
+from utils import StreamingInferenceEngine
+from utils.numpy_backend import NumpyInferenceEngine
+from utils.tflite_backend import TFLITE_QUANTIZATION_MODES, TFLiteInferenceEngine
+from utils.live_session import LiveSessionStore
+from utils.cascade import CascadeStats, calibrate_cascade_thresholds, MAX_CASCADE_STAGES
+from utils.distillation import DEFAULT_TEMPERATURE, DEFAULT_ALPHA, build_distillation_targets, compile_for_distillation
+from utils.live_protocol import (
+    MIME_BINARY, MIME_JSON, MSGPACK_MIMETYPES, STREAM_FRAME_BYTES,
+    decode_landmark_batch_payload, decode_landmark_payload, decode_msgpack_request, decode_stream_frame,
+    encode_predictions_binary, encode_predictions_msgpack, response_mimetypes
+)
+
+_phase_start = time.time()
 app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 32 * 1024 * 1024  # 32MB
 app.config['JSON_AS_ASCII'] = False
+sock = Sock(app) if Sock is not None else None
 
 # 경로 설정
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -43,23 +67,99 @@ MODELS_DIR = os.path.join(BASE_DIR, 'trained_models')
 # 데이터 파일
 COMPARISON_DATA_FILE = os.path.join(DATA_DIR, 'comparison_data.json')
 LEADERBOARD_FILE = os.path.join(RESULTS_DIR, 'leaderboard.json')
+MODEL_METADATA_FILE = os.path.join(RESULTS_DIR, 'model_metadata.json')
 
 # 디렉토리 생성
 os.makedirs(DATA_DIR, exist_ok=True)
 os.makedirs(RESULTS_DIR, exist_ok=True)
 os.makedirs(MODELS_DIR, exist_ok=True)
 
-# 모델 매핑
-MODEL_CLASSES = {
-    'baseline': BaselineModel,
-    'resnet': ResNetModel,
-    'densenet': DenseNetModel,
-    'efficientnet': EfficientNetModel,
-    'slive': SLIVEModel
+# 모델 매핑 (모델 모듈은 처음 사용할 때 로드)
+MODEL_CLASSES = LazyClassRegistry({
+    'baseline': 'models.baseline:BaselineModel',
+    'resnet': 'models.resnet:ResNetModel',
+    'densenet': 'models.densenet:DenseNetModel',
+    'efficientnet': 'models.efficientnet:EfficientNetModel',
+    'slive': 'models.slive:SLIVEModel',
+    'temporal': 'models.temporal:TemporalModel'
+}, depends=(tf, keras))
+
+# 로드된 모델/엔진 LRU 캐시 (선택 변경 시 재로드 방지, LIVE_MODEL_CACHE_MB 로 메모리 예산 설정)
+LIVE_MODEL_CACHE = ModelCache(max_memory_mb=float(os.environ.get('LIVE_MODEL_CACHE_MB', '2048')))
+
+# 실시간 추론 마이크로 배칭 기본 설정 (/api/live/load 의 batching 옵션으로 변경)
+DEFAULT_BATCHING_CONFIG = {
+    'enabled': False,
+    'window_ms': 2.0,
+    'max_batch_size': 16
+}
+LIVE_PREDICT_TIMEOUT_S = 10.0
+
+# 배치 추론 (/api/live/predict_batch) 청크 크기 - 청크 단위로 전처리/추론하여 메모리 사용량 제한
+LIVE_BATCH_CHUNK_SIZE = int(os.environ.get('LIVE_BATCH_CHUNK_SIZE', '256'))
+LIVE_BATCH_MAX_CHUNK_SIZE = 4096
+
+# 실시간 추론 백엔드 (keras: tf.function 엔진, numpy: BatchNorm 접기된 NumPy 가중치 팩)
+LIVE_BACKENDS = ('keras', 'numpy', 'tflite')
+
+# 프레임별 모델 팬아웃 설정 (/api/live/load 의 fanout 옵션으로 변경)
+DEFAULT_FANOUT_CONFIG = {
+    'concurrent': True,
+    'timeout_ms': 1000.0,
+    'model_timeouts_ms': {}
 }
+LIVE_FANOUT_MAX_WORKERS = 16
+_live_executor = None
+_live_executor_lock = threading.Lock()
+
+# 현재 게시된 실시간 추론 모델 세트 (RCU: 게시 후 수정하지 않고 전체 참조를 교체)
+#   models: model_file -> 엔진/배처/클래스, fused_engine: 결합 그래프, fanout: 팬아웃 설정,
+#   cascade: 캐스케이드 순서/임계값/통계 (None이면 모든 모델 실행)
+LIVE_MODEL_SET = {
+    'version': 0,
+    'models': {},
+    'fused_engine': None,
+    'fanout': dict(DEFAULT_FANOUT_CONFIG),
+    'cascade': None
+}
+_live_publish_lock = threading.Lock()
+
+# WebSocket 스트리밍 연결 통계 (/api/live/stream)
+LIVE_STREAM_STATS = {'active_connections': 0, 'total_connections': 0, 'total_frames': 0}
+_live_stream_lock = threading.Lock()
 
-# 로드된 모델 캐시 (실시간 추론용)
-LOADED_MODELS = {}
+# 세션별 프레임 게이트 (X-Live-Session 헤더/session_id, 정지한 손은 이전 예측 재사용)
+LIVE_SESSIONS = LiveSessionStore(
+    motion_threshold=float(os.environ.get('LIVE_MOTION_THRESHOLD', '0.02')),
+    max_reuse_age_s=float(os.environ.get('LIVE_MAX_REUSE_AGE_S', '1.0'))
+)
+
+# 백그라운드 모델 로드 작업 (/api/live/load -> /api/live/load/status 로 진행 상황 조회)
+LIVE_LOAD_JOBS = {}
+LIVE_LOAD_MAX_JOBS = 20
+_live_latest_job_id = None
+_live_load_lock = threading.Lock()
+
+# 모델 아키텍처 메타데이터 캐시 (/api/models/list 용)
+DEFAULT_NUM_CLASSES = 74
+INPUT_SHAPE = (21, 3)
+MODEL_METADATA = ModelMetadataCache(MODEL_METADATA_FILE)
+
+# 최적화 실행 모드 (XLA jit_compile + steps_per_execution) 설정
+OPTIMIZED_MAX_STEPS_PER_EXECUTION = 32
+
+# 폭/깊이 스케일링 스윕: 기본 후보 배율과 최대 변형 수
+SWEEP_DEFAULT_WIDTH_MULTIPLIERS = (0.25, 0.5, 0.75, 1.0)
+SWEEP_DEFAULT_DEPTH_MULTIPLIERS = (1.0,)
+SWEEP_MAX_VARIANTS = 16
+
+# 가지치기 스케줄: 전체 학습 스텝의 이 비율까지 희소도를 늘리고, 나머지는 목표 희소도로 미세 조정
+PRUNING_END_FRACTION = 0.75
+
+# 백그라운드 사전 로드 (COMPARISON_PREWARM=1 일 때 TensorFlow/모델 모듈을 미리 로드, 메타데이터 캐시 워밍업은 항상 실행)
+PREWARM_ENABLED = os.environ.get('COMPARISON_PREWARM', '0') == '1'
+
+STARTUP_PROFILER.record('app_setup', time.time() - _phase_start)
 
 
 # ============ 유틸리티 함수 ============
@@ -78,6 +178,11 @@ def save_json_file(filepath, data):
         json.dump(data, f, ensure_ascii=False, indent=2)
 
 
+# 전처리 방식이 바뀌면 증가 (학습 시 매니페스트에 기록, 로드 시 현재 버전과 비교)
+PREPROCESSING_VERSION = 1
+MANIFEST_VERSION = 1
+
+
 def preprocess_landmarks(landmarks):
     """랜드마크 전처리 (Wrist 기준 정규화)"""
     landmarks = np.array(landmarks)
@@ -96,6 +201,20 @@ def preprocess_landmarks(landmarks):
     return normalized
 
 
+def preprocess_landmarks_batch(landmarks):
+    """랜드마크 배치 전처리 (N, 21, 3) - preprocess_landmarks의 벡터화 버전"""
+    landmarks = np.asarray(landmarks, dtype=np.float64)
+    if landmarks.ndim == 2:
+        landmarks = landmarks.reshape(len(landmarks), -1, 3)
+
+    # Wrist 기준 정규화
+    normalized = landmarks - landmarks[:, :1, :]
+
+    # 샘플별 스케일 정규화
+    max_val = np.max(np.abs(normalized), axis=(1, 2), keepdims=True)
+    return np.divide(normalized, max_val, out=normalized, where=max_val > 0)
+
+
 def prepare_dataset(data_file):
     """데이터셋 준비"""
     data = load_json_file(data_file, {'dataset': []})
@@ -118,23 +237,462 @@ def prepare_dataset(data_file):
         X.append(processed)
         labels_list.append(label)
 
-    X = np.array(X)
+    return split_dataset(np.array(X), labels_list)
 
+
+def split_dataset(X, labels_list):
+    """레이블 인코딩 + 학습/검증 분할 (X는 샘플 순서가 dataset과 같아야 함)"""
     # Label encoding
-    label_encoder = LabelEncoder()
+    label_encoder = sklearn_preprocessing.LabelEncoder()
     y_encoded = label_encoder.fit_transform(labels_list)
     y_categorical = keras.utils.to_categorical(y_encoded)
 
     num_classes = len(label_encoder.classes_)
 
     # Train/Val split
-    X_train, X_val, y_train, y_val = train_test_split(
+    X_train, X_val, y_train, y_val = sklearn_model_selection.train_test_split(
         X, y_categorical, test_size=0.2, random_state=42, stratify=y_encoded
     )
 
     return X_train, X_val, y_train, y_val, num_classes, label_encoder
 
 
+# 시퀀스 모델 학습 윈도우: 같은 레이블이 연속으로 녹화된 구간 안에서만 구성 (간격이 이보다 크면 새 구간)
+SEQUENCE_MAX_GAP_S = 1.0
+
+
+def _parse_timestamp(value):
+    """ISO 타임스탬프 -> epoch 초 (파싱 실패 시 None)"""
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+
+def prepare_sequence_dataset(data_file, sequence_length):
+    """시퀀스 모델용 데이터셋 준비 - 샘플마다 그 프레임으로 끝나는 (T, 21, 3) 윈도우
+
+    데이터셋은 녹화 순서대로 저장되므로, 같은 레이블이 연속된 구간을 하나의 녹화로 보고
+    구간 시작 부분은 첫 프레임을 반복해 채웁니다. 샘플 순서/분할은 prepare_dataset과 동일합니다.
+    """
+    data = load_json_file(data_file, {'dataset': []})
+    dataset = data.get('dataset', [])
+
+    if len(dataset) == 0:
+        return None, None, None, None, None
+
+    X = []
+    labels_list = []
+    run = []
+    previous_label, previous_time = None, None
+
+    for item in dataset:
+        label = item['label']
+        timestamp = _parse_timestamp(item.get('timestamp'))
+
+        # 레이블이 바뀌거나 녹화 간격이 크면 새 구간
+        gap = None if timestamp is None or previous_time is None else timestamp - previous_time
+        if label != previous_label or (gap is not None and not 0 <= gap <= SEQUENCE_MAX_GAP_S):
+            run = []
+        previous_label, previous_time = label, timestamp
+
+        run.append(preprocess_landmarks(item['landmarks']))
+        window = run[-sequence_length:]
+        X.append(np.stack([window[0]] * (sequence_length - len(window)) + window))
+        labels_list.append(label)
+
+    return split_dataset(np.array(X), labels_list)
+
+
+def is_streaming_model_key(model_key):
+    """스트리밍 시퀀스 모델 여부 (모델 클래스의 streaming 속성)"""
+    return model_key in MODEL_CLASSES and getattr(MODEL_CLASSES[model_key], 'streaming', False)
+
+
+def prepare_training_dataset(model_class):
+    """모델 입력에 맞는 학습 데이터셋 (시퀀스 모델은 프레임 윈도우)"""
+    if getattr(model_class, 'streaming', False):
+        return prepare_sequence_dataset(COMPARISON_DATA_FILE, model_class.SEQUENCE_LENGTH)
+    return prepare_dataset(COMPARISON_DATA_FILE)
+
+
+def prepare_distillation(distill, model_class, X_train, X_val, y_train, y_val, label_encoder, dataset_hash):
+    """증류 학습 준비 -> (교사 정보, 학습 타깃, 검증 타깃) (교사를 사용할 수 없으면 ValueError)
+
+    distill: {teacher: 리더보드 model_file, temperature, alpha}
+    """
+    if getattr(model_class, 'streaming', False):
+        raise ValueError('Streaming models cannot be trained as students')
+
+    teacher_file = distill.get('teacher')
+    teacher_path = os.path.join(MODELS_DIR, f"{teacher_file}.h5")
+    if not teacher_file or not os.path.exists(teacher_path):
+        raise ValueError('Teacher model file not found')
+
+    manifest, manifest_error = load_model_manifest(teacher_file)
+    if manifest is None:
+        raise ValueError(f'Teacher: {manifest_error}')
+    if is_streaming_model_key(manifest.get('model_key')):
+        raise ValueError('Streaming models cannot be used as teachers')
+    # 교사 출력 인덱스가 현재 데이터셋 레이블 순서와 같아야 soft target 으로 사용 가능
+    if manifest['classes'] != label_encoder.classes_.tolist():
+        raise ValueError('Teacher classes differ from the current dataset (retrain the teacher)')
+
+    temperature = float(distill.get('temperature', DEFAULT_TEMPERATURE))
+    alpha = float(distill.get('alpha', DEFAULT_ALPHA))
+    if temperature <= 0 or not 0.0 <= alpha <= 1.0:
+        raise ValueError('temperature must be > 0 and alpha in [0, 1]')
+
+    teacher = keras.models.load_model(teacher_path, custom_objects=get_custom_objects(), compile=False)
+    train_probs = teacher.predict(X_train, batch_size=256, verbose=0)
+    val_probs = teacher.predict(X_val, batch_size=256, verbose=0)
+
+    # 리더보드 기록의 교사 지연 시간 (학생과 비교용)
+    leaderboard = load_json_file(LEADERBOARD_FILE, {'results': []})
+    teacher_entry = next(
+        (result for result in reversed(leaderboard.get('results', [])) if result.get('model_file') == teacher_file), {}
+    )
+
+    teacher_info = {
+        'teacher_model_file': teacher_file,
+        'teacher_model_key': manifest.get('model_key'),
+        'teacher_model_name': manifest.get('model_name'),
+        'teacher_val_accuracy': float(np.mean(np.argmax(val_probs, axis=1) == np.argmax(y_val, axis=1))),
+        'teacher_inference_time_ms': teacher_entry.get('inference_time_ms'),
+        'teacher_num_parameters': int(teacher.count_params()),
+        # 교사가 다른 데이터셋으로 학습되었으면 검증 분할이 교사의 학습 데이터와 겹칠 수 있음
+        'teacher_dataset_match': manifest.get('dataset_hash') == dataset_hash,
+        'temperature': temperature,
+        'alpha': alpha
+    }
+    return (
+        teacher_info,
+        build_distillation_targets(y_train, train_probs, temperature),
+        build_distillation_targets(y_val, val_probs, temperature)
+    )
+
+
+def get_steps_per_execution(num_samples, batch_size, max_steps=OPTIMIZED_MAX_STEPS_PER_EXECUTION):
+    """최적화 실행 모드의 steps_per_execution 계산 (에포크당 스텝 수를 넘지 않도록)"""
+    steps_per_epoch = int(np.ceil(num_samples / batch_size))
+    return max(1, min(max_steps, steps_per_epoch))
+
+
+def get_scaling_args(params):
+    """모델 폭/깊이 배율 (EfficientNet compound scaling, 0 이하이면 ValueError)"""
+    scaling = {
+        'width_multiplier': float(params.get('width_multiplier', 1.0)),
+        'depth_multiplier': float(params.get('depth_multiplier', 1.0))
+    }
+    if min(scaling.values()) <= 0:
+        raise ValueError('width_multiplier and depth_multiplier must be > 0')
+    return scaling
+
+
+def create_pruning_callback(prune, num_samples, batch_size, epochs, steps_per_execution=1):
+    """점진적 크기 기반 가지치기 Callback (prune: {target_sparsity, frequency}, 잘못된 값이면 ValueError)"""
+    from utils.pruning import MagnitudePruningCallback
+
+    # Callback 은 steps_per_execution 스텝마다 한 번 호출되므로 스케줄도 호출 단위로 계산
+    calls_per_epoch = int(np.ceil(np.ceil(num_samples / batch_size) / steps_per_execution))
+    return MagnitudePruningCallback(
+        float(prune.get('target_sparsity', 0.5)),
+        end_step=int(epochs * calls_per_epoch * PRUNING_END_FRACTION),
+        frequency=int(prune.get('frequency', 10))
+    )
+
+
+def export_pruned_model(model, model_filename, pruning_callback):
+    """가지치기된 모델 -> 희소 가중치 파일 저장 및 리더보드 pruning 항목"""
+    from utils.pruning import compute_sparsity, export_sparse_weights
+
+    sparse_path = get_sparse_weights_path(model_filename)
+    export_sparse_weights(model, sparse_path)
+
+    # 비교 기준: 옵티마이저 상태를 제외한 float32 가중치 크기
+    dense_bytes = sum(int(np.prod(weight.shape)) * 4 for weight in model.weights)
+    sparse_bytes = os.path.getsize(sparse_path)
+
+    return {
+        'target_sparsity': pruning_callback.target_sparsity,
+        **compute_sparsity(model),
+        'sparsity_history': pruning_callback.sparsity_history,
+        'sparse_file': os.path.basename(sparse_path),
+        'sparse_size_mb': sparse_bytes / (1024 * 1024),
+        'dense_weights_mb': dense_bytes / (1024 * 1024),
+        'h5_size_mb': os.path.getsize(os.path.join(MODELS_DIR, f"{model_filename}.h5")) / (1024 * 1024),
+        'compression_ratio': dense_bytes / sparse_bytes
+    }
+
+
+def get_weight_pack_path(model_file, quantization=None):
+    """NumPy 가중치 팩 경로"""
+    suffix = f".{quantization}" if quantization else ''
+    return os.path.join(MODELS_DIR, f"{model_file}{suffix}.npz")
+
+
+def get_folded_model_path(model_file):
+    """BatchNorm 접기 최적화 모델 경로"""
+    return os.path.join(MODELS_DIR, f"{model_file}.folded.h5")
+
+
+def get_sparse_weights_path(model_file):
+    """가지치기 모델 희소 가중치 경로"""
+    return os.path.join(MODELS_DIR, f"{model_file}.sparse.npz")
+
+
+def get_tflite_model_path(model_file, quantization):
+    """TFLite 양자화 모델 경로"""
+    return os.path.join(MODELS_DIR, f"{model_file}.{quantization}.tflite")
+
+
+def get_keras_archive_path(model_file):
+    """Keras 네이티브 형식(.keras) 모델 경로"""
+    return os.path.join(MODELS_DIR, f"{model_file}.keras")
+
+
+def get_saved_model_path(model_file):
+    """TensorFlow SavedModel 디렉터리 경로"""
+    return os.path.join(MODELS_DIR, f"{model_file}.savedmodel")
+
+
+def get_fast_artifact_path(model_file):
+    """빠른 로드 아티팩트 헤더 경로 (아키텍처 키 + 생성자 인자 + 가중치 목록)"""
+    return os.path.join(MODELS_DIR, f"{model_file}.fast.json")
+
+
+def get_fast_weights_path(model_file):
+    """빠른 로드 아티팩트의 평탄한 가중치 파일 경로 (np.memmap 으로 로드)"""
+    return os.path.join(MODELS_DIR, f"{model_file}.fast.bin")
+
+
+def get_legacy_model_path(model_file):
+    """native swish 변환 전 원본 (Lambda swish) 체크포인트 보관 경로"""
+    return os.path.join(MODELS_DIR, f"{model_file}.legacy.h5")
+
+
+def write_fast_artifact(model_file, model_key, constructor_args, model, validate=None):
+    """빠른 로드 아티팩트 저장 (모델 클래스 생성자 인자 + 64바이트 정렬된 평탄한 가중치 파일) -> (헤더, 검증 결과)
+
+    임시 디렉터리({model_file}.fast.tmp)에 먼저 쓰고, validate(임시 헤더 경로)가 통과하면 (없으면 바로)
+    제자리로 교체하므로 검증에 실패하거나 저장이 중단되어도 기존 아티팩트는 바뀌지 않습니다.
+    """
+    from utils.weight_store import save_weight_store
+
+    header_path = get_fast_artifact_path(model_file)
+    weights_path = get_fast_weights_path(model_file)
+    staging_dir = os.path.join(MODELS_DIR, f"{model_file}.fast.tmp")
+    os.makedirs(staging_dir, exist_ok=True)
+    try:
+        staged_header_path = os.path.join(staging_dir, os.path.basename(header_path))
+        staged_weights_path = os.path.join(staging_dir, os.path.basename(weights_path))
+        header = save_weight_store(
+            staged_header_path, staged_weights_path, model_key, constructor_args,
+            model.get_weights(), names=[weight.name for weight in model.weights]
+        )
+        validation = validate(staged_header_path) if validate is not None else None
+        if validation is None or validation['passed']:
+            # 헤더를 마지막에 교체 (그 사이 로드는 가중치 파일 크기 불일치로 거부됨)
+            os.replace(staged_weights_path, weights_path)
+            os.replace(staged_header_path, header_path)
+        return header, validation
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def load_fast_model(header_path):
+    """빠른 로드 아티팩트 -> Keras 모델 (추론 전용, 컴파일 생략)
+
+    모델 클래스로 그래프를 다시 만들고 memmap 가중치를 바인딩하므로 HDF5 파싱/설정 역직렬화가 없고
+    로드 시간은 대부분 그래프 생성입니다. TF 변수는 외부 메모리를 참조할 수 없으므로
+    set_weights 가 공유 페이지 캐시에서 변수 버퍼로 한 번 복사합니다 (중간 배열 없음).
+    """
+    from utils.weight_store import load_weight_store
+
+    header, weights = load_weight_store(header_path)
+    model = MODEL_CLASSES[header['model_key']](**header['constructor_args']).build_model()
+    model.set_weights(weights)
+    return model
+
+
+def record_export_result(model_file, export_name, export_result):
+    """리더보드 항목에 내보내기 결과 기록"""
+    leaderboard = load_json_file(LEADERBOARD_FILE, {'results': []})
+    results = leaderboard.get('results', [])
+    for result in results:
+        if result.get('model_file') == model_file:
+            result.setdefault('exports', {})[export_name] = export_result
+    save_json_file(LEADERBOARD_FILE, {'results': results})
+
+
+def measure_engine_latency(engine, sample, num_runs=100):
+    """단일 프레임 평균 추론 시간 (ms)"""
+    engine.warm_up()
+    return float(np.mean([engine.predict(sample)[1] for _ in range(num_runs)]))
+
+
+def measure_load_time(load_fn, num_runs=3):
+    """모델 로드 시간 (ms, num_runs 회 중 최솟값) -> (마지막으로 로드한 모델, 로드 시간)"""
+    load_times = []
+    for _ in range(num_runs):
+        start = time.perf_counter()
+        model = load_fn()
+        load_times.append((time.perf_counter() - start) * 1000)
+    return model, float(min(load_times))
+
+
+def measure_latency_percentiles(engine, sample, num_runs=200):
+    """단일 프레임 추론 시간 분포 (ms, 평균/p50/p95/p99)"""
+    engine.warm_up()
+    times = np.array([engine.predict(sample)[1] for _ in range(num_runs)])
+    return {
+        'mean_ms': float(np.mean(times)),
+        'p50_ms': float(np.percentile(times, 50)),
+        'p95_ms': float(np.percentile(times, 95)),
+        'p99_ms': float(np.percentile(times, 99))
+    }
+
+
+def measure_streaming_latency(model_instance, model, X_val, num_runs=100):
+    """스트리밍 모델 프레임당 비용 비교: 윈도우 상태 한 스텝 vs 윈도우 전체 재계산
+
+    검증 윈도우의 마지막 프레임들(윈도우 길이의 3배)을 하나의 녹화 구간으로 스텝 추론한 프레임별 출력이
+    학습과 같은 방식으로 만든 윈도우 (구간 시작은 첫 프레임 반복)의 전체 추론과 같은지도 확인합니다.
+    """
+    sequence_length = model_instance.sequence_length
+    step_engine = StreamingInferenceEngine(
+        model, model_instance.build_streaming_model(model), model_instance.frame_shape, window_length=sequence_length
+    )
+    window_engine = KerasInferenceEngine(model, model_instance.input_shape)
+
+    # 실시간 추론과 같은 경로 (윈도우 상태 한 스텝)
+    frame = X_val[0:1, -1]
+    step_engine.warm_up()
+    window_state = step_engine.start_window(frame)
+    step_times = []
+    for _ in range(num_runs):
+        _, window_state, step_time = step_engine.step_window(frame, window_state)
+        step_times.append(step_time)
+    step_time_ms = float(np.mean(step_times))
+    window_time_ms = measure_engine_latency(window_engine, X_val[0:1], num_runs)
+
+    frames = X_val[:3 * sequence_length, -1]
+    step_outputs, _, _ = step_engine.predict_sequence(frames)
+    windows = np.stack([
+        np.concatenate([
+            np.repeat(frames[:1], max(sequence_length - 1 - i, 0), axis=0),
+            frames[max(i - sequence_length + 1, 0):i + 1]
+        ])
+        for i in range(len(frames))
+    ])
+    window_outputs, _ = window_engine.predict(windows)
+
+    return {
+        'sequence_length': sequence_length,
+        'step_time_ms': step_time_ms,
+        'window_time_ms': window_time_ms,
+        'speedup': window_time_ms / step_time_ms if step_time_ms > 0 else None,
+        'validated_steps': int(len(frames)),
+        'max_abs_diff': float(np.max(np.abs(step_outputs - window_outputs)))
+    }
+
+
+def get_manifest_path(model_file):
+    """모델 매니페스트 경로 (학습 시 .h5 옆에 저장)"""
+    return os.path.join(MODELS_DIR, f"{model_file}.manifest.json")
+
+
+def compute_dataset_hash(*arrays):
+    """학습에 사용한 (전처리된) 데이터 배열의 SHA-256 해시"""
+    digest = hashlib.sha256()
+    for array in arrays:
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
+
+
+def write_model_manifest(model_file, model_key, model_name, label_encoder, dataset_hash, num_samples, backfilled=False):
+    """모델 매니페스트 저장 (클래스 목록, 입력 형태, 전처리 버전, 아키텍처 키, 데이터셋 해시)"""
+    classes = label_encoder.classes_.tolist()
+    manifest = {
+        'manifest_version': MANIFEST_VERSION,
+        'model_file': model_file,
+        'model_key': model_key,
+        'model_name': model_name,
+        'classes': classes,
+        'num_classes': len(classes),
+        'input_shape': list(INPUT_SHAPE),
+        'preprocessing_version': PREPROCESSING_VERSION,
+        'dataset_hash': dataset_hash,
+        'num_samples': num_samples,
+        'backfilled': backfilled,
+        'created_at': datetime.now().isoformat()
+    }
+    save_json_file(get_manifest_path(model_file), manifest)
+    return manifest
+
+
+def load_model_manifest(model_file):
+    """모델 매니페스트 로드 및 현재 서버와 호환성 확인 -> (매니페스트, 오류 메시지)"""
+    manifest_path = get_manifest_path(model_file)
+    if not os.path.exists(manifest_path):
+        return None, 'Model manifest not found (retrain or backfill via /api/models/manifest)'
+
+    manifest = load_json_file(manifest_path)
+    if tuple(manifest.get('input_shape', ())) != INPUT_SHAPE:
+        return None, f"Input shape mismatch: {manifest.get('input_shape')}"
+    if manifest.get('preprocessing_version') != PREPROCESSING_VERSION:
+        return None, f"Preprocessing version mismatch: {manifest.get('preprocessing_version')} != {PREPROCESSING_VERSION}"
+
+    return manifest, None
+
+
+def get_validation_inputs(max_samples=256):
+    """내보내기 검증용 입력 (데이터셋 검증 분할, 없으면 무작위 정규화 랜드마크)"""
+    result = prepare_dataset(COMPARISON_DATA_FILE)
+    if result[0] is not None:
+        X_val = result[1]
+        return X_val[:max_samples].astype(np.float32)
+
+    rng = np.random.default_rng(42)
+    samples = [preprocess_landmarks(rng.normal(size=INPUT_SHAPE)) for _ in range(max_samples)]
+    return np.array(samples, dtype=np.float32)
+
+
+def get_execution_mode(optimized):
+    """리더보드에 기록할 실행 모드 이름"""
+    return 'xla' if optimized else 'default'
+
+
+def prewarm():
+    """TensorFlow, scikit-learn, 모델 모듈 사전 로드"""
+    start_time = time.time()
+    try:
+        for module in (tf, keras, sklearn_model_selection, sklearn_preprocessing):
+            module.load()
+        for model_key in MODEL_CLASSES:
+            MODEL_CLASSES[model_key]
+    except Exception as e:
+        print(f"사전 로드 실패: {e}")
+    STARTUP_PROFILER.record('prewarm', time.time() - start_time, category='prewarm')
+
+
+def start_prewarm_thread():
+    """사전 로드를 백그라운드 스레드에서 시작"""
+    thread = threading.Thread(target=prewarm, name='prewarm', daemon=True)
+    thread.start()
+    return thread
+
+
+def print_startup_report():
+    """서버 시작 시간 구성 출력"""
+    report = STARTUP_PROFILER.report()
+    print("시작 시간 구성:")
+    for phase in report['phases']:
+        print(f"  {phase['name']:<24} {phase['duration_ms']:8.1f} ms ({phase['category']})")
+    if report['time_to_ready_ms'] is not None:
+        print(f"  {'time_to_ready':<24} {report['time_to_ready_ms']:8.1f} ms")
+
+
 # ============ 라우트 ============
 
 @app.route('/')
@@ -232,19 +790,19 @@ def reset_data():
 
 @app.route('/api/models/list', methods=['GET'])
 def list_models():
-    """사용 가능한 모델 목록"""
+    """사용 가능한 모델 목록 (파라미터 수/FLOPs는 메타데이터 캐시에서 제공)"""
+    num_classes = request.args.get('num_classes', DEFAULT_NUM_CLASSES, type=int)
     models_info = []
 
-    for model_key, model_class in MODEL_CLASSES.items():
+    for model_key in MODEL_CLASSES:
         try:
-            model_instance = model_class()
-            model_instance.build_model()
-            params = model_instance.count_parameters()
+            metadata = MODEL_METADATA.get_or_compute(MODEL_CLASSES, model_key, num_classes, INPUT_SHAPE)
 
             models_info.append({
                 'key': model_key,
-                'name': model_instance.name,
-                'parameters': int(params)
+                'name': metadata['name'],
+                'parameters': metadata['parameters'],
+                'flops': metadata['flops']
             })
         except Exception as e:
             models_info.append({
@@ -269,24 +827,62 @@ def train_model():
         epochs = params.get('epochs', 20)
         batch_size = params.get('batch_size', 32)
         learning_rate = params.get('learning_rate', 0.001)
+        optimized = bool(params.get('optimized', False))
+        distill = params.get('distill')
+        prune = params.get('prune')
 
         # 모델 클래스 가져오기
         if model_key not in MODEL_CLASSES:
             return jsonify({'success': False, 'error': 'Invalid model'}), 400
 
-        # 데이터셋 준비
-        result = prepare_dataset(COMPARISON_DATA_FILE)
+        try:
+            scaling = get_scaling_args(params)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+
+        # 데이터셋 준비 (시퀀스 모델은 프레임 윈도우)
+        model_class = MODEL_CLASSES[model_key]
+        result = prepare_training_dataset(model_class)
         if result[0] is None:
             return jsonify({'success': False, 'error': 'No data available'}), 400
 
         X_train, X_val, y_train, y_val, num_classes, label_encoder = result
+        dataset_hash = compute_dataset_hash(X_train, X_val, y_train, y_val)
+
+        # 증류 모드: 교사 soft target 을 정답과 함께 학습 타깃으로 사용
+        distillation, fit_y_train, fit_y_val = None, y_train, y_val
+        if distill:
+            try:
+                distillation, fit_y_train, fit_y_val = prepare_distillation(
+                    distill, model_class, X_train, X_val, y_train, y_val, label_encoder, dataset_hash
+                )
+            except ValueError as e:
+                return jsonify({'success': False, 'error': str(e)}), 400
 
         # 모델 생성
-        model_class = MODEL_CLASSES[model_key]
-        model_instance = model_class(num_classes=num_classes)
+        steps_per_execution = get_steps_per_execution(len(X_train), batch_size) if optimized else 1
+
+        # 가지치기 모드: 학습 중 Dense/Conv1D 커널 희소도를 목표까지 점진적으로 증가
+        pruning_callback = None
+        if prune:
+            try:
+                pruning_callback = create_pruning_callback(prune, len(X_train), batch_size, epochs, steps_per_execution)
+            except ValueError as e:
+                return jsonify({'success': False, 'error': str(e)}), 400
+
+        model_instance = model_class(num_classes=num_classes, **scaling)
         model_instance.build_model()
-        model_instance.compile_model(learning_rate=learning_rate)
+        model_instance.compile_model(
+            learning_rate=learning_rate,
+            optimized=optimized,
+            steps_per_execution=steps_per_execution
+        )
         model = model_instance.get_model()
+        if distillation is not None:
+            compile_for_distillation(
+                model, num_classes, learning_rate, distillation['temperature'], distillation['alpha'],
+                **({'jit_compile': True, 'steps_per_execution': steps_per_execution} if optimized else {})
+            )
 
         # 학습 시작 시간
         start_time = time.time()
@@ -309,11 +905,11 @@ def train_model():
 
         # 학습
         history = model.fit(
-            X_train, y_train,
-            validation_data=(X_val, y_val),
+            X_train, fit_y_train,
+            validation_data=(X_val, fit_y_val),
             epochs=epochs,
             batch_size=batch_size,
-            callbacks=[metrics_callback],
+            callbacks=[metrics_callback] + ([pruning_callback] if pruning_callback is not None else []),
             verbose=0
         )
 
@@ -325,12 +921,16 @@ def train_model():
         train_acc = float(history.history['accuracy'][-1])
         val_acc = float(history.history['val_accuracy'][-1])
 
-        # 추론 속도 측정
+        # 추론 속도 측정 (두 모드 모두 같은 tf.function 경로, 최적화 모드만 XLA jit_compile)
+        inference_fn = model_instance.get_inference_function(jit_compile=optimized)
+        inference_fn(tf.convert_to_tensor(X_val[0:1], dtype=tf.float32))  # 트레이싱/XLA 컴파일
+
         inference_times = []
         for _ in range(100):
-            sample = X_val[np.random.randint(len(X_val))].reshape(1, 21, 3)
+            idx = np.random.randint(len(X_val))
+            sample = X_val[idx:idx + 1]
             start = time.time()
-            model.predict(sample, verbose=0)
+            inference_fn(tf.convert_to_tensor(sample, dtype=tf.float32)).numpy()
             inference_times.append(time.time() - start)
 
         avg_inference_time = np.mean(inference_times) * 1000  # ms
@@ -338,7 +938,18 @@ def train_model():
         # 모델 저장
         model_filename = f"{model_key}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         model_path = os.path.join(MODELS_DIR, f"{model_filename}.h5")
+        if distillation is not None:
+            # 증류 손실 대신 기본 손실로 저장 (로드 시 커스텀 손실 불필요)
+            model_instance.compile_model(learning_rate=learning_rate, optimized=optimized, steps_per_execution=steps_per_execution)
         model.save(model_path)
+        manifest = write_model_manifest(
+            model_filename, model_key, model_instance.name, label_encoder,
+            dataset_hash, len(X_train) + len(X_val)
+        )
+        write_fast_artifact(
+            model_filename, model_key, {'num_classes': num_classes, 'input_shape': list(INPUT_SHAPE), **scaling}, model
+        )
+        pruning = export_pruned_model(model, model_filename, pruning_callback) if pruning_callback is not None else None
 
         # 리더보드 업데이트
         leaderboard = load_json_file(LEADERBOARD_FILE, {'results': []})
@@ -356,12 +967,28 @@ def train_model():
             'epochs': epochs,
             'batch_size': batch_size,
             'learning_rate': learning_rate,
+            'execution_mode': get_execution_mode(optimized),
+            'steps_per_execution': steps_per_execution,
             'num_samples': len(X_train) + len(X_val),
             'num_classes': num_classes,
             'timestamp': datetime.now().isoformat(),
-            'model_file': model_filename
+            'model_file': model_filename,
+            'dataset_hash': manifest['dataset_hash'],
+            **scaling
         }
 
+        # 스트리밍 모델: 프레임당 스텝 비용 vs 윈도우 재계산 비용
+        if getattr(model_instance, 'streaming', False):
+            result_entry['streaming'] = measure_streaming_latency(model_instance, model, X_val)
+
+        # 증류 모델: 교사 계보 (교사 정확도/지연 시간과 비교)
+        if distillation is not None:
+            result_entry['distillation'] = distillation
+
+        # 가지치기 모델: 실제 희소도와 희소 가중치 파일 크기
+        if pruning is not None:
+            result_entry['pruning'] = pruning
+
         results.append(result_entry)
         save_json_file(LEADERBOARD_FILE, {'results': results})
 
@@ -381,37 +1008,81 @@ def train_model_stream():
     """모델 학습 API - 실시간 스트리밍"""
 
     def generate():
+        from utils import TrainingResourceMonitor, measure_all_resources
+
         try:
             params = request.json
             model_key = params.get('model', 'baseline')
             epochs = params.get('epochs', 20)
             batch_size = params.get('batch_size', 32)
             learning_rate = params.get('learning_rate', 0.001)
+            optimized = bool(params.get('optimized', False))
+            distill = params.get('distill')
+            prune = params.get('prune')
 
             # 모델 클래스 가져오기
             if model_key not in MODEL_CLASSES:
                 yield f"data: {json.dumps({'type': 'error', 'message': 'Invalid model'})}\n\n"
                 return
 
+            try:
+                scaling = get_scaling_args(params)
+            except ValueError as e:
+                yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+                return
+
             # 진행 상태 전송
             yield f"data: {json.dumps({'type': 'status', 'message': '데이터셋 준비 중...', 'progress': 0})}\n\n"
 
-            # 데이터셋 준비
-            result = prepare_dataset(COMPARISON_DATA_FILE)
+            # 데이터셋 준비 (시퀀스 모델은 프레임 윈도우)
+            model_class = MODEL_CLASSES[model_key]
+            result = prepare_training_dataset(model_class)
             if result[0] is None:
                 yield f"data: {json.dumps({'type': 'error', 'message': 'No data available'})}\n\n"
                 return
 
             X_train, X_val, y_train, y_val, num_classes, label_encoder = result
+            dataset_hash = compute_dataset_hash(X_train, X_val, y_train, y_val)
+
+            # 증류 모드: 교사 soft target 을 정답과 함께 학습 타깃으로 사용
+            distillation, fit_y_train, fit_y_val = None, y_train, y_val
+            if distill:
+                yield f"data: {json.dumps({'type': 'status', 'message': '교사 모델 soft target 계산 중...', 'progress': 3})}\n\n"
+                try:
+                    distillation, fit_y_train, fit_y_val = prepare_distillation(
+                        distill, model_class, X_train, X_val, y_train, y_val, label_encoder, dataset_hash
+                    )
+                except ValueError as e:
+                    yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+                    return
 
             yield f"data: {json.dumps({'type': 'status', 'message': '모델 생성 중...', 'progress': 5})}\n\n"
 
             # 모델 생성
-            model_class = MODEL_CLASSES[model_key]
-            model_instance = model_class(num_classes=num_classes)
+            steps_per_execution = get_steps_per_execution(len(X_train), batch_size) if optimized else 1
+
+            # 가지치기 모드: 학습 중 Dense/Conv1D 커널 희소도를 목표까지 점진적으로 증가
+            pruning_callback = None
+            if prune:
+                try:
+                    pruning_callback = create_pruning_callback(prune, len(X_train), batch_size, epochs, steps_per_execution)
+                except ValueError as e:
+                    yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+                    return
+
+            model_instance = model_class(num_classes=num_classes, **scaling)
             model_instance.build_model()
-            model_instance.compile_model(learning_rate=learning_rate)
+            model_instance.compile_model(
+                learning_rate=learning_rate,
+                optimized=optimized,
+                steps_per_execution=steps_per_execution
+            )
             model = model_instance.get_model()
+            if distillation is not None:
+                compile_for_distillation(
+                    model, num_classes, learning_rate, distillation['temperature'], distillation['alpha'],
+                    **({'jit_compile': True, 'steps_per_execution': steps_per_execution} if optimized else {})
+                )
 
             yield f"data: {json.dumps({'type': 'status', 'message': '학습 시작!', 'progress': 10})}\n\n"
 
@@ -467,11 +1138,13 @@ def train_model_stream():
                 nonlocal training_error
                 try:
                     model.fit(
-                        X_train, y_train,
-                        validation_data=(X_val, y_val),
+                        X_train, fit_y_train,
+                        validation_data=(X_val, fit_y_val),
                         epochs=epochs,
                         batch_size=batch_size,
-                        callbacks=[streaming_callback, resource_monitor],
+                        callbacks=[streaming_callback, resource_monitor] + (
+                            [pruning_callback] if pruning_callback is not None else []
+                        ),
                         verbose=0
                     )
                 except Exception as e:
@@ -526,17 +1199,36 @@ def train_model_stream():
             # 모델 저장
             model_filename = f"{model_key}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             model_path = os.path.join(MODELS_DIR, f"{model_filename}.h5")
+            if distillation is not None:
+                # 증류 손실 대신 기본 손실로 저장 (로드 시 커스텀 손실 불필요)
+                model_instance.compile_model(learning_rate=learning_rate, optimized=optimized, steps_per_execution=steps_per_execution)
             model.save(model_path)
+            manifest = write_model_manifest(
+                model_filename, model_key, model_instance.name, label_encoder,
+                dataset_hash, len(X_train) + len(X_val)
+            )
+            write_fast_artifact(
+                model_filename, model_key, {'num_classes': num_classes, 'input_shape': list(INPUT_SHAPE), **scaling}, model
+            )
+
+            # 가지치기 모델: 희소 가중치 파일로 내보냄 (모델 크기는 다른 모델과 같이 .h5 기준, 희소 크기는 pruning 항목)
+            pruning = None
+            if pruning_callback is not None:
+                yield f"data: {json.dumps({'type': 'status', 'message': '희소 가중치 내보내는 중...', 'progress': 94})}\n\n"
+                pruning = export_pruned_model(model, model_filename, pruning_callback)
 
             yield f"data: {json.dumps({'type': 'status', 'message': '리소스 측정 중...', 'progress': 95})}\n\n"
 
             # 상세 리소스 측정
             sample_data = X_val[0:1]  # 단일 샘플
+            # 두 모드 모두 같은 tf.function 경로로 측정 (최적화 모드만 XLA jit_compile)
+            inference_fn = model_instance.get_inference_function(jit_compile=optimized)
             detailed_resources = measure_all_resources(
                 model,
                 model_path,
                 sample_data,
-                (21, 3)
+                tuple(model_instance.input_shape),
+                inference_fn=inference_fn
             )
 
             yield f"data: {json.dumps({'type': 'status', 'message': '결과 저장 중...', 'progress': 98})}\n\n"
@@ -560,10 +1252,14 @@ def train_model_stream():
                 'epochs': epochs,
                 'batch_size': batch_size,
                 'learning_rate': learning_rate,
+                'execution_mode': get_execution_mode(optimized),
+                'steps_per_execution': steps_per_execution,
                 'num_samples': len(X_train) + len(X_val),
                 'num_classes': num_classes,
                 'timestamp': datetime.now().isoformat(),
                 'model_file': model_filename,
+                'dataset_hash': manifest['dataset_hash'],
+                **scaling,
                 # 추가 리소스 정보
                 'flops': detailed_resources['flops'],
                 'model_size_mb': detailed_resources['model_size_mb'],
@@ -574,6 +1270,18 @@ def train_model_stream():
                 'gpu_memory_mb': detailed_resources['gpu_memory_mb']
             }
 
+            # 스트리밍 모델: 프레임당 스텝 비용 vs 윈도우 재계산 비용
+            if getattr(model_instance, 'streaming', False):
+                result_entry['streaming'] = measure_streaming_latency(model_instance, model, X_val)
+
+            # 증류 모델: 교사 계보 (교사 정확도/지연 시간과 비교)
+            if distillation is not None:
+                result_entry['distillation'] = distillation
+
+            # 가지치기 모델: 실제 희소도와 희소 가중치 파일 크기
+            if pruning is not None:
+                result_entry['pruning'] = pruning
+
             results.append(result_entry)
             save_json_file(LEADERBOARD_FILE, {'results': results})
 
@@ -589,6 +1297,182 @@ def train_model_stream():
     return Response(stream_with_context(generate()), mimetype='text/event-stream')
 
 
+@app.route('/api/train/sweep', methods=['POST'])
+def train_scaling_sweep():
+    """폭/깊이 스케일링 스윕 - 배율 조합마다 변형을 학습하고 p95 지연 시간 예산 안에서 가장 정확한 변형 선택
+
+    요청: {model, width_multipliers, depth_multipliers, latency_budget_ms, epochs, batch_size, learning_rate}
+    응답: text/event-stream - 변형마다 {type: 'variant', result}, 마지막에 {type: 'complete', selected, variants}
+    """
+
+    def generate():
+        try:
+            params = request.json
+            model_key = params.get('model', 'baseline')
+            epochs = params.get('epochs', 20)
+            batch_size = params.get('batch_size', 32)
+            learning_rate = params.get('learning_rate', 0.001)
+            latency_budget_ms = params.get('latency_budget_ms')
+
+            if model_key not in MODEL_CLASSES:
+                yield f"data: {json.dumps({'type': 'error', 'message': 'Invalid model'})}\n\n"
+                return
+
+            try:
+                variants = [
+                    get_scaling_args({'width_multiplier': width, 'depth_multiplier': depth})
+                    for depth in params.get('depth_multipliers') or SWEEP_DEFAULT_DEPTH_MULTIPLIERS
+                    for width in params.get('width_multipliers') or SWEEP_DEFAULT_WIDTH_MULTIPLIERS
+                ]
+                latency_budget_ms = float(latency_budget_ms) if latency_budget_ms is not None else None
+            except (TypeError, ValueError) as e:
+                yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+                return
+            if len(variants) > SWEEP_MAX_VARIANTS:
+                yield f"data: {json.dumps({'type': 'error', 'message': f'Too many variants (max {SWEEP_MAX_VARIANTS})'})}\n\n"
+                return
+
+            # 데이터셋은 한 번만 준비 (모든 변형이 같은 분할로 학습/평가)
+            model_class = MODEL_CLASSES[model_key]
+            result = prepare_training_dataset(model_class)
+            if result[0] is None:
+                yield f"data: {json.dumps({'type': 'error', 'message': 'No data available'})}\n\n"
+                return
+
+            X_train, X_val, y_train, y_val, num_classes, label_encoder = result
+            dataset_hash = compute_dataset_hash(X_train, X_val, y_train, y_val)
+            streaming = getattr(model_class, 'streaming', False)
+            # 실시간 추론과 같은 단위로 측정 (스트리밍 모델은 프레임당 한 스텝)
+            sample = X_val[0:1, -1] if streaming else X_val[0:1]
+            sweep_id = f"{model_key}_sweep_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+            sweep_results = []
+            for i, scaling in enumerate(variants):
+                model_instance = model_class(num_classes=num_classes, **scaling)
+                yield f"data: {json.dumps({'type': 'status', 'message': f'{model_instance.name} 학습 중... ({i + 1}/{len(variants)})', 'progress': int(i / len(variants) * 100)})}\n\n"
+
+                model_instance.build_model()
+                model_instance.compile_model(learning_rate=learning_rate)
+                model = model_instance.get_model()
+
+                start_time = time.time()
+                history = model.fit(
+                    X_train, y_train,
+                    validation_data=(X_val, y_val),
+                    epochs=epochs,
+                    batch_size=batch_size,
+                    verbose=0
+                )
+                total_train_time = time.time() - start_time
+
+                # 모델 저장 (변형마다 별도 파일, 같은 초에 저장되어도 구분되도록 변형 번호 포함)
+                model_filename = f"{model_key}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_v{i}"
+                model.save(os.path.join(MODELS_DIR, f"{model_filename}.h5"))
+                write_model_manifest(
+                    model_filename, model_key, model_instance.name, label_encoder,
+                    dataset_hash, len(X_train) + len(X_val)
+                )
+                write_fast_artifact(
+                    model_filename, model_key, {'num_classes': num_classes, 'input_shape': list(INPUT_SHAPE), **scaling},
+                    model
+                )
+
+                if streaming:
+                    engine = StreamingInferenceEngine(
+                        model, model_instance.build_streaming_model(model), model_instance.frame_shape,
+                        window_length=model_instance.sequence_length
+                    )
+                else:
+                    engine = KerasInferenceEngine(model, INPUT_SHAPE)
+                latency = measure_latency_percentiles(engine, sample)
+
+                result_entry = {
+                    'model_key': model_key,
+                    'model_name': model_instance.name,
+                    'train_accuracy': float(history.history['accuracy'][-1]),
+                    'val_accuracy': float(history.history['val_accuracy'][-1]),
+                    'train_time': total_train_time,
+                    'avg_epoch_time': total_train_time / epochs,
+                    'inference_time_ms': latency['mean_ms'],
+                    'inference_p95_ms': latency['p95_ms'],
+                    'num_parameters': int(model_instance.count_parameters()),
+                    'epochs': epochs,
+                    'batch_size': batch_size,
+                    'learning_rate': learning_rate,
+                    'execution_mode': get_execution_mode(False),
+                    'steps_per_execution': 1,
+                    'num_samples': len(X_train) + len(X_val),
+                    'num_classes': num_classes,
+                    'timestamp': datetime.now().isoformat(),
+                    'model_file': model_filename,
+                    'dataset_hash': dataset_hash,
+                    **scaling,
+                    'sweep': {
+                        'sweep_id': sweep_id,
+                        'latency_budget_ms': latency_budget_ms,
+                        'latency': latency,
+                        'meets_budget': latency_budget_ms is None or latency['p95_ms'] <= latency_budget_ms,
+                        'selected': False
+                    }
+                }
+
+                leaderboard = load_json_file(LEADERBOARD_FILE, {'results': []})
+                results = leaderboard.get('results', [])
+                results.append(result_entry)
+                save_json_file(LEADERBOARD_FILE, {'results': results})
+
+                sweep_results.append(result_entry)
+                yield f"data: {json.dumps({'type': 'variant', 'index': i, 'result': result_entry})}\n\n"
+
+            # 예산을 만족하는 변형 중 정확도 최고 (동률이면 p95 지연 시간이 짧은 변형)
+            candidates = [entry for entry in sweep_results if entry['sweep']['meets_budget']]
+            selected = max(
+                candidates, key=lambda entry: (entry['val_accuracy'], -entry['inference_p95_ms']), default=None
+            )
+
+            if selected is not None:
+                selected['sweep']['selected'] = True
+                leaderboard = load_json_file(LEADERBOARD_FILE, {'results': []})
+                results = leaderboard.get('results', [])
+                for entry in results:
+                    if entry.get('model_file') == selected['model_file']:
+                        entry['sweep']['selected'] = True
+                save_json_file(LEADERBOARD_FILE, {'results': results})
+
+            summary = {
+                'type': 'complete',
+                'message': '스윕 완료!' if selected is not None else '지연 시간 예산을 만족하는 변형이 없습니다',
+                'progress': 100,
+                'sweep_id': sweep_id,
+                'latency_budget_ms': latency_budget_ms,
+                'selected': selected,
+                # 예산을 만족하는 변형이 없을 때 참고용 (예산 조정 기준)
+                'fastest': min(sweep_results, key=lambda entry: entry['inference_p95_ms'])['model_file'],
+                'variants': [
+                    {
+                        'model_file': entry['model_file'],
+                        'model_name': entry['model_name'],
+                        'width_multiplier': entry['width_multiplier'],
+                        'depth_multiplier': entry['depth_multiplier'],
+                        'num_parameters': entry['num_parameters'],
+                        'val_accuracy': entry['val_accuracy'],
+                        'inference_p95_ms': entry['inference_p95_ms'],
+                        'meets_budget': entry['sweep']['meets_budget']
+                    }
+                    for entry in sweep_results
+                ]
+            }
+            yield f"data: {json.dumps(summary)}\n\n"
+
+        except Exception as e:
+            import traceback
+            error_msg = f"{str(e)}\n{traceback.format_exc()}"
+            print(error_msg)
+            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+
+    return Response(stream_with_context(generate()), mimetype='text/event-stream')
+
+
 @app.route('/api/leaderboard', methods=['GET'])
 def get_leaderboard():
     """리더보드 조회 API"""
@@ -643,11 +1527,14 @@ def delete_leaderboard_entry(index):
             deleted = results.pop(index)
             save_json_file(LEADERBOARD_FILE, {'results': results})
 
-            # 모델 파일 삭제
+            # 모델 파일 및 내보낸 아티팩트 삭제 ({model_file}.h5, {model_file}.*.npz, {model_file}.savedmodel/ 등)
             if 'model_file' in deleted:
-                model_path = os.path.join(MODELS_DIR, f"{deleted['model_file']}.h5")
-                if os.path.exists(model_path):
-                    os.remove(model_path)
+                LIVE_MODEL_CACHE.discard_prefix(f"{deleted['model_file']}|")
+                for artifact_path in glob.glob(os.path.join(MODELS_DIR, f"{glob.escape(deleted['model_file'])}.*")):
+                    if os.path.isdir(artifact_path):
+                        shutil.rmtree(artifact_path)
+                    else:
+                        os.remove(artifact_path)
 
             return jsonify({'success': True})
         else:
@@ -678,7 +1565,12 @@ def get_available_models_for_live():
                     'name': result['model_name'],
                     'model_file': model_file,
                     'val_accuracy': result['val_accuracy'],
-                    'num_classes': result['num_classes']
+                    'num_classes': result['num_classes'],
+                    'folded_available': os.path.exists(get_folded_model_path(model_file)),
+                    'tflite_available': [
+                        mode for mode in TFLITE_QUANTIZATION_MODES
+                        if os.path.exists(get_tflite_model_path(model_file, mode))
+                    ]
                 })
 
         return jsonify({
@@ -690,152 +1582,1603 @@ def get_available_models_for_live():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
-def get_custom_objects():
-    """커스텀 객체 딕셔너리 반환 (EfficientNet 등의 커스텀 레이어 지원)"""
-    import tensorflow as tf
-
-    # Swish activation 함수
-    @tf.function
-    def swish(x):
-        return x * tf.nn.sigmoid(x)
-
-    return {
-        'swish': swish,
-        'Swish': swish,
-    }
-
+@app.route('/api/models/export', methods=['POST'])
+def export_model():
+    """학습된 모델을 추론 최적화 형식으로 내보내기
 
-@app.route('/api/live/load', methods=['POST'])
-def load_models_for_live():
-    """실시간 추론을 위해 모델들을 메모리에 로드"""
+    format=numpy: BatchNorm을 Dense에 접고 Dropout을 제거한 NumPy 가중치 팩 (Dense 구조 모델 전용)
+    format=folded: BatchNorm을 Conv1D/DepthwiseConv1D/Dense에 접고 Dropout을 제거한 Keras 모델
+    format=tflite: TFLite 변환 + 양자화 (quantization=dynamic|float16|int8)
+    format=keras: Keras 네이티브 형식(.keras) 모델
+    format=savedmodel: TensorFlow SavedModel (TF Serving 등 외부 서빙용, serve 시그니처)
+    format=fast: 빠른 로드 아티팩트 (학습 전에 저장된 모델용, 이후 실시간 keras 로드에 사용)
+    """
     try:
         data = request.json
-        model_files = data.get('model_files', [])
+        model_file = data.get('model_file')
+        export_format = data.get('format', 'numpy')
+        quantization = data.get('quantization')
+
+        model_path = os.path.join(MODELS_DIR, f"{model_file}.h5")
+        if not model_file or not os.path.exists(model_path):
+            return jsonify({'success': False, 'error': 'Model file not found'}), 404
+
+        valid_quantization = {
+            'numpy': (None, 'int8'),
+            'folded': (None,),
+            'tflite': TFLITE_QUANTIZATION_MODES,
+            'keras': (None,),
+            'savedmodel': (None,),
+            'fast': (None,)
+        }
+        if export_format not in valid_quantization:
+            return jsonify({'success': False, 'error': f'Invalid format: {export_format}'}), 400
+        if quantization not in valid_quantization[export_format]:
+            return jsonify({'success': False, 'error': f'Invalid quantization: {quantization}'}), 400
+
+        manifest, _ = load_model_manifest(model_file)
+        if export_format == 'fast':
+            return export_fast_artifact(model_file, model_path, manifest)
+
+        # 스트리밍 시퀀스 모델은 상태 기반 스텝 엔진(keras 백엔드)으로만 서빙
+        if manifest is not None and is_streaming_model_key(manifest.get('model_key')):
+            return jsonify({'success': False, 'error': 'Streaming models are served from the original Keras model only'}), 400
+
+        if export_format == 'folded':
+            return export_folded_model(model_file, model_path)
+        if export_format == 'tflite':
+            return export_tflite_model(model_file, model_path, quantization)
+        if export_format in ('keras', 'savedmodel'):
+            return export_native_model(model_file, model_path, export_format)
+
+        from utils.numpy_backend import (
+            export_dense_weight_pack, quantize_weight_pack_int8, save_weight_pack, validate_weight_pack
+        )
 
-        # 기존 모델 언로드
-        global LOADED_MODELS
-        LOADED_MODELS.clear()
+        model = keras.models.load_model(model_path, custom_objects=get_custom_objects())
 
-        # 데이터셋에서 레이블 정보 가져오기
-        dataset_data = load_json_file(COMPARISON_DATA_FILE, {'dataset': []})
-        dataset = dataset_data.get('dataset', [])
+        # BatchNorm 접기 + Dropout 제거 (+ 선택적 int8 양자화)
+        try:
+            pack = export_dense_weight_pack(model)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        if quantization == 'int8':
+            pack = quantize_weight_pack_int8(pack)
+
+        # Keras 모델 대비 검증 후 저장 (int8은 양자화 오차 허용, 불일치하면 실시간 로드되지 않도록 저장하지 않음)
+        validation_inputs = get_validation_inputs()
+        if quantization == 'int8':
+            validation = validate_weight_pack(
+                NumpyInferenceEngine(pack), model, validation_inputs, atol=5e-2, min_top1_agreement=0.99
+            )
+        else:
+            validation = validate_weight_pack(NumpyInferenceEngine(pack), model, validation_inputs)
+        if not validation['passed']:
+            return jsonify({'success': False, 'error': 'Weight pack output mismatch', 'validation': validation}), 500
 
-        if len(dataset) == 0:
-            return jsonify({'success': False, 'error': 'No dataset available'}), 400
+        export_path = get_weight_pack_path(model_file, quantization)
+        save_weight_pack(pack, export_path)
+        # 같은 아티팩트를 다시 내보낸 경우 캐시된 이전 엔진을 재사용하지 않도록 해제
+        LIVE_MODEL_CACHE.discard_prefix(f"{model_file}|")
+        engine = NumpyInferenceEngine.from_file(export_path)
 
-        # Label encoder 준비
-        labels_list = [item['label'] for item in dataset]
-        label_encoder = LabelEncoder()
-        label_encoder.fit(labels_list)
-        classes = label_encoder.classes_.tolist()
+        # 단일 프레임 지연 시간 비교
+        sample = validation_inputs[:1]
+        keras_inference_ms = measure_engine_latency(KerasInferenceEngine(model, INPUT_SHAPE), sample)
+        export_inference_ms = measure_engine_latency(engine, sample)
 
-        # 커스텀 객체 준비
-        custom_objects = get_custom_objects()
+        return jsonify({
+            'success': True,
+            'model_file': model_file,
+            'format': export_format,
+            'quantization': quantization,
+            'export_file': os.path.basename(export_path),
+            'original_size_mb': os.path.getsize(model_path) / (1024 * 1024),
+            'export_size_mb': os.path.getsize(export_path) / (1024 * 1024),
+            'validation': validation,
+            'keras_inference_ms': keras_inference_ms,
+            'export_inference_ms': export_inference_ms
+        })
 
-        # 모델 로드
-        loaded_info = []
-        for model_file in model_files:
-            try:
-                model_path = os.path.join(MODELS_DIR, f"{model_file}.h5")
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return jsonify({'success': False, 'error': str(e)}), 500
 
-                if not os.path.exists(model_path):
-                    loaded_info.append({
+
+def export_folded_model(model_file, model_path):
+    """BatchNorm 접기 + Dropout 제거 모델 저장, 원본 대비 검증 및 지연 시간 비교"""
+    from utils.graph_optimizer import fold_batchnorm, validate_folded_model
+
+    model = keras.models.load_model(model_path, custom_objects=get_custom_objects())
+    optimized_model, fold_report = fold_batchnorm(model)
+
+    validation_inputs = get_validation_inputs()
+    validation = validate_folded_model(optimized_model, model, validation_inputs)
+    if not validation['passed']:
+        return jsonify({'success': False, 'error': 'Folded model output mismatch', 'validation': validation}), 500
+
+    export_path = get_folded_model_path(model_file)
+    optimized_model.save(export_path)
+    LIVE_MODEL_CACHE.discard_prefix(f"{model_file}|")
+
+    # 저장된 모델을 다시 로드하여 실시간 추론과 같은 경로로 지연 시간 비교
+    optimized_model = keras.models.load_model(export_path, custom_objects=get_custom_objects())
+    sample = validation_inputs[:1]
+    keras_inference_ms = measure_engine_latency(KerasInferenceEngine(model, INPUT_SHAPE), sample)
+    export_inference_ms = measure_engine_latency(KerasInferenceEngine(optimized_model, INPUT_SHAPE), sample)
+
+    export_result = {
+        'export_file': os.path.basename(export_path),
+        'original_size_mb': os.path.getsize(model_path) / (1024 * 1024),
+        'export_size_mb': os.path.getsize(export_path) / (1024 * 1024),
+        'folding': fold_report,
+        'validation': validation,
+        'keras_inference_ms': keras_inference_ms,
+        'export_inference_ms': export_inference_ms,
+        'latency_gain_ms': keras_inference_ms - export_inference_ms,
+        'speedup': keras_inference_ms / export_inference_ms if export_inference_ms > 0 else None
+    }
+    record_export_result(model_file, 'folded', export_result)
+
+    return jsonify({
+        'success': True,
+        'model_file': model_file,
+        'format': 'folded',
+        'quantization': None,
+        **export_result
+    })
+
+
+def export_tflite_model(model_file, model_path, quantization):
+    """TFLite 양자화 모델 저장, 원본 대비 크기/정확도 하락/지연 시간 기록"""
+    from utils.tflite_backend import convert_to_tflite, evaluate_accuracy
+
+    model = keras.models.load_model(model_path, custom_objects=get_custom_objects())
+
+    # 학습 분할을 대표 데이터셋으로, 검증 분할을 정확도 평가에 사용
+    result = prepare_dataset(COMPARISON_DATA_FILE)
+    X_train, X_val, y_train, y_val, num_classes = result[:5]
+    if quantization == 'int8' and X_train is None:
+        return jsonify({'success': False, 'error': 'No dataset available for int8 calibration'}), 400
+
+    tflite_model = convert_to_tflite(model, quantization, representative_data=X_train)
+    export_path = get_tflite_model_path(model_file, quantization)
+    with open(export_path, 'wb') as f:
+        f.write(tflite_model)
+    LIVE_MODEL_CACHE.discard_prefix(f"{model_file}|")
+
+    engine = TFLiteInferenceEngine(export_path)
+
+    # 현재 데이터셋의 클래스 수가 모델 출력과 같을 때만 정확도 비교
+    original_accuracy = export_accuracy = accuracy_drop = None
+    if X_val is not None and num_classes == model.output_shape[-1]:
+        keras_engine = KerasInferenceEngine(model, INPUT_SHAPE)
+        original_accuracy = evaluate_accuracy(lambda x: keras_engine.predict(x)[0], X_val, y_val)
+        export_accuracy = evaluate_accuracy(lambda x: engine.predict(x)[0], X_val, y_val)
+        accuracy_drop = original_accuracy - export_accuracy
+
+    sample = get_validation_inputs()[:1]
+    keras_inference_ms = measure_engine_latency(KerasInferenceEngine(model, INPUT_SHAPE), sample)
+    export_inference_ms = measure_engine_latency(engine, sample)
+
+    export_result = {
+        'export_file': os.path.basename(export_path),
+        'quantization': quantization,
+        'original_size_mb': os.path.getsize(model_path) / (1024 * 1024),
+        'export_size_mb': os.path.getsize(export_path) / (1024 * 1024),
+        'original_accuracy': original_accuracy,
+        'export_accuracy': export_accuracy,
+        'accuracy_drop': accuracy_drop,
+        'keras_inference_ms': keras_inference_ms,
+        'export_inference_ms': export_inference_ms
+    }
+    record_export_result(model_file, f'tflite_{quantization}', export_result)
+
+    return jsonify({
+        'success': True,
+        'model_file': model_file,
+        'format': 'tflite',
+        **export_result
+    })
+
+
+def export_native_model(model_file, model_path, export_format):
+    """.keras / SavedModel 저장, .h5 대비 로드 시간과 지연 시간 비교"""
+    from utils.graph_optimizer import validate_folded_model
+
+    if has_lambda_layers(model_path):
+        return jsonify({
+            'success': False,
+            'error': 'Checkpoint uses Lambda layers; convert it first via /api/models/convert'
+        }), 400
+
+    model, original_load_ms = measure_load_time(
+        lambda: keras.models.load_model(model_path, custom_objects=get_custom_objects())
+    )
+    validation_inputs = get_validation_inputs()
+    sample = validation_inputs[:1]
+
+    if export_format == 'keras':
+        export_path = get_keras_archive_path(model_file)
+        model.save(export_path)
+        exported, export_load_ms = measure_load_time(lambda: keras.models.load_model(export_path))
+        validation = validate_folded_model(exported, model, validation_inputs)
+        export_inference_ms = measure_engine_latency(KerasInferenceEngine(exported, INPUT_SHAPE), sample)
+        export_size = os.path.getsize(export_path)
+    else:
+        export_path = get_saved_model_path(model_file)
+        if os.path.isdir(export_path):
+            shutil.rmtree(export_path)
+        model.export(export_path)
+        exported, export_load_ms = measure_load_time(lambda: tf.saved_model.load(export_path))
+        # SavedModel 은 Keras 모델이 아니므로 serve 시그니처 출력으로 검증
+        expected = np.asarray(model(validation_inputs, training=False))
+        actual = np.asarray(exported.serve(tf.constant(validation_inputs)))
+        max_abs_diff = float(np.max(np.abs(expected - actual)))
+        validation = {
+            'num_samples': int(len(validation_inputs)),
+            'max_abs_diff': max_abs_diff,
+            'top1_agreement': float(np.mean(np.argmax(expected, axis=1) == np.argmax(actual, axis=1))),
+            'passed': max_abs_diff <= 1e-4
+        }
+        export_inference_ms = None
+        export_size = sum(
+            os.path.getsize(os.path.join(root, name))
+            for root, _, names in os.walk(export_path) for name in names
+        )
+
+    export_result = {
+        'export_file': os.path.basename(export_path),
+        'original_size_mb': os.path.getsize(model_path) / (1024 * 1024),
+        'export_size_mb': export_size / (1024 * 1024),
+        'validation': validation,
+        'original_load_ms': original_load_ms,
+        'export_load_ms': export_load_ms,
+        'keras_inference_ms': measure_engine_latency(KerasInferenceEngine(model, INPUT_SHAPE), sample),
+        'export_inference_ms': export_inference_ms
+    }
+    record_export_result(model_file, export_format, export_result)
+
+    return jsonify({
+        'success': True,
+        'model_file': model_file,
+        'format': export_format,
+        'quantization': None,
+        **export_result
+    })
+
+
+def export_fast_artifact(model_file, model_path, manifest):
+    """기존 .h5 모델 -> 빠른 로드 아티팩트, 원본 대비 출력 검증 및 로드 시간 비교"""
+    from utils.graph_optimizer import validate_folded_model
+
+    if manifest is None:
+        return jsonify({'success': False, 'error': 'Model manifest required (backfill via /api/models/manifest)'}), 400
+    if has_lambda_layers(model_path):
+        return jsonify({
+            'success': False,
+            'error': 'Checkpoint uses Lambda layers; convert it first via /api/models/convert'
+        }), 400
+
+    # 생성자 인자: 매니페스트의 클래스 수 + 리더보드 항목의 폭/깊이 배율
+    leaderboard = load_json_file(LEADERBOARD_FILE, {'results': []})
+    entry = next((r for r in leaderboard.get('results', []) if r.get('model_file') == model_file), {})
+    constructor_args = {
+        'num_classes': manifest['num_classes'],
+        'input_shape': list(INPUT_SHAPE),
+        **get_scaling_args(entry)
+    }
+
+    model, original_load_ms = measure_load_time(
+        lambda: keras.models.load_model(model_path, custom_objects=get_custom_objects())
+    )
+    # 스트리밍 시퀀스 모델은 길이 1 시퀀스로 비교
+    validation_inputs = get_validation_inputs()
+    if is_streaming_model_key(manifest['model_key']):
+        validation_inputs = validation_inputs[:, None]
+
+    # 임시 경로의 아티팩트로 로드/검증하고, 통과한 경우에만 제자리로 교체
+    load_times = {}
+
+    def validate_staged(staged_header_path):
+        fast_model, load_times['export'] = measure_load_time(lambda: load_fast_model(staged_header_path))
+        return validate_folded_model(fast_model, model, validation_inputs)
+
+    header, validation = write_fast_artifact(
+        model_file, manifest['model_key'], constructor_args, model, validate=validate_staged
+    )
+    if not validation['passed']:
+        return jsonify({'success': False, 'error': 'Fast artifact output mismatch', 'validation': validation}), 500
+    LIVE_MODEL_CACHE.discard_prefix(f"{model_file}|")
+    export_path = get_fast_artifact_path(model_file)
+    export_load_ms = load_times['export']
+
+    export_result = {
+        'export_file': os.path.basename(export_path),
+        'weights_file': header['weights_file'],
+        'constructor_args': constructor_args,
+        'original_size_mb': os.path.getsize(model_path) / (1024 * 1024),
+        'export_size_mb': header['weights_bytes'] / (1024 * 1024),
+        'validation': validation,
+        'original_load_ms': original_load_ms,
+        'export_load_ms': export_load_ms,
+        'load_speedup': original_load_ms / export_load_ms if export_load_ms > 0 else None
+    }
+    record_export_result(model_file, 'fast', export_result)
+
+    return jsonify({
+        'success': True,
+        'model_file': model_file,
+        'format': 'fast',
+        'quantization': None,
+        **export_result
+    })
+
+
+def has_lambda_layers(model_path):
+    """.h5 체크포인트 구조에 Lambda 레이어가 있는지 (모델을 역직렬화하지 않고 저장된 설정만 확인)"""
+    import h5py
+
+    with h5py.File(model_path, 'r') as f:
+        model_config = f.attrs.get('model_config')
+    if model_config is None:
+        return False
+    if isinstance(model_config, bytes):
+        model_config = model_config.decode('utf-8')
+    layer_configs = json.loads(model_config).get('config', {}).get('layers', [])
+    return any(layer.get('class_name') == 'Lambda' for layer in layer_configs)
+
+
+def load_legacy_model(model_path):
+    """Lambda 레이어가 있는 기존 .h5 모델 로드
+
+    Keras 3 는 Lambda 의 파이썬 코드를 역직렬화하려면 safe_mode=False 가 필요하므로
+    이 서버에서 학습한(신뢰할 수 있는) 체크포인트를 변환할 때만 사용합니다.
+    """
+    return keras.models.load_model(model_path, custom_objects=get_custom_objects(), safe_mode=False)
+
+
+@app.route('/api/models/convert', methods=['POST'])
+def convert_legacy_model():
+    """Lambda swish 로 저장된 기존 EfficientNet .h5 체크포인트를 native swish 모델로 변환
+
+    원본은 {model_file}.legacy.h5 로 보관하고 {model_file}.h5 를 native 모델로 교체하며,
+    변환 전후 로드 시간과 단일 프레임 지연 시간을 리더보드 exports.native_swish 에 기록합니다.
+    """
+    try:
+        from models.efficientnet import convert_legacy_checkpoint, build_legacy_reference
+        from utils.graph_optimizer import validate_folded_model
+
+        data = request.json
+        model_file = data.get('model_file')
+
+        model_path = os.path.join(MODELS_DIR, f"{model_file}.h5")
+        if not model_file or not os.path.exists(model_path):
+            return jsonify({'success': False, 'error': 'Model file not found'}), 404
+
+        leaderboard = load_json_file(LEADERBOARD_FILE, {'results': []})
+        entry = next((r for r in leaderboard.get('results', []) if r.get('model_file') == model_file), None)
+        if entry is None:
+            return jsonify({'success': False, 'error': 'Leaderboard entry not found'}), 404
+        if entry.get('model_key') != 'efficientnet':
+            return jsonify({'success': False, 'error': 'Only EfficientNet checkpoints use Lambda swish'}), 400
+        if not has_lambda_layers(model_path):
+            return jsonify({'success': False, 'error': 'Checkpoint already uses native swish'}), 400
+
+        # Keras 3 는 Lambda 출력 형태를 추론하지 못해 기존 체크포인트를 아예 로드하지 못할 수 있음
+        legacy_load_error = None
+        try:
+            legacy_model, legacy_load_ms = measure_load_time(lambda: load_legacy_model(model_path))
+        except Exception as e:
+            legacy_model, legacy_load_ms = None, None
+            legacy_load_error = str(e).strip().splitlines()[0]
+
+        # 같은 구조를 native swish 로 다시 만들고 가중치만 로드 (학습 시 배율 그대로)
+        converted = convert_legacy_checkpoint(
+            model_path, num_classes=entry['num_classes'], input_shape=INPUT_SHAPE, **get_scaling_args(entry)
+        )
+
+        # 출력 비교 기준: 로드한 기존 모델, 로드할 수 없으면 Lambda swish 그래프를 코드로 다시 만들어 같은 가중치 로드
+        reference_model = legacy_model
+        if reference_model is None:
+            reference_model = build_legacy_reference(
+                model_path, num_classes=entry['num_classes'], input_shape=INPUT_SHAPE, **get_scaling_args(entry)
+            )
+        validation_inputs = get_validation_inputs()
+        validation = validate_folded_model(converted.model, reference_model, validation_inputs)
+        validation['reference'] = 'checkpoint' if legacy_model is not None else 'rebuilt_lambda_graph'
+        if not validation['passed']:
+            return jsonify({'success': False, 'error': 'Converted model output mismatch', 'validation': validation}), 500
+
+        legacy_path = get_legacy_model_path(model_file)
+        os.replace(model_path, legacy_path)
+        converted.model.save(model_path)
+        LIVE_MODEL_CACHE.discard_prefix(f"{model_file}|")
+
+        # 변환된 모델은 커스텀 객체 없이 로드됨
+        native_model, native_load_ms = measure_load_time(lambda: keras.models.load_model(model_path))
+        sample = validation_inputs[:1]
+        native_inference_ms = measure_engine_latency(KerasInferenceEngine(native_model, INPUT_SHAPE), sample)
+        legacy_inference_ms = measure_engine_latency(KerasInferenceEngine(reference_model, INPUT_SHAPE), sample)
+
+        export_result = {
+            'export_file': os.path.basename(model_path),
+            'legacy_file': os.path.basename(legacy_path),
+            'validation': validation,
+            'legacy_load_ms': legacy_load_ms,
+            'legacy_load_error': legacy_load_error,
+            'native_load_ms': native_load_ms,
+            'legacy_inference_ms': legacy_inference_ms,
+            'native_inference_ms': native_inference_ms,
+            'load_speedup': legacy_load_ms / native_load_ms if legacy_load_ms and native_load_ms > 0 else None,
+            'inference_speedup': (
+                legacy_inference_ms / native_inference_ms if legacy_inference_ms and native_inference_ms > 0 else None
+            )
+        }
+        record_export_result(model_file, 'native_swish', export_result)
+
+        return jsonify({
+            'success': True,
+            'model_file': model_file,
+            **export_result
+        })
+
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+def backfill_manifest_from_dataset(model_file):
+    """리더보드 항목 + 현재 데이터셋으로 매니페스트 생성 (backfilled=true)
+
+    리더보드 항목이 없으면 LookupError, 데이터셋이 없거나 클래스 수가 다르면 ValueError
+    """
+    leaderboard = load_json_file(LEADERBOARD_FILE, {'results': []})
+    entry = next((r for r in leaderboard.get('results', []) if r.get('model_file') == model_file), None)
+    if entry is None:
+        raise LookupError('Leaderboard entry not found')
+
+    result = prepare_dataset(COMPARISON_DATA_FILE)
+    if result[0] is None:
+        raise ValueError('No dataset available')
+    X_train, X_val, y_train, y_val, num_classes, label_encoder = result
+
+    # 학습 이후 클래스가 바뀌었다면 현재 데이터셋으로 복원할 수 없음
+    if num_classes != entry.get('num_classes'):
+        raise ValueError(f"Class count mismatch: dataset {num_classes} != model {entry.get('num_classes')}")
+
+    return write_model_manifest(
+        model_file, entry['model_key'], entry['model_name'], label_encoder,
+        compute_dataset_hash(X_train, X_val, y_train, y_val), len(X_train) + len(X_val),
+        backfilled=True
+    )
+
+
+@app.route('/api/models/manifest', methods=['POST'])
+def backfill_model_manifest():
+    """매니페스트 없이 학습된 기존 모델에 현재 데이터셋 기준 매니페스트 생성 (backfilled=true로 표시)"""
+    try:
+        data = request.json
+        model_file = data.get('model_file')
+
+        model_path = os.path.join(MODELS_DIR, f"{model_file}.h5")
+        if not model_file or not os.path.exists(model_path):
+            return jsonify({'success': False, 'error': 'Model file not found'}), 404
+        if os.path.exists(get_manifest_path(model_file)) and not data.get('overwrite', False):
+            return jsonify({'success': False, 'error': 'Manifest already exists'}), 400
+
+        try:
+            manifest = backfill_manifest_from_dataset(model_file)
+        except LookupError as e:
+            return jsonify({'success': False, 'error': str(e)}), 404
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+
+        return jsonify({'success': True, 'manifest': manifest})
+
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/models/manifest/<model_file>', methods=['GET'])
+def get_model_manifest(model_file):
+    """모델 매니페스트 조회 (바이너리/MessagePack 클라이언트는 클래스 목록을 한 번만 받아 인덱스를 해석)"""
+    manifest, error = load_model_manifest(model_file)
+    if manifest is None:
+        return jsonify({'success': False, 'error': error}), 404
+    return jsonify({'success': True, 'manifest': manifest})
+
+
+def get_custom_objects():
+    """커스텀 객체 딕셔너리 반환 (native swish 변환 전 EfficientNet 등 기존 체크포인트 호환)"""
+    import tensorflow as tf
+
+    # Swish activation 함수
+    @tf.function
+    def swish(x):
+        return x * tf.nn.sigmoid(x)
+
+    return {
+        'swish': swish,
+        'Swish': swish,
+    }
+
+
+def get_live_cache_key(model_file, backend, quantization=None, folded=False, use_tf_function=True):
+    """모델 캐시 키 (같은 model_file 이라도 백엔드/아티팩트별로 구분)"""
+    if backend == 'keras':
+        variant = 'folded' if folded else 'original'
+        variant += '' if use_tf_function else ':eager'
+    else:
+        variant = quantization or ('dynamic' if backend == 'tflite' else 'float32')
+    return f"{model_file}|{backend}|{variant}"
+
+
+def get_live_model_path(model_file, backend, quantization=None, use_folded=False):
+    """실시간 추론 백엔드별 모델 아티팩트 경로"""
+    if backend == 'numpy':
+        return get_weight_pack_path(model_file, quantization)
+    if backend == 'tflite':
+        return get_tflite_model_path(model_file, quantization or 'dynamic')
+    if use_folded:
+        return get_folded_model_path(model_file)
+    if os.path.exists(get_fast_artifact_path(model_file)):
+        # 빠른 로드 아티팩트 (모델 클래스로 그래프 생성 + memmap 가중치)
+        return get_fast_artifact_path(model_file)
+    return os.path.join(MODELS_DIR, f"{model_file}.h5")
+
+
+def get_model_key(model_file):
+    """모델 아키텍처 키 (매니페스트, 없으면 리더보드 항목)"""
+    manifest, _ = load_model_manifest(model_file)
+    if manifest is not None:
+        return manifest.get('model_key')
+    leaderboard = load_json_file(LEADERBOARD_FILE, {'results': []})
+    entry = next((r for r in leaderboard.get('results', []) if r.get('model_file') == model_file), None)
+    return entry.get('model_key') if entry is not None else None
+
+
+def load_live_engine(model_path, backend, use_tf_function=True, model_key=None):
+    """추론 엔진 로드 및 워밍업 (모델 캐시 loader)"""
+    fast_fallback_error = None
+    if backend == 'numpy':
+        # NumPy 가중치 팩 로드 (TensorFlow 불필요)
+        model = None
+        engine = NumpyInferenceEngine.from_file(model_path)
+    elif backend == 'tflite':
+        # TFLite 양자화 모델 (tflite_runtime이 있으면 TensorFlow 불필요)
+        model = None
+        engine = TFLiteInferenceEngine(model_path)
+    else:
+        # Keras 모델 로드 (빠른 로드 아티팩트 또는 .h5, 커스텀 객체 포함)
+        model = None
+        if model_path.endswith('.fast.json'):
+            try:
+                model = load_fast_model(model_path)
+            except Exception as e:
+                # 모델 클래스 변경 등으로 아티팩트를 쓸 수 없으면 .h5 로 로드
+                print(f"Fast artifact load failed, falling back to .h5: {model_path}: {e}")
+                fast_fallback_error = str(e)
+                model_path = model_path[:-len('.fast.json')] + '.h5'
+        if model is None:
+            model = keras.models.load_model(model_path, custom_objects=get_custom_objects())
+        if is_streaming_model_key(model_key):
+            # 스트리밍 시퀀스 모델: 학습된 레이어를 공유하는 스텝 모델 (상태는 세션별로 보관)
+            model_instance = MODEL_CLASSES[model_key](input_shape=INPUT_SHAPE)
+            engine = StreamingInferenceEngine(
+                model, model_instance.build_streaming_model(model), INPUT_SHAPE,
+                use_tf_function=use_tf_function, window_length=model_instance.sequence_length
+            )
+        else:
+            engine = KerasInferenceEngine(model, INPUT_SHAPE, use_tf_function=use_tf_function)
+
+    # 추론 엔진 워밍업 (트레이싱 비용을 로드 시점에 지불)
+    warmup_time_ms = engine.warm_up()
+
+    return {
+        'model': model,
+        'engine': engine,
+        'model_path': model_path,
+        'fast_fallback_error': fast_fallback_error,
+        'memory_mb': engine.memory_bytes() / (1024 * 1024),
+        'warmup_time_ms': warmup_time_ms
+    }
+
+
+def publish_live_model_set(models, fused_engine, fanout_config, cascade=None):
+    """새 모델 세트를 참조 교체 한 번으로 게시하고, 이전 세트의 배칭 워커는 유예 시간 후 종료"""
+    global LIVE_MODEL_SET
+    with _live_publish_lock:
+        previous = LIVE_MODEL_SET
+        LIVE_MODEL_SET = {
+            'version': previous['version'] + 1,
+            'models': models,
+            'fused_engine': fused_engine,
+            'fanout': fanout_config,
+            'cascade': cascade
+        }
+
+    # 진행 중인 추론이 이전 세트의 배처를 사용할 수 있으므로 타임아웃만큼 기다린 뒤 종료
+    retire_batchers(previous['models'], delay_s=LIVE_PREDICT_TIMEOUT_S)
+    return LIVE_MODEL_SET['version']
+
+
+def retire_batchers(models, delay_s=0.0):
+    """모델 세트의 배칭 워커 종료 (delay_s 후)"""
+    batchers = [model_data['batcher'] for model_data in models.values() if model_data.get('batcher') is not None]
+    if not batchers:
+        return
+
+    def stop_all():
+        for batcher in batchers:
+            batcher.stop()
+
+    if delay_s > 0:
+        timer = threading.Timer(delay_s, stop_all)
+        timer.daemon = True
+        timer.start()
+    else:
+        stop_all()
+
+
+def get_live_load_job_status(job):
+    """로드 작업 진행 상황 (응답용 사본)"""
+    status = dict(job)
+    status['loaded_models'] = list(job['loaded_models'])
+    status['elapsed_ms'] = ((job['finished_at'] or time.time()) - job['started_at']) * 1000
+    status['progress'] = job['completed'] / job['total'] if job['total'] else 1.0
+    return status
+
+
+def run_live_load_job(job, options):
+    """백그라운드 모델 로드 -> 모두 로드/워밍업되면 모델 세트 게시"""
+    model_files = options['model_files']
+    backend = options['backend']
+    quantization = options['quantization']
+    use_tf_function = options['use_tf_function']
+    use_folded = options['use_folded']
+    batching_config = options['batching']
+    cache_keys = options['cache_keys']
+
+    models = {}
+    try:
+        # 모델 로드 - 클래스 정보는 학습 시 저장한 매니페스트에서 읽고, 게시 전까지 실시간 추론은 기존 세트를 계속 사용
+        for model_file in model_files:
+            job['current_model'] = model_file
+            try:
+                model_path = get_live_model_path(model_file, backend, quantization, use_folded)
+
+                if not os.path.exists(model_path):
+                    job['loaded_models'].append({
                         'model_file': model_file,
                         'loaded': False,
                         'error': 'Model file not found'
                     })
                     continue
 
-                # Keras 모델 로드 (커스텀 객체 포함)
-                model = keras.models.load_model(model_path, custom_objects=custom_objects)
+                # 데이터셋은 학습 이후 바뀌었을 수 있으므로 읽지 않음 (매니페스트가 없으면 명시적 생성 필요)
+                manifest, manifest_error = load_model_manifest(model_file)
+                if manifest is None:
+                    job['loaded_models'].append({
+                        'model_file': model_file,
+                        'loaded': False,
+                        'error': manifest_error,
+                        'manifest_missing': not os.path.exists(get_manifest_path(model_file))
+                    })
+                    continue
 
-                LOADED_MODELS[model_file] = {
+                # 캐시에 있으면 재사용, 없으면 로드 + 워밍업
+                cache_entry, cache_hit = LIVE_MODEL_CACHE.get_or_load(
+                    cache_keys[model_file],
+                    lambda: load_live_engine(model_path, backend, use_tf_function, manifest.get('model_key')),
+                    pinned=cache_keys.values()
+                )
+                model = cache_entry['model']
+                engine = cache_entry['engine']
+
+                # 동시 요청을 하나의 배치로 묶는 스케줄러 (선택, 세션 상태를 쓰는 스트리밍 모델 제외)
+                streaming = getattr(engine, 'streaming', False)
+                batcher = None
+                if batching_config['enabled'] and not streaming:
+                    batcher = MicroBatcher(
+                        engine,
+                        window_ms=batching_config['window_ms'],
+                        max_batch_size=batching_config['max_batch_size'],
+                        name=f'micro-batcher-{model_file}'
+                    )
+
+                models[model_file] = {
                     'model': model,
-                    'classes': classes,
-                    'label_encoder': label_encoder
+                    'engine': engine,
+                    'batcher': batcher,
+                    # 타임아웃 후에도 실행 중인 팬아웃 작업 (끝날 때까지 이 모델은 건너뜀)
+                    'stale_future': None,
+                    'streaming': streaming,
+                    'classes': manifest['classes'],
+                    'manifest': manifest
                 }
 
-                loaded_info.append({
+                job['loaded_models'].append({
                     'model_file': model_file,
-                    'loaded': True
+                    'loaded': True,
+                    'folded': use_folded,
+                    'fast_artifact': cache_entry['model_path'].endswith('.fast.json'),
+                    'fast_fallback_error': cache_entry['fast_fallback_error'],
+                    'num_classes': manifest['num_classes'],
+                    'dataset_hash': manifest['dataset_hash'],
+                    'engine': engine.describe(),
+                    'cache_hit': cache_hit,
+                    'memory_mb': cache_entry['memory_mb'],
+                    'load_time_ms': cache_entry['load_time_ms']
                 })
 
             except Exception as e:
                 import traceback
                 error_msg = f"{str(e)}\n{traceback.format_exc()}"
                 print(f"Error loading {model_file}: {error_msg}")
-                loaded_info.append({
+                job['loaded_models'].append({
                     'model_file': model_file,
                     'loaded': False,
                     'error': str(e)
                 })
+            finally:
+                job['completed'] += 1
+
+        job['current_model'] = None
+
+        # 모든 모델을 하나의 그래프로 결합 (선택, 스트리밍 모델은 세션 상태가 필요하므로 제외)
+        fused_engine = None
+        if options['use_fused'] and any(model_data['streaming'] for model_data in models.values()):
+            job['fused'] = {'skipped': 'Streaming models cannot be fused'}
+        elif options['use_fused'] and len(models) > 0:
+            job['current_model'] = 'fused'
+            fused_engine = FusedInferenceEngine(
+                {model_file: model_data['model'] for model_file, model_data in models.items()},
+                INPUT_SHAPE
+            )
+            fused_engine.warm_up()
+            job['fused'] = fused_engine.describe()
+            job['current_model'] = None
+
+        # 캐스케이드 순서 (로드된 모델만, 스트리밍 모델은 로드 요청에서 거부)
+        cascade = None
+        if options['cascade'] is not None:
+            chain = [model_file for model_file in options['cascade']['chain'] if model_file in models]
+            job['cascade'] = {'chain': chain, 'excluded': [m for m in options['cascade']['chain'] if m not in chain]}
+            if len(chain) >= 2:
+                cascade = {
+                    'chain': chain,
+                    # 마지막 단계는 항상 응답 (임계값 없음)
+                    'thresholds': {model_file: options['cascade']['thresholds'][model_file] for model_file in chain[:-1]},
+                    'stats': CascadeStats(chain)
+                }
+            else:
+                job['cascade']['error'] = 'Cascade needs at least 2 loaded models'
+
+        # 더 최근의 로드 요청이 있으면 게시하지 않음
+        with _live_load_lock:
+            is_latest = job['job_id'] == _live_latest_job_id
+            if is_latest:
+                job['model_set_version'] = publish_live_model_set(models, fused_engine, options['fanout'], cascade)
+
+        if not is_latest:
+            retire_batchers(models)
+            job['status'] = 'superseded'
+        else:
+            job['status'] = 'ready'
+
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        retire_batchers(models)
+        job['error'] = str(e)
+        job['status'] = 'failed'
+
+    job['cache'] = LIVE_MODEL_CACHE.stats()
+    job['finished_at'] = time.time()
+
+
+@app.route('/api/live/load', methods=['POST'])
+def load_models_for_live():
+    """실시간 추론 모델 로드 시작 (백그라운드 로드 후 모델 세트 교체, wait=true 이면 완료까지 대기)"""
+    try:
+        data = request.json
+        model_files = data.get('model_files', [])
+        use_tf_function = bool(data.get('tf_function', True))
+        backend = data.get('backend', 'keras')
+        quantization = data.get('quantization')
+
+        if backend not in LIVE_BACKENDS:
+            return jsonify({'success': False, 'error': f'Invalid backend: {backend}'}), 400
+
+        # 캐스케이드: model_files 순서대로 실행, 마지막을 제외한 모델마다 신뢰도 임계값
+        cascade = data.get('cascade')
+        if cascade:
+            thresholds = cascade.get('thresholds') or []
+            if len(model_files) < 2 or len(thresholds) != len(model_files) - 1:
+                return jsonify({
+                    'success': False,
+                    'error': 'Cascade needs at least 2 models and one threshold per model except the last'
+                }), 400
+            # 캐스케이드 모드에서는 체인의 모델만 실행하므로 세션 상태가 필요한 스트리밍 모델은 받지 않음
+            streaming_files = [model_file for model_file in model_files if is_streaming_model_key(get_model_key(model_file))]
+            if streaming_files:
+                return jsonify({
+                    'success': False,
+                    'error': f"Streaming models cannot be cascaded: {', '.join(streaming_files)}"
+                }), 400
+            cascade = {
+                'chain': list(model_files),
+                'thresholds': {model_file: float(threshold) for model_file, threshold in zip(model_files, thresholds)}
+            }
+
+        use_folded = bool(data.get('folded', False)) and backend == 'keras'
+        options = {
+            'model_files': list(model_files),
+            'backend': backend,
+            'quantization': quantization,
+            'use_tf_function': use_tf_function,
+            'use_folded': use_folded,
+            'use_fused': bool(data.get('fused', False)) and backend == 'keras' and not cascade,
+            'batching': {**DEFAULT_BATCHING_CONFIG, **(data.get('batching') or {})},
+            'fanout': {**DEFAULT_FANOUT_CONFIG, **(data.get('fanout') or {})},
+            'cascade': cascade or None,
+            # 이번 선택의 캐시 키 (예산 초과 시에도 해제하지 않음)
+            'cache_keys': {
+                model_file: get_live_cache_key(model_file, backend, quantization, use_folded, use_tf_function)
+                for model_file in model_files
+            }
+        }
+        if data.get('cache_budget_mb') is not None:
+            LIVE_MODEL_CACHE.set_budget(data['cache_budget_mb'], pinned=options['cache_keys'].values())
+
+        job = {
+            'job_id': uuid.uuid4().hex[:12],
+            'status': 'loading',
+            'total': len(model_files),
+            'completed': 0,
+            'current_model': None,
+            'loaded_models': [],
+            'batching': options['batching'],
+            'fanout': options['fanout'],
+            'fused': None,
+            'cascade': None,
+            'cache': None,
+            'model_set_version': None,
+            'error': None,
+            'started_at': time.time(),
+            'finished_at': None
+        }
+
+        # 최신 요청만 게시 (이전 작업은 완료되어도 superseded)
+        global _live_latest_job_id
+        with _live_load_lock:
+            _live_latest_job_id = job['job_id']
+            LIVE_LOAD_JOBS[job['job_id']] = job
+            while len(LIVE_LOAD_JOBS) > LIVE_LOAD_MAX_JOBS:
+                LIVE_LOAD_JOBS.pop(next(iter(LIVE_LOAD_JOBS)))
+
+        thread = threading.Thread(
+            target=run_live_load_job, args=(job, options),
+            name=f"live-load-{job['job_id']}", daemon=True
+        )
+        thread.start()
+
+        if data.get('wait', False):
+            thread.join()
+            status = get_live_load_job_status(job)
+            if status['status'] == 'failed':
+                return jsonify({'success': False, **status}), 400
+            return jsonify({'success': True, **status})
+
+        return jsonify({'success': True, **get_live_load_job_status(job)}), 202
+
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/live/load/status', defaults={'job_id': None}, methods=['GET'])
+@app.route('/api/live/load/status/<job_id>', methods=['GET'])
+def get_live_load_status(job_id):
+    """모델 로드 진행 상황 조회 (job_id 생략 시 가장 최근 작업)"""
+    try:
+        job = LIVE_LOAD_JOBS.get(job_id or _live_latest_job_id)
+        if job is None:
+            return jsonify({'success': False, 'error': 'Load job not found'}), 404
 
         return jsonify({
             'success': True,
-            'loaded_models': loaded_info,
-            'num_classes': len(classes),
-            'classes': classes
+            'live_model_set_version': LIVE_MODEL_SET['version'],
+            **get_live_load_job_status(job)
         })
 
     except Exception as e:
-        import traceback
-        traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+def get_live_executor():
+    """모델 팬아웃용 스레드 풀 (처음 사용할 때 생성)"""
+    global _live_executor
+    with _live_executor_lock:
+        if _live_executor is None:
+            _live_executor = ThreadPoolExecutor(
+                max_workers=LIVE_FANOUT_MAX_WORKERS,
+                thread_name_prefix='live-fanout'
+            )
+        return _live_executor
+
+
+def get_top_indices(probabilities, k=5):
+    """확률 벡터 -> 상위 k개 클래스 인덱스"""
+    return [int(idx) for idx in np.argsort(probabilities)[::-1][:k]]
+
+
+def format_top_predictions(probabilities, classes, top_indices):
+    """확률 벡터 -> 상위 k개 (레이블, 신뢰도) 목록"""
+    return [
+        {'label': classes[idx], 'confidence': float(probabilities[idx])}
+        for idx in top_indices
+    ]
+
+
+def run_fused_inference(model_set, input_data):
+    """결합 그래프로 모든 모델을 한 번에 추론"""
+    start_time = time.perf_counter()
+    outputs, compute_time = model_set['fused_engine'].predict(input_data)
+    inference_time = (time.perf_counter() - start_time) * 1000  # ms
+
+    predictions = {}
+    for model_file, probabilities in outputs.items():
+        model_data = model_set['models'].get(model_file)
+        if model_data is None:
+            continue
+
+        top_indices = get_top_indices(probabilities[0])
+        top_predictions = format_top_predictions(probabilities[0], model_data['classes'], top_indices)
+        predictions[model_file] = {
+            'top_prediction': top_predictions[0],
+            'top_5': top_predictions,
+            'top_indices': top_indices,
+            'inference_time_ms': inference_time,
+            'compute_time_ms': compute_time,
+            'overhead_time_ms': max(inference_time - compute_time, 0.0),
+            'fused': True,
+            'success': True
+        }
+
+    return predictions
+
+
+def predict_single_model(model_data, input_data, stream_states=None, model_file=None):
+    """단일 모델 추론 및 결과 포맷팅
+
+    스트리밍 모델은 stream_states[model_file]의 윈도우 상태를 이어받아 한 스텝만 계산합니다
+    (세션이 없거나 이전 프레임과의 간격이 SEQUENCE_MAX_GAP_S 를 넘으면 학습 데이터처럼 새 녹화 구간으로 시작).
+    """
+    engine = model_data['engine']
+    batcher = model_data.get('batcher')
+    classes = model_data['classes']
+
+    # 추론 시작 (compute: 순수 연산, overhead: 변환/디스패치/배치 대기)
+    start_time = time.perf_counter()
+    batch_info = None
+    if model_data.get('streaming'):
+        now = time.time()
+        stream = stream_states.get(model_file) if stream_states is not None else None
+        if stream is None or not 0 <= now - stream['last_frame_time'] <= SEQUENCE_MAX_GAP_S:
+            window = engine.start_window(input_data)
+        else:
+            window = stream['window']
+        prediction, window, compute_time = engine.step_window(input_data, window)
+        if stream_states is not None:
+            stream_states[model_file] = {'window': window, 'last_frame_time': now}
+        probabilities = prediction[0]
+    elif batcher is not None:
+        probabilities, batch_info = batcher.submit(input_data[0], timeout=LIVE_PREDICT_TIMEOUT_S)
+        compute_time = batch_info['compute_time_ms']
+    else:
+        prediction, compute_time = engine.predict(input_data)
+        probabilities = prediction[0]
+    inference_time = (time.perf_counter() - start_time) * 1000  # ms
+
+    # 결과 처리
+    top_indices = get_top_indices(probabilities)
+    top_predictions = format_top_predictions(probabilities, classes, top_indices)
+
+    result = {
+        'top_prediction': top_predictions[0],
+        'top_5': top_predictions,
+        'top_indices': top_indices,
+        'inference_time_ms': inference_time,
+        'compute_time_ms': compute_time,
+        'overhead_time_ms': max(inference_time - compute_time, 0.0),
+        'success': True
+    }
+    if batch_info is not None:
+        result['batch_size'] = batch_info['batch_size']
+        result['queue_wait_ms'] = batch_info['queue_wait_ms']
+
+    return result
+
+
+def run_cascade_inference(model_set, input_data):
+    """캐스케이드 추론: 가벼운 모델부터 실행하고 top-1 신뢰도가 임계값 미만일 때만 다음 모델로 에스컬레이션"""
+    cascade = model_set['cascade']
+    predictions = {}
+    stage_costs = {}
+    answered_by = None
+
+    for stage, model_file in enumerate(cascade['chain']):
+        try:
+            prediction = predict_single_model(model_set['models'][model_file], input_data)
+        except Exception as e:
+            # 실패한 단계는 건너뛰고 다음 모델로
+            predictions[model_file] = {
+                'success': False,
+                'error': str(e)
+            }
+            continue
+
+        stage_costs[model_file] = prediction['inference_time_ms']
+        threshold = cascade['thresholds'].get(model_file)
+        answered = threshold is None or prediction['top_prediction']['confidence'] >= threshold
+        prediction['cascade'] = {'stage': stage, 'threshold': threshold, 'answered': answered}
+        predictions[model_file] = prediction
+        if answered:
+            answered_by = model_file
+            break
+
+    if answered_by is not None:
+        cascade['stats'].record(stage_costs, answered_by)
+    return predictions
+
+
+def summarize_cascade(predictions):
+    """캐스케이드 응답 요약 (캐스케이드 모드가 아니면 None)"""
+    stages = {
+        model_file: prediction['cascade']
+        for model_file, prediction in predictions.items() if 'cascade' in prediction
+    }
+    if not stages:
+        return None
+
+    answered_by = next((model_file for model_file, stage in stages.items() if stage['answered']), None)
+    return {
+        'answered_by': answered_by,
+        'top_prediction': predictions[answered_by]['top_prediction'] if answered_by else None,
+        'stages_run': len(predictions),
+        'escalated': len(predictions) > 1,
+        'cost_ms': sum(prediction.get('inference_time_ms', 0.0) for prediction in predictions.values())
+    }
+
+
+def run_live_inference(input_data, session=None):
+    """로드된 모든 모델에 대해 추론 (결합 그래프 또는 동시 팬아웃 + 모델별 타임아웃)"""
+    # 게시된 모델 세트를 한 번만 읽음 (요청 처리 중 교체되어도 일관된 세트 사용)
+    model_set = LIVE_MODEL_SET
+    if model_set['fused_engine'] is not None:
+        return run_fused_inference(model_set, input_data)
+
+    stream_states = session.get_stream_states(model_set['version']) if session is not None else None
+    if model_set['cascade'] is not None:
+        return run_cascade_inference(model_set, input_data)
+
+    loaded_models = list(model_set['models'].items())
+    fanout_config = model_set['fanout']
+    predictions = {}
+
+    # 순차 실행 (모델 1개이거나 동시 실행 비활성화)
+    if not fanout_config['concurrent'] or len(loaded_models) <= 1:
+        for model_file, model_data in loaded_models:
+            try:
+                predictions[model_file] = predict_single_model(model_data, input_data, stream_states, model_file)
+            except Exception as e:
+                predictions[model_file] = {
+                    'success': False,
+                    'error': str(e)
+                }
+        return predictions
+
+    # 동시 실행 - 지연 시간이 모델 시간의 합이 아닌 최댓값에 가까워짐
+    executor = get_live_executor()
+    dispatch_time = time.perf_counter()
+    futures = {}
+    for model_file, model_data in loaded_models:
+        # 타임아웃된 추론이 아직 실행 중인 모델은 건너뜀 (멈춘 모델이 공유 스레드 풀에 작업을 쌓지 않도록)
+        stale_future = model_data['stale_future']
+        if stale_future is not None and not stale_future.done():
+            predictions[model_file] = {
+                'success': False,
+                'busy': True,
+                'error': 'Previous inference timed out and is still running'
+            }
+            continue
+        futures[model_file] = executor.submit(predict_single_model, model_data, input_data, stream_states, model_file)
+
+    for model_file, future in futures.items():
+        timeout_ms = fanout_config['model_timeouts_ms'].get(model_file, fanout_config['timeout_ms'])
+        remaining = timeout_ms / 1000 - (time.perf_counter() - dispatch_time)
+        try:
+            predictions[model_file] = future.result(timeout=max(remaining, 0))
+        except FuturesTimeoutError:
+            # 아직 시작하지 않은 작업은 취소, 실행 중인 작업은 끝날 때까지 이 모델의 새 작업을 막음
+            if not future.cancel():
+                model_set['models'][model_file]['stale_future'] = future
+            predictions[model_file] = {
+                'success': False,
+                'timed_out': True,
+                'error': f'Inference timed out after {timeout_ms:.0f}ms'
+            }
+        except Exception as e:
+            predictions[model_file] = {
+                'success': False,
+                'error': str(e)
+            }
+
+    return predictions
+
+
+def run_session_inference(session, input_data):
+    """세션 프레임 게이트와 백프레셔를 거쳐 추론 -> (예측 결과, 세션 정보)
+
+    마지막 추론 프레임과의 움직임이 임계값 미만이면 모델을 실행하지 않고 이전 결과를 반환합니다.
+    세션의 이전 프레임이 추론 중이면 단일 대기 슬롯에서 기다리며, 그 사이 더 새로운 프레임이 오거나
+    대기 시간이 초과되면 예측 결과 None을 반환합니다 (세션 정보의 superseded/timed_out 으로 구분).
+    """
+    if session is None:
+        return run_live_inference(input_data), None
+
+    # 스트리밍 모델은 모든 프레임으로 상태를 갱신해야 하므로 결과 재사용 안 함
+    model_set = LIVE_MODEL_SET
+    model_set_version = model_set['version']
+    cached, motion = None, None
+    if not any(model_data.get('streaming') for model_data in model_set['models'].values()):
+        cached, motion = session.gate.check(input_data[0], model_set_version)
+    info = {'reused': cached is not None, 'motion': motion, 'throttled': False, 'queue_wait_ms': 0.0}
+    if cached is not None:
+        predictions = {model_file: {**prediction, 'reused': True} for model_file, prediction in cached.items()}
+        return predictions, info
+
+    outcome, queue_wait_ms, waited = session.mailbox.acquire(timeout=LIVE_PREDICT_TIMEOUT_S)
+    info['throttled'] = waited
+    info['queue_wait_ms'] = queue_wait_ms
+    if outcome != 'admitted':
+        info['superseded'] = outcome == 'superseded'
+        info['timed_out'] = outcome == 'timed_out'
+        return None, info
+
+    try:
+        predictions = run_live_inference(input_data, session)
+        session.gate.update(input_data[0], model_set_version, predictions)
+    finally:
+        session.mailbox.release()
+    return predictions, info
+
+
+def get_session_stats(session):
+    """응답에 포함할 세션 통계 (재사용 비율, 백프레셔)"""
+    return {**session.gate.stats(), 'backpressure': session.mailbox.stats()}
+
+
 @app.route('/api/live/predict', methods=['POST'])
 def live_predict():
-    """실시간 추론 - 모든 로드된 모델에 대해 예측"""
+    """실시간 추론 - 모든 로드된 모델에 대해 예측
+
+    요청: application/json ({landmarks}), application/octet-stream (float32 252 bytes), application/msgpack
+    응답 (Accept): application/json (기본), application/octet-stream, application/msgpack
+        바이너리/MessagePack 응답은 레이블 대신 top-k 인덱스와 float16 점수만 담으며,
+        클래스 목록은 /api/models/manifest/<model_file> 에서 한 번 조회합니다.
+    세션: X-Live-Session 헤더 (또는 JSON session_id)를 보내면 정지한 손의 프레임은 이전 결과를 재사용하고,
+        추론이 밀리면 가장 최신 프레임만 처리합니다 (대체된 프레임은 429 + throttled 응답).
+    """
     try:
-        data = request.json
-        landmarks = data.get('landmarks')
+        request_start = time.perf_counter()
+        session_id = request.headers.get('X-Live-Session')
 
-        if not landmarks:
+        # 요청 형식 (Content-Type)
+        try:
+            if request.mimetype == MIME_BINARY:
+                landmarks = decode_landmark_payload(request.get_data())
+            elif request.mimetype in MSGPACK_MIMETYPES:
+                landmarks = decode_msgpack_request(request.get_data())
+            else:
+                data = request.json
+                if not isinstance(data, dict):
+                    raise ValueError('JSON body must be an object')
+                landmarks = data.get('landmarks')
+                session_id = data.get('session_id', session_id)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+
+        if landmarks is None or len(landmarks) == 0:
             return jsonify({'success': False, 'error': 'No landmarks provided'}), 400
 
         # 전처리
         processed = preprocess_landmarks(landmarks)
-        input_data = np.expand_dims(processed, axis=0)  # (1, 21, 3)
+        input_data = np.expand_dims(processed, axis=0).astype(np.float32)  # (1, 21, 3)
+        preprocess_time = (time.perf_counter() - request_start) * 1000  # ms
+
+        # 모든 모델에 대해 예측 (세션이 있으면 프레임 게이트 적용)
+        session = LIVE_SESSIONS.get(str(session_id)) if session_id else None
+        predictions, session_info = run_session_inference(session, input_data)
+        if predictions is None and session_info['timed_out']:
+            # 이전 프레임 추론이 끝나지 않아 대기 시간 초과
+            return jsonify({
+                'success': False,
+                'throttled': True,
+                'timed_out': True,
+                'error': f'Timed out waiting for the previous frame after {LIVE_PREDICT_TIMEOUT_S:.0f}s',
+                'session': get_session_stats(session)
+            }), 503
+        if predictions is None:
+            return jsonify({
+                'success': False,
+                'throttled': True,
+                'superseded': True,
+                'error': 'Superseded by a newer frame',
+                'session': get_session_stats(session)
+            }), 429
+
+        # 응답 형식 (Accept, 기본 JSON)
+        response_mimetype = request.accept_mimetypes.best_match(response_mimetypes(), default=MIME_JSON)
+        if response_mimetype == MIME_BINARY or response_mimetype in MSGPACK_MIMETYPES:
+            model_files = list(predictions.keys())
+            encode = encode_predictions_binary if response_mimetype == MIME_BINARY else encode_predictions_msgpack
+            body = encode(predictions, model_files, preprocess_time, (time.perf_counter() - request_start) * 1000)
+            return Response(body, mimetype=response_mimetype, headers={
+                'X-Live-Models': ','.join(model_files),
+                'X-Live-Reused': '1' if session_info and session_info['reused'] else '0',
+                'X-Live-Throttled': '1' if session_info and session_info['throttled'] else '0'
+            })
 
-        # 모든 모델에 대해 예측
-        predictions = {}
+        response = {
+            'success': True,
+            'predictions': predictions,
+            'preprocess_time_ms': preprocess_time,
+            'total_time_ms': (time.perf_counter() - request_start) * 1000
+        }
+        if session is not None:
+            response.update(session_info)
+            response['session'] = get_session_stats(session)
+        cascade_summary = summarize_cascade(predictions)
+        if cascade_summary is not None:
+            response['cascade'] = cascade_summary
 
-        for model_file, model_data in LOADED_MODELS.items():
-            try:
-                model = model_data['model']
-                classes = model_data['classes']
+        return jsonify(response)
 
-                # 추론 시작
-                start_time = time.time()
-                prediction = model.predict(input_data, verbose=0)
-                inference_time = (time.time() - start_time) * 1000  # ms
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return jsonify({'success': False, 'error': str(e)}), 500
 
-                # 결과 처리
-                top_indices = np.argsort(prediction[0])[::-1][:5]
-                top_predictions = []
 
-                for idx in top_indices:
-                    top_predictions.append({
-                        'label': classes[idx],
-                        'confidence': float(prediction[0][idx])
-                    })
+def format_batch_predictions(probabilities, classes, k, compute_time_ms):
+    """배치 확률 (N, C) -> 샘플별 top-1 레이블과 top-k 인덱스/점수"""
+    top_indices = np.argsort(probabilities, axis=1)[:, ::-1][:, :k]
+    top_scores = np.take_along_axis(probabilities, top_indices, axis=1)
+    return {
+        'labels': [classes[idx] for idx in top_indices[:, 0]],
+        'top_indices': top_indices.tolist(),
+        'top_scores': top_scores.astype(float).round(6).tolist(),
+        'compute_time_ms': compute_time_ms,
+        'success': True
+    }
 
-                predictions[model_file] = {
-                    'top_prediction': top_predictions[0],
-                    'top_5': top_predictions,
-                    'inference_time_ms': inference_time,
-                    'success': True
-                }
 
-            except Exception as e:
-                predictions[model_file] = {
-                    'success': False,
-                    'error': str(e)
+def run_batch_chunk(model_set, chunk, k, stream_states):
+    """청크 하나를 모든 모델로 배치 추론 (마이크로 배처를 거치지 않고 엔진 직접 호출)
+
+    스트리밍 모델은 전체 프레임을 하나의 녹화 시퀀스로 보고 청크 사이에 상태를 이어받습니다.
+    """
+    if model_set['fused_engine'] is not None:
+        outputs, compute_time = model_set['fused_engine'].predict(chunk)
+        return {
+            model_file: format_batch_predictions(probabilities, model_set['models'][model_file]['classes'], k, compute_time)
+            for model_file, probabilities in outputs.items()
+            if model_file in model_set['models']
+        }
+
+    results = {}
+    for model_file, model_data in model_set['models'].items():
+        try:
+            if model_data.get('streaming'):
+                probabilities, stream_states[model_file], compute_time = model_data['engine'].predict_sequence(
+                    chunk, stream_states.get(model_file)
+                )
+            else:
+                probabilities, compute_time = model_data['engine'].predict(chunk)
+            results[model_file] = format_batch_predictions(probabilities, model_data['classes'], k, compute_time)
+        except Exception as e:
+            results[model_file] = {
+                'success': False,
+                'error': str(e)
+            }
+    return results
+
+
+@app.route('/api/live/predict_batch', methods=['POST'])
+def live_predict_batch():
+    """배치 추론 (녹화 세션 오프라인 평가) - 청크 단위로 전처리/추론하며 결과를 스트리밍
+
+    요청: application/json ({landmarks: (N, 21, 3), chunk_size, k})
+          또는 application/octet-stream (N x 252 bytes float32, ?chunk_size=&k=)
+    응답: text/event-stream - 청크마다 {type: 'chunk', start, count, predictions}, 마지막에 {type: 'complete', ...}
+    """
+    try:
+        try:
+            if request.mimetype == MIME_BINARY:
+                landmarks = decode_landmark_batch_payload(request.get_data())
+                options = request.args
+            else:
+                options = request.json
+                landmarks = np.asarray(options.get('landmarks') or [], dtype=np.float64)
+            chunk_size = min(max(int(options.get('chunk_size', LIVE_BATCH_CHUNK_SIZE)), 1), LIVE_BATCH_MAX_CHUNK_SIZE)
+            k = max(int(options.get('k', 5)), 1)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+
+        if landmarks.ndim != 3 or landmarks.shape[1:] != INPUT_SHAPE or len(landmarks) == 0:
+            return jsonify({
+                'success': False,
+                'error': f'Expected landmarks of shape (N, {INPUT_SHAPE[0]}, {INPUT_SHAPE[1]}), got {landmarks.shape}'
+            }), 400
+
+        # 게시된 모델 세트를 한 번만 읽음 (스트리밍 중 교체되어도 일관된 세트 사용)
+        model_set = LIVE_MODEL_SET
+        if not model_set['models']:
+            return jsonify({'success': False, 'error': 'No models loaded'}), 400
+
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+    def generate():
+        request_start = time.perf_counter()
+        preprocess_time = 0.0
+        compute_times = {model_file: 0.0 for model_file in model_set['models']}
+        stream_states = {}
+
+        try:
+            for start in range(0, len(landmarks), chunk_size):
+                chunk_start = time.perf_counter()
+                chunk = preprocess_landmarks_batch(landmarks[start:start + chunk_size]).astype(np.float32)
+                preprocess_time += (time.perf_counter() - chunk_start) * 1000
+
+                predictions = run_batch_chunk(model_set, chunk, k, stream_states)
+                for model_file, prediction in predictions.items():
+                    compute_times[model_file] += prediction.get('compute_time_ms', 0.0)
+
+                yield f"data: {json.dumps({'type': 'chunk', 'start': start, 'count': len(chunk), 'predictions': predictions})}\n\n"
+
+            total_time = (time.perf_counter() - request_start) * 1000
+            summary = {
+                'type': 'complete',
+                'num_samples': len(landmarks),
+                'num_chunks': -(-len(landmarks) // chunk_size),
+                'chunk_size': chunk_size,
+                'model_set_version': model_set['version'],
+                'preprocess_time_ms': preprocess_time,
+                'compute_time_ms': compute_times,
+                'total_time_ms': total_time,
+                'samples_per_sec': len(landmarks) / (total_time / 1000) if total_time > 0 else None
+            }
+            yield f"data: {json.dumps(summary)}\n\n"
+
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+
+    return Response(stream_with_context(generate()), mimetype='text/event-stream')
+
+
+def live_stream(ws):
+    """WebSocket 실시간 추론 스트림
+
+    수신: [seq uint32][(21, 3) float32 랜드마크 252 bytes] 바이너리 프레임
+    송신: 프레임마다 {type: 'prediction', seq, predictions, reused, ...} JSON 텍스트 메시지
+    연결마다 세션을 만들어 정지한 손의 프레임은 이전 결과를 재사용합니다.
+    추론 중에 쌓인 프레임은 가장 최신 프레임만 처리하고 나머지는 {type: 'dropped', seqs} 로 알립니다.
+    """
+    with _live_stream_lock:
+        LIVE_STREAM_STATS['active_connections'] += 1
+        LIVE_STREAM_STATS['total_connections'] += 1
+    session_id = f"ws-{uuid.uuid4().hex[:12]}"
+    session = LIVE_SESSIONS.get(session_id)
+
+    try:
+        while True:
+            message = ws.receive()
+            if message is None:
+                break
+
+            # latest-frame-wins: 이전 프레임 처리 중 수신 버퍼에 쌓인 프레임은 마지막 것만 처리
+            dropped_seqs = []
+            while True:
+                newer = ws.receive(timeout=0)
+                if newer is None:
+                    break
+                if not isinstance(message, str) and len(message) == STREAM_FRAME_BYTES:
+                    dropped_seqs.append(decode_stream_frame(message)[0])
+                message = newer
+            if dropped_seqs:
+                session.mailbox.record_superseded(len(dropped_seqs))
+                ws.send(json.dumps({'type': 'dropped', 'seqs': dropped_seqs, 'throttled': True}))
+
+            if isinstance(message, str):
+                ws.send(json.dumps({'type': 'error', 'seq': None, 'error': 'Binary frames expected'}))
+                continue
+
+            frame_start = time.perf_counter()
+            try:
+                seq, landmarks = decode_stream_frame(message)
+            except ValueError as e:
+                ws.send(json.dumps({'type': 'error', 'seq': None, 'error': str(e)}))
+                continue
+
+            try:
+                # 전처리
+                processed = preprocess_landmarks(landmarks)
+                input_data = np.expand_dims(processed, axis=0).astype(np.float32)  # (1, 21, 3)
+                preprocess_time = (time.perf_counter() - frame_start) * 1000  # ms
+
+                # 모든 모델에 대해 예측
+                predictions, session_info = run_session_inference(session, input_data)
+                response = {
+                    'type': 'prediction',
+                    'seq': seq,
+                    'predictions': predictions,
+                    **session_info,
+                    'cascade': summarize_cascade(predictions),
+                    'throttled': bool(dropped_seqs),
+                    'preprocess_time_ms': preprocess_time,
+                    'total_time_ms': (time.perf_counter() - frame_start) * 1000
                 }
+            except Exception as e:
+                response = {'type': 'error', 'seq': seq, 'error': str(e)}
+
+            ws.send(json.dumps(response))
+            with _live_stream_lock:
+                LIVE_STREAM_STATS['total_frames'] += 1
+
+    except ConnectionClosed:
+        pass
+    finally:
+        LIVE_SESSIONS.discard(session_id)
+        with _live_stream_lock:
+            LIVE_STREAM_STATS['active_connections'] -= 1
+
+
+if sock is not None:
+    sock.route('/api/live/stream')(live_stream)
+
+
+@app.route('/api/live/stats', methods=['GET'])
+def get_live_stats():
+    """실시간 추론 통계 (마이크로 배칭 대기 시간/배치 크기 히스토그램)"""
+    try:
+        model_set = LIVE_MODEL_SET
+        models_stats = {}
+        for model_file, model_data in model_set['models'].items():
+            batcher = model_data.get('batcher')
+            models_stats[model_file] = {
+                'engine': model_data['engine'].describe(),
+                'batching': batcher.stats() if batcher is not None else None
+            }
+
+        fused_engine = model_set['fused_engine']
+        cascade = model_set['cascade']
+
+        return jsonify({
+            'success': True,
+            'model_set_version': model_set['version'],
+            'models': models_stats,
+            'fused': fused_engine.describe() if fused_engine is not None else None,
+            'cascade': {'thresholds': cascade['thresholds'], **cascade['stats'].stats()} if cascade is not None else None,
+            'cache': LIVE_MODEL_CACHE.stats(),
+            'sessions': LIVE_SESSIONS.stats(),
+            'streaming': {'available': sock is not None, **LIVE_STREAM_STATS}
+        })
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/live/cascade/calibrate', methods=['POST'])
+def calibrate_live_cascade():
+    """캐스케이드 임계값 보정 - 검증 데이터로 목표 정확도를 만족하면서 평균 비용이 가장 작은 임계값 선택
+
+    요청: {model_files: [가벼운 모델, ..., 무거운 모델], target_accuracy: 0.95, backend, quantization, folded}
+    서빙할 백엔드/양자화 엔진의 신뢰도로 보정하며 (양자화 모델은 신뢰도 분포가 다름),
+    응답의 load_options 를 /api/live/load 요청에 그대로 사용할 수 있습니다.
+    """
+    try:
+        data = request.json
+        model_files = data.get('model_files') or []
+        target_accuracy = float(data.get('target_accuracy', 0.95))
+        backend = data.get('backend', 'keras')
+        quantization = data.get('quantization')
+        use_folded = bool(data.get('folded', False)) and backend == 'keras'
+
+        if backend not in LIVE_BACKENDS:
+            return jsonify({'success': False, 'error': f'Invalid backend: {backend}'}), 400
+
+        if not 2 <= len(model_files) <= MAX_CASCADE_STAGES:
+            return jsonify({
+                'success': False,
+                'error': f'Cascade needs 2-{MAX_CASCADE_STAGES} models'
+            }), 400
+
+        # 모든 단계가 같은 클래스 순서를 써야 신뢰도/정답을 비교할 수 있음
+        classes = None
+        model_keys = {}
+        for model_file in model_files:
+            manifest, manifest_error = load_model_manifest(model_file)
+            if manifest is None:
+                return jsonify({'success': False, 'error': f'{model_file}: {manifest_error}'}), 400
+            if is_streaming_model_key(manifest.get('model_key')):
+                return jsonify({'success': False, 'error': f'{model_file}: streaming models cannot be cascaded'}), 400
+            if classes is not None and manifest['classes'] != classes:
+                return jsonify({'success': False, 'error': f'{model_file}: class list differs from {model_files[0]}'}), 400
+            classes = manifest['classes']
+            model_keys[model_file] = manifest.get('model_key')
+
+        result = prepare_dataset(COMPARISON_DATA_FILE)
+        if result[0] is None:
+            return jsonify({'success': False, 'error': 'No validation data'}), 400
+        X_val, y_val, label_encoder = result[1], result[3], result[5]
+
+        # 데이터셋 레이블 -> 매니페스트 클래스 인덱스 (모델이 모르는 레이블의 샘플은 제외)
+        class_index = {label: index for index, label in enumerate(classes)}
+        val_labels = label_encoder.classes_[np.argmax(y_val, axis=1)]
+        known = np.array([label in class_index for label in val_labels])
+        if not known.any():
+            return jsonify({'success': False, 'error': 'Validation labels do not match model classes'}), 400
+        X_val = X_val[known].astype(np.float32)
+        labels = np.array([class_index[label] for label in val_labels[known]])
+
+        stage_probs = []
+        stage_costs = []
+        for model_file in model_files:
+            model_path = get_live_model_path(model_file, backend, quantization, use_folded)
+            if not os.path.exists(model_path):
+                return jsonify({'success': False, 'error': f'{model_file}: Model file not found ({backend})'}), 400
+
+            cache_entry, _ = LIVE_MODEL_CACHE.get_or_load(
+                get_live_cache_key(model_file, backend, quantization, use_folded),
+                lambda: load_live_engine(model_path, backend, True, model_keys[model_file])
+            )
+            engine = cache_entry['engine']
+            stage_probs.append(np.concatenate([
+                engine.predict(X_val[start:start + LIVE_BATCH_CHUNK_SIZE])[0]
+                for start in range(0, len(X_val), LIVE_BATCH_CHUNK_SIZE)
+            ]))
+            # 서빙 비용 = 단일 프레임 지연 시간
+            stage_costs.append(measure_engine_latency(engine, X_val[:1]))
+
+        calibration = calibrate_cascade_thresholds(stage_probs, labels, stage_costs, target_accuracy)
 
         return jsonify({
             'success': True,
-            'predictions': predictions
+            'model_files': model_files,
+            'backend': backend,
+            'quantization': quantization,
+            'num_samples': int(len(labels)),
+            'calibration': calibration,
+            'load_options': {
+                'model_files': model_files,
+                'backend': backend,
+                'quantization': quantization,
+                'folded': use_folded,
+                'cascade': {'thresholds': calibration['thresholds']}
+            }
         })
 
     except Exception as e:
@@ -844,6 +3187,51 @@ def live_predict():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/live/cache', methods=['GET'])
+def get_live_cache_stats():
+    """모델 캐시 통계 (적중/미스/해제 횟수, 모델별 메모리)"""
+    try:
+        return jsonify({
+            'success': True,
+            'cache': LIVE_MODEL_CACHE.stats()
+        })
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/live/cache/clear', methods=['POST'])
+def clear_live_cache():
+    """모델 캐시 비우기 (현재 선택된 모델은 선택 해제 전까지 참조 유지)"""
+    try:
+        LIVE_MODEL_CACHE.clear()
+        return jsonify({'success': True})
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+# ============ 시스템 API ============
+
+@app.route('/api/system/startup', methods=['GET'])
+def get_startup_report():
+    """서버 시작 시간 구성 및 지연 로드 상태 조회"""
+    report = STARTUP_PROFILER.report()
+    report['prewarm_enabled'] = PREWARM_ENABLED
+    report['lazy_modules'] = {
+        'tensorflow': tf.is_loaded,
+        'keras': keras.is_loaded,
+        'sklearn.model_selection': sklearn_model_selection.is_loaded,
+        'sklearn.preprocessing': sklearn_preprocessing.is_loaded
+    }
+    report['model_modules'] = {model_key: MODEL_CLASSES.is_loaded(model_key) for model_key in MODEL_CLASSES}
+
+    return jsonify({
+        'success': True,
+        'report': report
+    })
+
+
 # ============ 정적 파일 서빙 ============
 
 @app.route('/static/<path:filename>')
@@ -860,4 +3248,13 @@ if __name__ == '__main__':
     print(f"리더보드: http://localhost:5001/leaderboard")
     print("=" * 60)
 
+    # 리로더 자식 프로세스(실제 서버)에서만 사전 로드 및 시작 리포트
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        # 메타데이터 캐시 워밍업은 항상 백그라운드 (캐시된 항목은 TensorFlow import 없이 건너뜀)
+        MODEL_METADATA.warm_up(MODEL_CLASSES, DEFAULT_NUM_CLASSES, INPUT_SHAPE)
+        if PREWARM_ENABLED:
+            start_prewarm_thread()
+        STARTUP_PROFILER.mark_ready()
+        print_startup_report()
+
     app.run(host='0.0.0.0', port=5001, debug=True)
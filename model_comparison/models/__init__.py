@@ -1,12 +1,28 @@
 """
 모델 비교 시스템 - 모델 모듈
 여러 CNN 아키텍처를 구현하고 비교합니다.
+모델 클래스는 처음 접근할 때 로드됩니다 (TensorFlow 지연 import).
 """
 
-from .baseline import BaselineModel
-from .resnet import ResNetModel
-from .densenet import DenseNetModel
-from .efficientnet import EfficientNetModel
-from .slive import SLIVEModel
+import importlib
 
-__all__ = ['BaselineModel', 'ResNetModel', 'DenseNetModel', 'EfficientNetModel', 'SLIVEModel']
+_LAZY_EXPORTS = {
+    'BaselineModel': '.baseline',
+    'ResNetModel': '.resnet',
+    'DenseNetModel': '.densenet',
+    'EfficientNetModel': '.efficientnet',
+    'convert_legacy_checkpoint': '.efficientnet',
+    'SLIVEModel': '.slive',
+    'TemporalModel': '.temporal',
+    'round_filters': '.scaling',
+    'round_repeats': '.scaling'
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,15 +8,25 @@ from tensorflow import keras
 from tensorflow.keras import layers
 import numpy as np
 
+from .execution import ExecutionModeMixin
+from .scaling import round_filters, round_repeats, scaled_model_name
 
-class DenseNetModel:
+
+class DenseNetModel(ExecutionModeMixin):
     """DenseNet 모델 (1D Dense Blocks for hand landmarks)"""
 
-    def __init__(self, num_classes=74, input_shape=(21, 3)):
+    # Dense Block 수와 블록당 레이어 수, growth rate
+    NUM_DENSE_BLOCKS = 3
+    LAYERS_PER_BLOCK = 4
+    GROWTH_RATE = 32
+
+    def __init__(self, num_classes=74, input_shape=(21, 3), width_multiplier=1.0, depth_multiplier=1.0):
         self.num_classes = num_classes
         self.input_shape = input_shape
+        self.width_multiplier = width_multiplier
+        self.depth_multiplier = depth_multiplier
         self.model = None
-        self.name = "DenseNet"
+        self.name = scaled_model_name("DenseNet", width_multiplier, depth_multiplier)
 
     def conv_block(self, x, growth_rate):
         """Dense Block의 기본 Convolution Block"""
@@ -53,26 +63,23 @@ class DenseNetModel:
         return x
 
     def build_model(self):
-        """DenseNet 모델 구조 생성"""
+        """DenseNet 모델 구조 생성 (growth rate 는 width_multiplier, 블록당 레이어 수는 depth_multiplier 로 스케일링)"""
         inputs = layers.Input(shape=self.input_shape)
+        num_layers = round_repeats(self.LAYERS_PER_BLOCK, self.depth_multiplier)
+        growth_rate = round_filters(self.GROWTH_RATE, self.width_multiplier)
 
         # Initial conv
-        x = layers.Conv1D(64, 7, strides=2, padding='same',
+        x = layers.Conv1D(round_filters(64, self.width_multiplier), 7, strides=2, padding='same',
                          kernel_initializer='he_normal')(inputs)
         x = layers.BatchNormalization()(x)
         x = layers.Activation('relu')(x)
         x = layers.MaxPooling1D(3, strides=2, padding='same')(x)
 
-        # Dense Block 1
-        x = self.dense_block(x, num_layers=4, growth_rate=32)
-        x = self.transition_block(x)
-
-        # Dense Block 2
-        x = self.dense_block(x, num_layers=4, growth_rate=32)
-        x = self.transition_block(x)
-
-        # Dense Block 3
-        x = self.dense_block(x, num_layers=4, growth_rate=32)
+        # Dense Blocks (마지막 블록 뒤에는 Transition 없음)
+        for i in range(self.NUM_DENSE_BLOCKS):
+            x = self.dense_block(x, num_layers=num_layers, growth_rate=growth_rate)
+            if i < self.NUM_DENSE_BLOCKS - 1:
+                x = self.transition_block(x)
 
         # Global pooling
         x = layers.BatchNormalization()(x)
@@ -80,7 +87,7 @@ class DenseNetModel:
         x = layers.GlobalAveragePooling1D()(x)
 
         # Dense layers
-        x = layers.Dense(256, kernel_initializer='he_normal')(x)
+        x = layers.Dense(round_filters(256, self.width_multiplier), kernel_initializer='he_normal')(x)
         x = layers.BatchNormalization()(x)
         x = layers.Activation('relu')(x)
         x = layers.Dropout(0.5)(x)
@@ -91,17 +98,6 @@ class DenseNetModel:
         self.model = keras.Model(inputs=inputs, outputs=outputs)
         return self.model
 
-    def compile_model(self, learning_rate=0.001):
-        """모델 컴파일"""
-        if self.model is None:
-            self.build_model()
-
-        self.model.compile(
-            optimizer=keras.optimizers.Adam(learning_rate=learning_rate),
-            loss='categorical_crossentropy',
-            metrics=['accuracy']
-        )
-
     def get_model(self):
         """모델 반환"""
         if self.model is None:
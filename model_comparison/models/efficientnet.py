@@ -2,6 +2,7 @@
 EfficientNet 모델 - Efficient Neural Network 구조
 손 랜드마크 데이터를 위한 1D EfficientNet 구현
 MBConv (Mobile Inverted Bottleneck Convolution) 블록 사용
+Swish 는 내장 Activation('swish') 을 사용합니다 (Lambda 직렬화 없이 .h5/.keras/SavedModel 로 저장/로드 가능).
 """
 
 import tensorflow as tf
@@ -9,15 +10,33 @@ from tensorflow import keras
 from tensorflow.keras import layers
 import numpy as np
 
+from .execution import ExecutionModeMixin
+from .scaling import round_filters, round_repeats, scaled_model_name
 
-class EfficientNetModel:
+
+class EfficientNetModel(ExecutionModeMixin):
     """EfficientNet 모델 (1D MBConv blocks for hand landmarks)"""
 
-    def __init__(self, num_classes=74, input_shape=(21, 3)):
+    # MBConv 스테이지 (출력 필터 수, 커널 크기, 첫 블록 stride, expand ratio, 블록 수)
+    BLOCK_ARGS = (
+        (16, 3, 1, 1, 1),
+        (24, 3, 2, 6, 2),
+        (40, 5, 2, 6, 2),
+        (80, 3, 1, 6, 2),
+        (112, 5, 1, 6, 2)
+    )
+
+    def __init__(self, num_classes=74, input_shape=(21, 3), width_multiplier=1.0, depth_multiplier=1.0):
         self.num_classes = num_classes
         self.input_shape = input_shape
+        self.width_multiplier = width_multiplier
+        self.depth_multiplier = depth_multiplier
         self.model = None
-        self.name = "EfficientNet"
+        self.name = scaled_model_name("EfficientNet", width_multiplier, depth_multiplier)
+
+    def swish(self, x):
+        """Swish 활성화 (내장 Activation, 직렬화 가능)"""
+        return layers.Activation('swish')(x)
 
     def se_block(self, x, filters, reduction=4):
         """Squeeze-and-Excitation Block"""
@@ -39,7 +58,7 @@ class EfficientNetModel:
             x_expanded = layers.Conv1D(expanded_filters, 1, padding='same',
                                       kernel_initializer='he_normal')(x)
             x_expanded = layers.BatchNormalization()(x_expanded)
-            x_expanded = layers.Lambda(lambda x: x * tf.nn.sigmoid(x))(x_expanded)
+            x_expanded = self.swish(x_expanded)
         else:
             x_expanded = x
 
@@ -47,7 +66,7 @@ class EfficientNetModel:
         x_dw = layers.DepthwiseConv1D(kernel_size, strides=stride, padding='same',
                                       depthwise_initializer='he_normal')(x_expanded)
         x_dw = layers.BatchNormalization()(x_dw)
-        x_dw = layers.Lambda(lambda x: x * tf.nn.sigmoid(x))(x_dw)
+        x_dw = self.swish(x_dw)
 
         # Squeeze-and-Excitation
         x_se = self.se_block(x_dw, expanded_filters)
@@ -64,49 +83,36 @@ class EfficientNetModel:
         return x_out
 
     def build_model(self):
-        """EfficientNet 모델 구조 생성"""
+        """EfficientNet 모델 구조 생성 (필터 수는 width_multiplier, 스테이지별 블록 수는 depth_multiplier 로 스케일링)"""
         inputs = layers.Input(shape=self.input_shape)
 
         # Stem
-        x = layers.Conv1D(32, 3, strides=2, padding='same',
+        x = layers.Conv1D(round_filters(32, self.width_multiplier), 3, strides=2, padding='same',
                          kernel_initializer='he_normal')(inputs)
         x = layers.BatchNormalization()(x)
-        x = layers.Lambda(lambda x: x * tf.nn.sigmoid(x))(x)
-
-        # MBConv blocks
-        # Stage 1
-        x = self.mbconv_block(x, filters=16, kernel_size=3, stride=1, expand_ratio=1)
-
-        # Stage 2
-        x = self.mbconv_block(x, filters=24, kernel_size=3, stride=2, expand_ratio=6)
-        x = self.mbconv_block(x, filters=24, kernel_size=3, stride=1, expand_ratio=6)
+        x = self.swish(x)
 
-        # Stage 3
-        x = self.mbconv_block(x, filters=40, kernel_size=5, stride=2, expand_ratio=6)
-        x = self.mbconv_block(x, filters=40, kernel_size=5, stride=1, expand_ratio=6)
-
-        # Stage 4
-        x = self.mbconv_block(x, filters=80, kernel_size=3, stride=1, expand_ratio=6)
-        x = self.mbconv_block(x, filters=80, kernel_size=3, stride=1, expand_ratio=6)
-
-        # Stage 5
-        x = self.mbconv_block(x, filters=112, kernel_size=5, stride=1, expand_ratio=6)
-        x = self.mbconv_block(x, filters=112, kernel_size=5, stride=1, expand_ratio=6)
+        # MBConv blocks (스테이지마다 첫 블록만 stride 적용)
+        for filters, kernel_size, stride, expand_ratio, num_blocks in self.BLOCK_ARGS:
+            filters = round_filters(filters, self.width_multiplier)
+            for i in range(round_repeats(num_blocks, self.depth_multiplier)):
+                x = self.mbconv_block(x, filters=filters, kernel_size=kernel_size,
+                                      stride=stride if i == 0 else 1, expand_ratio=expand_ratio)
 
         # Head
-        x = layers.Conv1D(320, 1, padding='same',
+        x = layers.Conv1D(round_filters(320, self.width_multiplier), 1, padding='same',
                          kernel_initializer='he_normal')(x)
         x = layers.BatchNormalization()(x)
-        x = layers.Lambda(lambda x: x * tf.nn.sigmoid(x))(x)
+        x = self.swish(x)
 
         # Global pooling
         x = layers.GlobalAveragePooling1D()(x)
 
         # Dense layers
         x = layers.Dropout(0.5)(x)
-        x = layers.Dense(256, kernel_initializer='he_normal')(x)
+        x = layers.Dense(round_filters(256, self.width_multiplier), kernel_initializer='he_normal')(x)
         x = layers.BatchNormalization()(x)
-        x = layers.Lambda(lambda x: x * tf.nn.sigmoid(x))(x)
+        x = self.swish(x)
         x = layers.Dropout(0.3)(x)
 
         # Output
@@ -115,17 +121,6 @@ class EfficientNetModel:
         self.model = keras.Model(inputs=inputs, outputs=outputs)
         return self.model
 
-    def compile_model(self, learning_rate=0.001):
-        """모델 컴파일"""
-        if self.model is None:
-            self.build_model()
-
-        self.model.compile(
-            optimizer=keras.optimizers.Adam(learning_rate=learning_rate),
-            loss='categorical_crossentropy',
-            metrics=['accuracy']
-        )
-
     def get_model(self):
         """모델 반환"""
         if self.model is None:
@@ -144,3 +139,33 @@ class EfficientNetModel:
         if self.model is None:
             self.build_model()
         return self.model.count_params()
+
+
+def convert_legacy_checkpoint(model_path, num_classes, input_shape=(21, 3), width_multiplier=1.0, depth_multiplier=1.0):
+    """Lambda swish 로 저장된 기존 .h5 체크포인트 -> native swish 모델
+
+    기존 모델 구조(Lambda 파이썬 코드)를 역직렬화하지 않고, 같은 구조를 native swish 로 다시 만든 뒤
+    가중치만 위상 순서로 로드합니다 (Lambda/Activation 은 가중치가 없으므로 순서가 같음).
+    """
+    instance = EfficientNetModel(num_classes=num_classes, input_shape=input_shape,
+                                 width_multiplier=width_multiplier, depth_multiplier=depth_multiplier)
+    model = instance.build_model()
+    model.load_weights(model_path)
+    instance.compile_model()
+    return instance
+
+
+class LegacySwishEfficientNetModel(EfficientNetModel):
+    """native swish 변환 전 구조 (Lambda swish) - 변환 검증 기준용, 저장하지 않음"""
+
+    def swish(self, x):
+        return layers.Lambda(lambda x: x * tf.nn.sigmoid(x))(x)
+
+
+def build_legacy_reference(model_path, num_classes, input_shape=(21, 3), width_multiplier=1.0, depth_multiplier=1.0):
+    """기존 체크포인트를 역직렬화할 수 없을 때의 검증 기준: Lambda swish 그래프를 코드로 다시 만들고 같은 가중치 로드"""
+    instance = LegacySwishEfficientNetModel(num_classes=num_classes, input_shape=input_shape,
+                                            width_multiplier=width_multiplier, depth_multiplier=depth_multiplier)
+    model = instance.build_model()
+    model.load_weights(model_path)
+    return model
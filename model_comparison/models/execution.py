@@ -0,0 +1,43 @@
+"""
+모델 실행 모드 (기본 / XLA 최적화) 공통 구현
+모든 모델 클래스가 같은 컴파일 설정과 추론 함수를 쓰도록 믹스인으로 제공합니다.
+(self.model, self.input_shape, build_model(), get_model() 을 가진 클래스에서 사용)
+"""
+
+import tensorflow as tf
+from tensorflow import keras
+
+
+class ExecutionModeMixin:
+    """compile_model / get_inference_function 공통 구현"""
+
+    def compile_model(self, learning_rate=0.001, optimized=False, steps_per_execution=1):
+        """모델 컴파일 (optimized=True: XLA jit_compile + steps_per_execution)"""
+        if self.model is None:
+            self.build_model()
+
+        # 최적화 실행 모드일 때만 지정 (기본 모드는 Keras 기본값 유지)
+        compile_options = {}
+        if optimized:
+            compile_options['jit_compile'] = True
+            compile_options['steps_per_execution'] = steps_per_execution
+
+        self.model.compile(
+            optimizer=keras.optimizers.Adam(learning_rate=learning_rate),
+            loss='categorical_crossentropy',
+            metrics=['accuracy'],
+            **compile_options
+        )
+
+    def get_inference_function(self, jit_compile=True):
+        """추론 함수 반환 (입력 시그니처 고정, training=False, jit_compile=False 면 XLA 없는 같은 경로)"""
+        model = self.get_model()
+
+        @tf.function(
+            input_signature=[tf.TensorSpec(shape=(None,) + tuple(self.input_shape), dtype=tf.float32)],
+            jit_compile=jit_compile
+        )
+        def inference_fn(x):
+            return model(x, training=False)
+
+        return inference_fn
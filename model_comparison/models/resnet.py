@@ -8,15 +8,23 @@ from tensorflow import keras
 from tensorflow.keras import layers
 import numpy as np
 
+from .execution import ExecutionModeMixin
+from .scaling import round_filters, round_repeats, scaled_model_name
 
-class ResNetModel:
+
+class ResNetModel(ExecutionModeMixin):
     """ResNet 모델 (1D Residual Blocks for hand landmarks)"""
 
-    def __init__(self, num_classes=74, input_shape=(21, 3)):
+    # Residual 스테이지 (필터 수, 블록 수, 첫 블록 stride)
+    STAGES = ((64, 2, 1), (128, 2, 2), (256, 2, 2))
+
+    def __init__(self, num_classes=74, input_shape=(21, 3), width_multiplier=1.0, depth_multiplier=1.0):
         self.num_classes = num_classes
         self.input_shape = input_shape
+        self.width_multiplier = width_multiplier
+        self.depth_multiplier = depth_multiplier
         self.model = None
-        self.name = "ResNet"
+        self.name = scaled_model_name("ResNet", width_multiplier, depth_multiplier)
 
     def residual_block(self, x, filters, kernel_size=3, stride=1):
         """Residual Block 구현"""
@@ -46,31 +54,27 @@ class ResNetModel:
         return x
 
     def build_model(self):
-        """ResNet 모델 구조 생성"""
+        """ResNet 모델 구조 생성 (필터 수는 width_multiplier, 스테이지별 블록 수는 depth_multiplier 로 스케일링)"""
         inputs = layers.Input(shape=self.input_shape)
 
         # Initial conv
-        x = layers.Conv1D(64, 7, strides=2, padding='same',
+        x = layers.Conv1D(round_filters(64, self.width_multiplier), 7, strides=2, padding='same',
                          kernel_initializer='he_normal')(inputs)
         x = layers.BatchNormalization()(x)
         x = layers.Activation('relu')(x)
         x = layers.MaxPooling1D(3, strides=2, padding='same')(x)
 
         # Residual blocks
-        x = self.residual_block(x, 64)
-        x = self.residual_block(x, 64)
-
-        x = self.residual_block(x, 128, stride=2)
-        x = self.residual_block(x, 128)
-
-        x = self.residual_block(x, 256, stride=2)
-        x = self.residual_block(x, 256)
+        for filters, num_blocks, stride in self.STAGES:
+            filters = round_filters(filters, self.width_multiplier)
+            for i in range(round_repeats(num_blocks, self.depth_multiplier)):
+                x = self.residual_block(x, filters, stride=stride if i == 0 else 1)
 
         # Global pooling
         x = layers.GlobalAveragePooling1D()(x)
 
         # Dense layers
-        x = layers.Dense(256, kernel_initializer='he_normal')(x)
+        x = layers.Dense(round_filters(256, self.width_multiplier), kernel_initializer='he_normal')(x)
         x = layers.BatchNormalization()(x)
         x = layers.Activation('relu')(x)
         x = layers.Dropout(0.5)(x)
@@ -81,17 +85,6 @@ class ResNetModel:
         self.model = keras.Model(inputs=inputs, outputs=outputs)
         return self.model
 
-    def compile_model(self, learning_rate=0.001):
-        """모델 컴파일"""
-        if self.model is None:
-            self.build_model()
-
-        self.model.compile(
-            optimizer=keras.optimizers.Adam(learning_rate=learning_rate),
-            loss='categorical_crossentropy',
-            metrics=['accuracy']
-        )
-
     def get_model(self):
         """모델 반환"""
         if self.model is None:
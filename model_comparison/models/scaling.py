@@ -0,0 +1,31 @@
+"""
+모델 폭/깊이 스케일링 (EfficientNet compound scaling 방식)
+width_multiplier 는 레이어 폭(필터/유닛 수)에, depth_multiplier 는 스테이지별 블록 반복 수에 곱합니다.
+"""
+
+import math
+
+
+def round_filters(filters, width_multiplier=1.0, divisor=8):
+    """폭 스케일링 (divisor 배수로 반올림, 원래 값의 90% 아래로 내려가지 않도록 보정)"""
+    if width_multiplier == 1.0:
+        return filters
+    scaled = filters * width_multiplier
+    new_filters = max(divisor, int(scaled + divisor / 2) // divisor * divisor)
+    if new_filters < 0.9 * scaled:
+        new_filters += divisor
+    return int(new_filters)
+
+
+def round_repeats(repeats, depth_multiplier=1.0):
+    """깊이 스케일링 (올림, 최소 1)"""
+    if depth_multiplier == 1.0:
+        return repeats
+    return max(1, int(math.ceil(repeats * depth_multiplier)))
+
+
+def scaled_model_name(name, width_multiplier=1.0, depth_multiplier=1.0):
+    """스케일링된 변형이면 이름에 배율 표시 (기본 배율은 원래 이름)"""
+    if width_multiplier == 1.0 and depth_multiplier == 1.0:
+        return name
+    return f"{name} (w{width_multiplier:g}, d{depth_multiplier:g})"
@@ -8,60 +8,55 @@ from tensorflow import keras
 from tensorflow.keras import layers
 import numpy as np
 
+from .execution import ExecutionModeMixin
+from .scaling import round_filters, round_repeats, scaled_model_name
 
-class SLIVEModel:
+
+class SLIVEModel(ExecutionModeMixin):
     """SLIVE 프로젝트의 원본 모델 (Flatten + Dense)"""
 
-    def __init__(self, num_classes=74, input_shape=(21, 3)):
+    # Dense Block (유닛 수, Dropout 비율)
+    DENSE_BLOCKS = ((256, 0.3), (128, 0.3), (64, 0.2))
+
+    def __init__(self, num_classes=74, input_shape=(21, 3), width_multiplier=1.0, depth_multiplier=1.0):
         self.num_classes = num_classes
         self.input_shape = input_shape
+        self.width_multiplier = width_multiplier
+        self.depth_multiplier = depth_multiplier
         self.model = None
-        self.name = "SLIVE (Original)"
+        self.name = scaled_model_name("SLIVE (Original)", width_multiplier, depth_multiplier)
 
     def build_model(self):
-        """모델 구조 생성"""
-        model = keras.Sequential([
+        """모델 구조 생성 (Dense Block 유닛 수는 width_multiplier, 전체 블록 수는 depth_multiplier 로 스케일링)"""
+        model_layers = [
             layers.Input(shape=self.input_shape),
 
             # Flatten
-            layers.Flatten(),
-
-            # Dense Block 1
-            layers.Dense(256, kernel_initializer='he_normal'),
-            layers.BatchNormalization(),
-            layers.Activation('relu'),
-            layers.Dropout(0.3),
-
-            # Dense Block 2
-            layers.Dense(128, kernel_initializer='he_normal'),
-            layers.BatchNormalization(),
-            layers.Activation('relu'),
-            layers.Dropout(0.3),
-
-            # Dense Block 3
-            layers.Dense(64, kernel_initializer='he_normal'),
-            layers.BatchNormalization(),
-            layers.Activation('relu'),
-            layers.Dropout(0.2),
-
-            # Output
-            layers.Dense(self.num_classes, activation='softmax')
-        ])
+            layers.Flatten()
+        ]
+
+        # Dense Blocks
+        # 전체 블록 수를 먼저 스케일링한 뒤 앞쪽 블록부터 반복 수를 나눠 가짐
+        # (depth_multiplier < 1 이면 뒤쪽 블록이 빠지고, > 1 이면 앞쪽 블록부터 반복됨)
+        num_blocks = round_repeats(len(self.DENSE_BLOCKS), self.depth_multiplier)
+        for i, (units, dropout_rate) in enumerate(self.DENSE_BLOCKS):
+            repeats = num_blocks // len(self.DENSE_BLOCKS) + (1 if i < num_blocks % len(self.DENSE_BLOCKS) else 0)
+            for _ in range(repeats):
+                model_layers.extend([
+                    layers.Dense(round_filters(units, self.width_multiplier), kernel_initializer='he_normal'),
+                    layers.BatchNormalization(),
+                    layers.Activation('relu'),
+                    layers.Dropout(dropout_rate)
+                ])
+
+        # Output
+        model_layers.append(layers.Dense(self.num_classes, activation='softmax'))
+
+        model = keras.Sequential(model_layers)
 
         self.model = model
         return model
 
-    def compile_model(self, learning_rate=0.001):
-        """모델 컴파일"""
-        if self.model is None:
-            self.build_model()
-
-        self.model.compile(
-            optimizer=keras.optimizers.Adam(learning_rate=learning_rate),
-            loss='categorical_crossentropy',
-            metrics=['accuracy']
-        )
-
     def get_model(self):
         """모델 반환"""
         if self.model is None:
@@ -0,0 +1,100 @@
+"""
+Temporal 모델 - 프레임 인코더 + GRU 스트리밍 시퀀스 모델
+학습은 (T, 21, 3) 프레임 윈도우로 하고, 실시간 추론은 세션별 GRU 상태를 이어받아
+새 프레임마다 한 스텝만 계산합니다 (윈도우 전체 재계산 없음, 프레임당 O(1)).
+"""
+
+import tensorflow as tf
+from tensorflow import keras
+from tensorflow.keras import layers
+import numpy as np
+
+from .execution import ExecutionModeMixin
+from .scaling import round_filters, round_repeats, scaled_model_name
+
+
+class TemporalModel(ExecutionModeMixin):
+    """스트리밍 Temporal 모델 (Frame Encoder + GRU)"""
+
+    # 시퀀스 입력 모델 (학습 데이터는 프레임 윈도우, 실시간 추론은 상태 기반 스트리밍)
+    streaming = True
+    SEQUENCE_LENGTH = 16
+
+    # Frame Encoder Dense 레이어 수
+    FRAME_ENCODER_LAYERS = 2
+
+    def __init__(self, num_classes=74, input_shape=(21, 3), sequence_length=SEQUENCE_LENGTH, units=128,
+                 width_multiplier=1.0, depth_multiplier=1.0):
+        self.num_classes = num_classes
+        self.frame_shape = tuple(input_shape)
+        self.sequence_length = sequence_length
+        self.input_shape = (sequence_length,) + self.frame_shape
+        self.width_multiplier = width_multiplier
+        self.depth_multiplier = depth_multiplier
+        self.units = round_filters(units, width_multiplier)
+        self.model = None
+        self.name = scaled_model_name("Temporal (Streaming GRU)", width_multiplier, depth_multiplier)
+
+    def build_model(self):
+        """학습용 모델 구조 생성 (시퀀스 길이는 가변, 마지막 프레임 시점의 분류 결과 출력)
+
+        Frame Encoder/GRU 폭은 width_multiplier, Frame Encoder 레이어 수는 depth_multiplier 로 스케일링
+        """
+        inputs = layers.Input(shape=(None,) + self.frame_shape)
+
+        # Frame Encoder (프레임마다 동일한 가중치 적용)
+        x = layers.Reshape((-1, int(np.prod(self.frame_shape))))(inputs)
+        for i in range(round_repeats(self.FRAME_ENCODER_LAYERS, self.depth_multiplier)):
+            x = layers.Dense(round_filters(128, self.width_multiplier), activation='relu',
+                             kernel_initializer='he_normal', name=f'frame_dense_{i + 1}')(x)
+
+        # Temporal (GRU 상태가 이전 프레임 정보를 요약)
+        x = layers.GRU(self.units, name='temporal_gru')(x)
+        x = layers.Dropout(0.3)(x)
+
+        # Output
+        outputs = layers.Dense(self.num_classes, activation='softmax', name='classifier')(x)
+
+        self.model = keras.Model(inputs=inputs, outputs=outputs)
+        return self.model
+
+    def build_streaming_model(self, model=None):
+        """스트리밍 스텝 모델 생성: [프레임 (21, 3), 상태 (units,)] -> [확률, 새 상태]
+
+        학습된 모델의 레이어를 그대로 공유하므로 가중치 복사가 없고,
+        같은 프레임 순서로 스텝을 반복하면 학습용 모델의 시퀀스 출력과 일치합니다.
+        """
+        model = model or self.get_model()
+        gru = model.get_layer('temporal_gru')
+
+        frame = layers.Input(shape=self.frame_shape)
+        state = layers.Input(shape=(gru.units,))
+
+        x = layers.Reshape((int(np.prod(self.frame_shape)),))(frame)
+        # Frame Encoder 레이어 수는 스케일링에 따라 다르므로 저장된 모델에서 찾음
+        frame_dense_layers = [layer for layer in model.layers if layer.name.startswith('frame_dense_')]
+        for layer in sorted(frame_dense_layers, key=lambda layer: int(layer.name.rsplit('_', 1)[1])):
+            x = layer(x)
+        new_state, _ = gru.cell(x, [state])
+        outputs = model.get_layer('classifier')(new_state)
+
+        return keras.Model(inputs=[frame, state], outputs=[outputs, new_state], name=f"{model.name}_streaming")
+
+    def get_model(self):
+        """모델 반환"""
+        if self.model is None:
+            self.build_model()
+            self.compile_model()
+        return self.model
+
+    def summary(self):
+        """모델 요약"""
+        if self.model is None:
+            self.build_model()
+        return self.model.summary()
+
+    def count_parameters(self):
+        """파라미터 수 계산"""
+        if self.model is None:
+            self.build_model()
+        return self.model.count_params()
@@ -10,6 +10,12 @@ class LeaderboardManager {
         this.epochsInput = document.getElementById('epochsInput');
         this.batchSizeInput = document.getElementById('batchSizeInput');
         this.learningRateInput = document.getElementById('learningRateInput');
+        this.optimizedInput = document.getElementById('optimizedInput');
+        this.widthMultiplierInput = document.getElementById('widthMultiplierInput');
+        this.depthMultiplierInput = document.getElementById('depthMultiplierInput');
+        this.teacherSelect = document.getElementById('teacherSelect');
+        this.temperatureInput = document.getElementById('temperatureInput');
+        this.sparsityInput = document.getElementById('sparsityInput');
         this.trainBtn = document.getElementById('trainBtn');
 
         this.trainingProgress = document.getElementById('trainingProgress');
@@ -126,6 +132,7 @@ class LeaderboardManager {
                 <div class="model-info-card">
                     <h4>${model.name}</h4>
                     <p>파라미터: ${this.formatNumber(model.parameters)}</p>
+                    ${model.flops ? `<p>FLOPs: ${(model.flops / 1000000).toFixed(2)}M</p>` : ''}
                     <p class="text-muted">키: ${model.key}</p>
                 </div>
             `;
@@ -140,6 +147,12 @@ class LeaderboardManager {
         const epochs = parseInt(this.epochsInput.value);
         const batchSize = parseInt(this.batchSizeInput.value);
         const learningRate = parseFloat(this.learningRateInput.value);
+        const optimized = this.optimizedInput.checked;
+        const widthMultiplier = parseFloat(this.widthMultiplierInput.value) || 1;
+        const depthMultiplier = parseFloat(this.depthMultiplierInput.value) || 1;
+        const teacher = this.teacherSelect.value;
+        const temperature = parseFloat(this.temperatureInput.value);
+        const targetSparsity = parseFloat(this.sparsityInput.value) || 0;
 
         if (!modelKey) {
             alert('모델을 선택하세요.');
@@ -164,6 +177,18 @@ class LeaderboardManager {
         this.addLog('학습을 시작합니다...', 'system');
         this.addLog(`모델: ${modelKey.toUpperCase()}`, 'info');
         this.addLog(`에포크: ${epochs}, 배치 크기: ${batchSize}, 학습률: ${learningRate}`, 'info');
+        if (optimized) {
+            this.addLog('실행 모드: XLA 최적화', 'info');
+        }
+        if (widthMultiplier !== 1 || depthMultiplier !== 1) {
+            this.addLog(`스케일링: 폭 x${widthMultiplier}, 깊이 x${depthMultiplier}`, 'info');
+        }
+        if (teacher) {
+            this.addLog(`지식 증류: 교사 ${teacher}, 온도 ${temperature}`, 'info');
+        }
+        if (targetSparsity > 0) {
+            this.addLog(`가지치기: 목표 희소도 ${(targetSparsity * 100).toFixed(0)}%`, 'info');
+        }
 
         // 그래프 카드 표시 (학습 시작하자마자 표시)
         document.getElementById('trainingGraphCard').style.display = 'block';
@@ -189,8 +214,17 @@ class LeaderboardManager {
             model: modelKey,
             epochs: epochs,
             batch_size: batchSize,
-            learning_rate: learningRate
+            learning_rate: learningRate,
+            optimized: optimized,
+            width_multiplier: widthMultiplier,
+            depth_multiplier: depthMultiplier
         };
+        if (teacher) {
+            params.distill = { teacher: teacher, temperature: temperature };
+        }
+        if (targetSparsity > 0) {
+            params.prune = { target_sparsity: targetSparsity };
+        }
 
         // POST 요청을 위해 fetch로 스트림 시작
         try {
@@ -543,6 +577,7 @@ class LeaderboardManager {
             if (result.success) {
                 this.displayLeaderboard(result.results);
                 this.updateCharts(result.results);
+                this.updateTeacherOptions(result.results);
             }
 
         } catch (error) {
@@ -550,11 +585,25 @@ class LeaderboardManager {
         }
     }
 
+    updateTeacherOptions(results) {
+        // 지식 증류 교사 후보: 저장된 모델이 있는 리더보드 항목 (스트리밍 모델 제외)
+        const selected = this.teacherSelect.value;
+        let html = '<option value="">없음 (일반 학습)</option>';
+        for (const result of results) {
+            if (!result.model_file || result.streaming) {
+                continue;
+            }
+            html += `<option value="${result.model_file}">${result.model_name} - ${(result.val_accuracy * 100).toFixed(1)}%, ${result.inference_time_ms.toFixed(2)} ms (${result.model_file})</option>`;
+        }
+        this.teacherSelect.innerHTML = html;
+        this.teacherSelect.value = selected;
+    }
+
     displayLeaderboard(results) {
         if (results.length === 0) {
             this.leaderboardBody.innerHTML = `
                 <tr>
-                    <td colspan="18" class="text-center text-muted">학습 결과가 없습니다. 모델을 학습시켜 보세요!</td>
+                    <td colspan="19" class="text-center text-muted">학습 결과가 없습니다. 모델을 학습시켜 보세요!</td>
                 </tr>
             `;
             return;
@@ -576,14 +625,15 @@ class LeaderboardManager {
             html += `
                 <tr>
                     <td class="rank">${rankDisplay}</td>
-                    <td><strong>${result.model_name}</strong></td>
+                    <td><strong>${result.model_name}</strong>${result.execution_mode === 'xla' ? ' <span class="text-muted">(XLA)</span>' : ''}${this.formatDistillation(result.distillation)}${this.formatSweep(result.sweep)}</td>
                     <td>${(result.val_accuracy * 100).toFixed(2)}%</td>
                     <td>${(result.train_accuracy * 100).toFixed(2)}%</td>
                     <td>${this.formatTime(result.train_time)}</td>
                     <td>${this.formatTime(result.avg_epoch_time)}</td>
-                    <td>${result.inference_time_ms.toFixed(2)} ms</td>
+                    <td>${result.inference_time_ms.toFixed(2)} ms${this.formatStreaming(result.streaming)}</td>
                     <td>${this.formatNumber(result.num_parameters)}</td>
-                    <td>${result.model_size_mb ? result.model_size_mb.toFixed(2) : 'N/A'}</td>
+                    <td>${result.model_size_mb ? result.model_size_mb.toFixed(2) : 'N/A'}${this.formatPruning(result.pruning)}</td>
+                    <td>${this.formatExports(result.exports)}</td>
                     <td>${result.peak_memory_mb ? result.peak_memory_mb.toFixed(2) : 'N/A'}</td>
                     <td>${result.flops ? (result.flops / 1000000).toFixed(2) : 'N/A'}</td>
                     <td>${result.epochs}</td>
@@ -973,6 +1023,57 @@ class LeaderboardManager {
         return `${minutes}m ${secs}s`;
     }
 
+    formatStreaming(streaming) {
+        // 스트리밍 모델: 프레임당 상태 업데이트 비용 (윈도우 전체 재계산 대비)
+        if (!streaming) {
+            return '';
+        }
+        return `<div class="text-muted">스트리밍: ${streaming.step_time_ms.toFixed(2)} ms/프레임 (윈도우 ${streaming.sequence_length}프레임 ${streaming.window_time_ms.toFixed(2)} ms)</div>`;
+    }
+
+    formatDistillation(distillation) {
+        // 증류 모델: 교사 계보와 교사 정확도/지연 시간
+        if (!distillation) {
+            return '';
+        }
+        const teacherLatency = distillation.teacher_inference_time_ms != null ? `, ${distillation.teacher_inference_time_ms.toFixed(2)} ms` : '';
+        return `<div class="text-muted">교사: ${distillation.teacher_model_name} (${(distillation.teacher_val_accuracy * 100).toFixed(1)}%${teacherLatency}, T=${distillation.temperature})</div>`;
+    }
+
+    formatSweep(sweep) {
+        // 스케일링 스윕 변형: p95 지연 시간과 예산 충족/선택 여부
+        if (!sweep) {
+            return '';
+        }
+        const budget = sweep.latency_budget_ms != null ? ` / 예산 ${sweep.latency_budget_ms} ms` : '';
+        const status = sweep.selected ? ' ✅ 선택' : (sweep.meets_budget ? '' : ' ⛔ 예산 초과');
+        return `<div class="text-muted">스윕: p95 ${sweep.latency.p95_ms.toFixed(2)} ms${budget}${status}</div>`;
+    }
+
+    formatPruning(pruning) {
+        // 가지치기 모델: 실제 희소도와 희소 가중치 파일 크기 (float32 가중치 대비 압축률)
+        if (!pruning) {
+            return '';
+        }
+        return `<div class="text-muted">희소도 ${(pruning.sparsity * 100).toFixed(0)}%, 희소 ${pruning.sparse_size_mb.toFixed(2)} MB (${pruning.compression_ratio.toFixed(1)}x)</div>`;
+    }
+
+    formatExports(exports) {
+        // 내보낸 최적화 변형 (BatchNorm 접기, TFLite 양자화): 크기 / 정확도 하락 / 지연 시간
+        if (!exports || Object.keys(exports).length === 0) {
+            return 'N/A';
+        }
+
+        return Object.entries(exports).map(([name, info]) => {
+            const parts = [`${info.export_size_mb.toFixed(2)}MB`];
+            if (info.accuracy_drop !== undefined && info.accuracy_drop !== null) {
+                parts.push(`-${(info.accuracy_drop * 100).toFixed(2)}%p`);
+            }
+            parts.push(`${info.export_inference_ms.toFixed(2)} ms`);
+            return `<div class="text-muted">${name}: ${parts.join(' / ')}</div>`;
+        }).join('');
+    }
+
     formatDateTime(isoString) {
         const date = new Date(isoString);
         return date.toLocaleString('ko-KR', {
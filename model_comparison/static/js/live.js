@@ -23,6 +23,16 @@ class LiveComparison {
         this.lastFpsUpdate = Date.now();
         this.currentFps = 0;
 
+        // WebSocket 스트리밍 (실패 시 HTTP /api/live/predict 사용)
+        this.stream = null;
+        this.streamSeq = 0;
+        this.pendingFrames = new Map();
+
+        // HTTP 세션 (서버가 정지한 손의 프레임은 이전 결과를 재사용)
+        this.sessionId = (window.crypto && crypto.randomUUID)
+            ? crypto.randomUUID()
+            : `${Date.now()}-${Math.random().toString(16).slice(2)}`;
+
         // DOM 요소
         this.video = document.getElementById('webcam');
         this.canvas = document.getElementById('canvas');
@@ -32,6 +42,7 @@ class LiveComparison {
         this.loadModelsBtn = document.getElementById('loadModelsBtn');
         this.startLiveBtn = document.getElementById('startLiveBtn');
         this.stopLiveBtn = document.getElementById('stopLiveBtn');
+        this.backendSelect = document.getElementById('backendSelect');
 
         // 상태
         this.cameraStatus = document.getElementById('cameraStatus');
@@ -125,18 +136,41 @@ class LiveComparison {
         loadingStatus.style.display = 'block';
         this.loadModelsBtn.disabled = true;
 
+        // 백엔드 선택 (예: "numpy:int8" -> backend=numpy, quantization=int8 / "keras:folded" -> BatchNorm 접기 모델)
+        const [backend, variant] = this.backendSelect.value.split(':');
+        const folded = variant === 'folded';
+        const quantization = folded ? null : variant;
+
         try {
             const response = await fetch('/api/live/load', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({
-                    model_files: Array.from(this.selectedModels)
+                    model_files: Array.from(this.selectedModels),
+                    backend: backend,
+                    quantization: quantization || null,
+                    folded: folded
                 })
             });
 
-            const result = await response.json();
+            let result = await response.json();
 
-            if (result.success) {
+            // 백그라운드 로드 완료까지 진행 상황 조회 (기존 모델로 추론은 계속 가능)
+            while (result.success && result.status === 'loading') {
+                loadingStatus.querySelector('p').textContent =
+                    `모델 로딩 중... (${result.completed}/${result.total})` +
+                    (result.current_model ? ` ${result.current_model}` : '');
+                await new Promise(resolve => setTimeout(resolve, 300));
+                const statusResponse = await fetch(`/api/live/load/status/${result.job_id}`);
+                result = await statusResponse.json();
+            }
+
+            if (result.success && result.status === 'superseded') {
+                // 이후의 로드 요청이 게시됨
+                return;
+            }
+
+            if (result.success && result.status === 'ready') {
                 this.loadedModels = result.loaded_models.filter(m => m.loaded);
 
                 // 성능 통계 초기화
@@ -155,9 +189,23 @@ class LiveComparison {
                     };
                 }
 
-                alert(`${this.loadedModels.length}개 모델이 성공적으로 로드되었습니다!`);
+                // 로드 실패 모델 표시
+                const failures = result.loaded_models
+                    .filter(m => !m.loaded)
+                    .map(m => `${m.model_file}: ${m.error}`);
+                let message = `${this.loadedModels.length}개 모델이 성공적으로 로드되었습니다!`;
+                if (failures.length > 0) {
+                    message += '\n\n실패:\n' + failures.join('\n');
+                }
+                alert(message);
                 this.startLiveBtn.disabled = false;
 
+                // 매니페스트 없는 기존 모델: 사용자가 확인하면 현재 데이터셋 기준으로 생성
+                const missing = result.loaded_models.filter(m => m.manifest_missing).map(m => m.model_file);
+                if (missing.length > 0) {
+                    await this.offerManifestBackfill(missing);
+                }
+
             } else {
                 alert('모델 로드 실패: ' + result.error);
             }
@@ -167,16 +215,47 @@ class LiveComparison {
             alert('모델 로드 중 오류가 발생했습니다.');
         } finally {
             loadingStatus.style.display = 'none';
+            loadingStatus.querySelector('p').textContent = '모델 로딩 중...';
             this.loadModelsBtn.disabled = false;
         }
     }
 
+    async offerManifestBackfill(modelFiles) {
+        const ok = confirm(
+            `매니페스트가 없는 모델: ${modelFiles.join(', ')}\n\n` +
+            '현재 데이터셋으로 매니페스트를 생성할까요? 학습 이후 데이터셋의 클래스가 바뀌었다면 예측 클래스가 잘못 표시될 수 있습니다.'
+        );
+        if (!ok) return;
+
+        const errors = [];
+        for (const modelFile of modelFiles) {
+            const response = await fetch('/api/models/manifest', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ model_file: modelFile })
+            });
+            const result = await response.json();
+            if (!result.success) {
+                errors.push(`${modelFile}: ${result.error}`);
+            }
+        }
+
+        if (errors.length > 0) {
+            alert('매니페스트 생성 실패:\n' + errors.join('\n'));
+        } else {
+            alert('매니페스트를 생성했습니다. 모델을 다시 로드하세요.');
+        }
+    }
+
     async startLive() {
         if (this.loadedModels.length === 0) {
             alert('먼저 모델을 로드하세요.');
             return;
         }
 
+        // 스트리밍 연결 (카메라 시작 전에 연결)
+        await this.openStream();
+
         // 카메라 시작
         await this.startCamera();
 
@@ -196,6 +275,7 @@ class LiveComparison {
     stopLive() {
         this.isRunning = false;
         this.stopCamera();
+        this.closeStream();
 
         this.startLiveBtn.disabled = false;
         this.stopLiveBtn.disabled = true;
@@ -340,11 +420,95 @@ class LiveComparison {
         }
     }
 
+    openStream() {
+        // 프레임당 HTTP 요청 대신 지속 연결로 바이너리 프레임 전송
+        return new Promise((resolve) => {
+            if (!('WebSocket' in window)) {
+                resolve(false);
+                return;
+            }
+
+            const protocol = location.protocol === 'https:' ? 'wss:' : 'ws:';
+            const socket = new WebSocket(`${protocol}//${location.host}/api/live/stream`);
+            socket.binaryType = 'arraybuffer';
+
+            socket.onopen = () => {
+                this.stream = socket;
+                resolve(true);
+            };
+            socket.onerror = () => resolve(false);
+            socket.onclose = () => {
+                this.stream = null;
+                for (const resolveFrame of this.pendingFrames.values()) {
+                    resolveFrame(null);
+                }
+                this.pendingFrames.clear();
+            };
+            socket.onmessage = (event) => this.onStreamMessage(event);
+        });
+    }
+
+    closeStream() {
+        if (this.stream) {
+            this.stream.close();
+            this.stream = null;
+        }
+    }
+
+    onStreamMessage(event) {
+        const message = JSON.parse(event.data);
+
+        // 추론이 밀려 서버가 건너뛴 프레임 (최신 프레임만 처리)
+        if (message.type === 'dropped') {
+            for (const seq of message.seqs) {
+                const resolveFrame = this.pendingFrames.get(seq);
+                if (resolveFrame) {
+                    this.pendingFrames.delete(seq);
+                    resolveFrame(null);
+                }
+            }
+            return;
+        }
+
+        const resolveFrame = this.pendingFrames.get(message.seq);
+        if (resolveFrame) {
+            this.pendingFrames.delete(message.seq);
+            resolveFrame(message);
+        }
+
+        if (message.type === 'prediction') {
+            this.updateResults(message.predictions);
+        } else {
+            console.error('스트리밍 추론 실패:', message.error);
+        }
+    }
+
+    sendStreamFrame(landmarks) {
+        // [seq uint32][21 x 3 float32] = 256 bytes (little-endian)
+        this.streamSeq = (this.streamSeq + 1) >>> 0;
+        const seq = this.streamSeq;
+
+        const buffer = new ArrayBuffer(4 + 21 * 3 * 4);
+        const view = new DataView(buffer);
+        view.setUint32(0, seq, true);
+        landmarks.flat().forEach((value, i) => view.setFloat32(4 + i * 4, value, true));
+
+        return new Promise((resolve) => {
+            this.pendingFrames.set(seq, resolve);
+            this.stream.send(buffer);
+        });
+    }
+
     async performInference(landmarks) {
+        if (this.stream && this.stream.readyState === WebSocket.OPEN) {
+            await this.sendStreamFrame(landmarks);
+            return;
+        }
+
         try {
             const response = await fetch('/api/live/predict', {
                 method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
+                headers: { 'Content-Type': 'application/json', 'X-Live-Session': this.sessionId },
                 body: JSON.stringify({ landmarks: landmarks })
             });
 
@@ -362,7 +526,8 @@ class LiveComparison {
     updateResults(predictions) {
         // 성능 통계 업데이트
         for (const [modelFile, prediction] of Object.entries(predictions)) {
-            if (!prediction.success) continue;
+            // 재사용된 결과는 추론 시간 통계에서 제외
+            if (!prediction.success || prediction.reused) continue;
 
             const stats = this.performanceStats[modelFile];
             const history = this.inferenceHistory[modelFile];
@@ -495,6 +660,15 @@ class LiveComparison {
             }
 
             html += '</div>';
+
+            if (prediction.compute_time_ms !== undefined) {
+                html += `
+                    <div class="text-muted">
+                        연산 ${prediction.compute_time_ms.toFixed(2)}ms / 오버헤드 ${prediction.overhead_time_ms.toFixed(2)}ms
+                    </div>
+                `;
+            }
+
             body.innerHTML = html;
         }
     }
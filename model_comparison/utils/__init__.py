@@ -1,17 +1,53 @@
 """
 유틸리티 모듈
+TensorFlow 의존 모듈은 처음 접근할 때 로드됩니다.
 """
 
-from .resource_monitor import (
-    ResourceMonitor,
-    TrainingResourceMonitor,
-    get_system_info,
-    measure_all_resources
-)
+import importlib
 
-__all__ = [
-    'ResourceMonitor',
-    'TrainingResourceMonitor',
-    'get_system_info',
-    'measure_all_resources'
-]
+_LAZY_EXPORTS = {
+    'ResourceMonitor': '.resource_monitor',
+    'TrainingResourceMonitor': '.resource_monitor',
+    'get_system_info': '.resource_monitor',
+    'measure_all_resources': '.resource_monitor',
+    'ModelMetadataCache': '.model_metadata',
+    'KerasInferenceEngine': '.inference_engine',
+    'FusedInferenceEngine': '.inference_engine',
+    'StreamingInferenceEngine': '.inference_engine',
+    'MicroBatcher': '.micro_batcher',
+    'ModelCache': '.model_cache',
+    'LiveSessionStore': '.live_session',
+    'CascadeStats': '.cascade',
+    'calibrate_cascade_thresholds': '.cascade',
+    'evaluate_cascade': '.cascade',
+    'build_distillation_targets': '.distillation',
+    'compile_for_distillation': '.distillation',
+    'MagnitudePruningCallback': '.pruning',
+    'compute_sparsity': '.pruning',
+    'export_sparse_weights': '.pruning',
+    'load_sparse_weights': '.pruning',
+    'NumpyInferenceEngine': '.numpy_backend',
+    'export_dense_weight_pack': '.numpy_backend',
+    'quantize_weight_pack_int8': '.numpy_backend',
+    'save_weight_pack': '.numpy_backend',
+    'validate_weight_pack': '.numpy_backend',
+    'fold_batchnorm': '.graph_optimizer',
+    'validate_folded_model': '.graph_optimizer',
+    'save_weight_store': '.weight_store',
+    'load_weight_store': '.weight_store',
+    'TFLiteInferenceEngine': '.tflite_backend',
+    'convert_to_tflite': '.tflite_backend',
+    'LazyModule': '.lazy_import',
+    'LazyClassRegistry': '.lazy_import',
+    'StartupProfiler': '.lazy_import',
+    'STARTUP_PROFILER': '.lazy_import'
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
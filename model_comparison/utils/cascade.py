@@ -0,0 +1,136 @@
+"""
+신뢰도 기반 캐스케이드 추론
+가벼운 모델부터 순서대로 실행하고, top-1 신뢰도가 임계값 이상이면 그 모델의 결과로 응답하며
+확신이 없을 때만 다음(더 무거운) 모델로 넘깁니다. 마지막 모델은 항상 응답합니다.
+검증 데이터로 목표 정확도를 만족하면서 평균 비용이 가장 작은 임계값을 고르는 보정 도구를 포함합니다.
+"""
+
+import itertools
+import threading
+
+import numpy as np
+
+
+# 단계별 임계값 후보 수 (단계가 많을수록 조합 수가 늘어나므로 줄임)
+CALIBRATION_GRID_SIZES = {1: 101, 2: 41, 3: 21}
+MAX_CASCADE_STAGES = 4
+
+
+class CascadeStats:
+    """캐스케이드 서빙 통계 (에스컬레이션 비율, 평균 비용, 단계별 응답 수)"""
+
+    def __init__(self, chain):
+        self.chain = list(chain)
+        self.frames = 0
+        self.escalated = 0
+        self.total_cost_ms = 0.0
+        self.answered = {model_file: 0 for model_file in self.chain}
+        self.stage_runs = {model_file: 0 for model_file in self.chain}
+        self.stage_cost_ms = {model_file: 0.0 for model_file in self.chain}
+        self._lock = threading.Lock()
+
+    def record(self, stage_costs_ms, answered_by):
+        """프레임 하나의 결과 기록 (stage_costs_ms: 실행한 단계의 model_file -> 비용 ms)"""
+        with self._lock:
+            self.frames += 1
+            if answered_by != self.chain[0]:
+                self.escalated += 1
+            self.answered[answered_by] += 1
+            for model_file, cost_ms in stage_costs_ms.items():
+                self.stage_runs[model_file] += 1
+                self.stage_cost_ms[model_file] += cost_ms
+                self.total_cost_ms += cost_ms
+
+    def stats(self):
+        with self._lock:
+            mean_stage_cost = {
+                model_file: self.stage_cost_ms[model_file] / self.stage_runs[model_file]
+                for model_file in self.chain if self.stage_runs[model_file]
+            }
+            avg_cost_ms = self.total_cost_ms / self.frames if self.frames else 0.0
+            # 모든 모델을 실행했을 때의 프레임당 비용 (단계별 평균 비용 합)
+            full_cost_ms = sum(mean_stage_cost.values()) if len(mean_stage_cost) == len(self.chain) else None
+
+            return {
+                'chain': self.chain,
+                'frames': self.frames,
+                'escalation_rate': self.escalated / self.frames if self.frames else 0.0,
+                'avg_cost_ms': avg_cost_ms,
+                'full_cost_ms': full_cost_ms,
+                'cost_ratio': avg_cost_ms / full_cost_ms if full_cost_ms else None,
+                'answered': dict(self.answered),
+                'mean_stage_cost_ms': mean_stage_cost
+            }
+
+
+def resolve_cascade_stages(stage_probs, thresholds):
+    """샘플별 응답 단계 (첫 번째로 신뢰도 >= 임계값인 단계, 없으면 마지막 단계)"""
+    num_samples = len(stage_probs[0])
+    answered_stage = np.full(num_samples, len(stage_probs) - 1)
+    pending = np.ones(num_samples, dtype=bool)
+    for stage, threshold in enumerate(thresholds):
+        confident = pending & (np.max(stage_probs[stage], axis=1) >= threshold)
+        answered_stage[confident] = stage
+        pending &= ~confident
+    return answered_stage
+
+
+def evaluate_cascade(stage_probs, labels, thresholds, stage_costs_ms):
+    """임계값 조합의 정확도/에스컬레이션 비율/평균 비용
+
+    stage_probs: 단계별 (N, C) 확률, labels: (N,) 정답 클래스 인덱스, thresholds: 마지막 단계를 제외한 임계값
+    """
+    answered_stage = resolve_cascade_stages(stage_probs, thresholds)
+    stage_correct = np.stack([np.argmax(probs, axis=1) == labels for probs in stage_probs])
+    correct = stage_correct[answered_stage, np.arange(len(labels))]
+
+    # 응답 단계까지의 모든 단계 비용을 지불
+    cumulative_costs = np.cumsum(stage_costs_ms)
+    costs = cumulative_costs[answered_stage]
+
+    return {
+        'thresholds': [float(threshold) for threshold in thresholds],
+        'accuracy': float(np.mean(correct)),
+        'escalation_rate': float(np.mean(answered_stage > 0)),
+        'avg_cost_ms': float(np.mean(costs)),
+        'answered_fraction': [float(np.mean(answered_stage == stage)) for stage in range(len(stage_probs))]
+    }
+
+
+def calibrate_cascade_thresholds(stage_probs, labels, stage_costs_ms, target_accuracy):
+    """목표 정확도를 만족하는 임계값 중 평균 비용이 가장 작은 조합 선택 (격자 탐색)
+
+    후보는 각 단계 top-1 신뢰도의 분위수이며, 1보다 큰 값은 "항상 다음 단계로 넘김"을 뜻합니다.
+    목표를 만족하는 조합이 없으면 정확도가 가장 높은 조합을 반환합니다 (achieved=False).
+    """
+    num_stages = len(stage_probs)
+    if num_stages < 2 or num_stages > MAX_CASCADE_STAGES:
+        raise ValueError(f'Cascade needs 2-{MAX_CASCADE_STAGES} models, got {num_stages}')
+
+    grid_size = CALIBRATION_GRID_SIZES[num_stages - 1]
+    candidates = []
+    for probs in stage_probs[:-1]:
+        confidences = np.max(probs, axis=1)
+        quantiles = np.quantile(confidences, np.linspace(0.0, 1.0, grid_size))
+        candidates.append(np.unique(np.append(quantiles, np.inf)))
+
+    best, best_fallback = None, None
+    for thresholds in itertools.product(*candidates):
+        result = evaluate_cascade(stage_probs, labels, thresholds, stage_costs_ms)
+        if result['accuracy'] >= target_accuracy:
+            if best is None or result['avg_cost_ms'] < best['avg_cost_ms']:
+                best = result
+        elif best_fallback is None or result['accuracy'] > best_fallback['accuracy']:
+            best_fallback = result
+
+    chosen = best if best is not None else best_fallback
+    # inf 는 JSON으로 직렬화할 수 없으므로 1보다 큰 값으로 표시 (항상 에스컬레이션)
+    chosen['thresholds'] = [threshold if np.isfinite(threshold) else 1.01 for threshold in chosen['thresholds']]
+    return {
+        **chosen,
+        'target_accuracy': float(target_accuracy),
+        'achieved': best is not None,
+        'stage_accuracy': [float(np.mean(np.argmax(probs, axis=1) == labels)) for probs in stage_probs],
+        'stage_costs_ms': [float(cost) for cost in stage_costs_ms],
+        'full_cost_ms': float(np.sum(stage_costs_ms))
+    }
@@ -0,0 +1,74 @@
+"""
+지식 증류 (Knowledge Distillation)
+리더보드의 무거운 모델(교사)의 soft target을 온도로 완화해 작은 모델(학생)을 학습합니다.
+학생의 출력은 softmax 확률이므로 log 확률을 로짓으로 보고 온도를 적용합니다 (상수 차이는 softmax에서 상쇄).
+학습 타깃은 [정답 one-hot | 교사 soft target] 을 이어 붙인 (N, 2C) 배열입니다.
+"""
+
+import numpy as np
+
+
+DEFAULT_TEMPERATURE = 4.0
+DEFAULT_ALPHA = 0.3
+_EPSILON = 1e-7
+
+
+def soften_probabilities(probabilities, temperature):
+    """softmax 확률 -> 온도 T로 완화한 확률 (softmax(log p / T))"""
+    logits = np.log(np.clip(probabilities, _EPSILON, 1.0)) / temperature
+    logits -= np.max(logits, axis=1, keepdims=True)
+    exp = np.exp(logits)
+    return (exp / np.sum(exp, axis=1, keepdims=True)).astype(np.float32)
+
+
+def build_distillation_targets(hard_targets, teacher_probabilities, temperature):
+    """학습 타깃 (N, 2C): [정답 one-hot | 온도 T로 완화한 교사 확률]"""
+    soft_targets = soften_probabilities(teacher_probabilities, temperature)
+    return np.concatenate([np.asarray(hard_targets, dtype=np.float32), soft_targets], axis=1)
+
+
+def make_distillation_loss(num_classes, temperature=DEFAULT_TEMPERATURE, alpha=DEFAULT_ALPHA):
+    """증류 손실: alpha * CE(정답, 학생) + (1 - alpha) * T^2 * KL(교사_T || 학생_T)
+
+    T^2 는 온도를 높여도 soft target 항의 그래디언트 크기가 유지되도록 보정합니다 (Hinton et al.).
+    """
+    import tensorflow as tf
+
+    def distillation_loss(y_true, y_pred):
+        hard_targets = y_true[:, :num_classes]
+        soft_targets = y_true[:, num_classes:]
+        log_probs = tf.math.log(tf.clip_by_value(y_pred, _EPSILON, 1.0))
+
+        hard_loss = -tf.reduce_sum(hard_targets * log_probs, axis=-1)
+        student_log_soft = tf.nn.log_softmax(log_probs / temperature, axis=-1)
+        soft_loss = tf.reduce_sum(
+            soft_targets * (tf.math.log(tf.clip_by_value(soft_targets, _EPSILON, 1.0)) - student_log_soft),
+            axis=-1
+        )
+        return alpha * hard_loss + (1.0 - alpha) * (temperature ** 2) * soft_loss
+
+    return distillation_loss
+
+
+def make_distillation_accuracy(num_classes):
+    """정답 부분([:, :C])만 사용하는 정확도 지표 (로그 키는 일반 학습과 같은 accuracy/val_accuracy)"""
+    import tensorflow as tf
+
+    def accuracy(y_true, y_pred):
+        hard_targets = y_true[:, :num_classes]
+        return tf.cast(tf.equal(tf.argmax(hard_targets, axis=-1), tf.argmax(y_pred, axis=-1)), tf.float32)
+
+    return accuracy
+
+
+def compile_for_distillation(model, num_classes, learning_rate, temperature=DEFAULT_TEMPERATURE, alpha=DEFAULT_ALPHA,
+                             **compile_options):
+    """학생 모델을 증류 손실로 컴파일 (저장 전에는 모델 클래스의 compile_model 로 다시 컴파일)"""
+    from tensorflow import keras
+
+    model.compile(
+        optimizer=keras.optimizers.Adam(learning_rate=learning_rate),
+        loss=make_distillation_loss(num_classes, temperature, alpha),
+        metrics=[make_distillation_accuracy(num_classes)],
+        **compile_options
+    )
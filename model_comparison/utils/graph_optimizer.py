@@ -0,0 +1,194 @@
+"""
+추론용 그래프 최적화 (BatchNorm 접기)
+학습된 Keras 함수형 모델을 다시 구성하면서 Conv1D/DepthwiseConv1D/Dense 직후의 BatchNormalization을
+가중치에 접어 넣고 Dropout을 제거합니다. (ResNet, DenseNet, EfficientNet 등)
+"""
+
+import numpy as np
+
+from .numpy_backend import _batchnorm_params
+
+
+FOLDABLE_LAYER_TYPES = ('Conv1D', 'DepthwiseConv1D', 'Dense')
+
+
+def fold_conv_batchnorm(layer_type, kernel, bias, gamma, beta, moving_mean, moving_variance, epsilon):
+    """BatchNorm(Conv(x)) == Conv'(x) 가 되도록 가중치 변환"""
+    scale = gamma / np.sqrt(moving_variance + epsilon)
+
+    if layer_type == 'DepthwiseConv1D':
+        # depthwise 커널 (k, in, multiplier) -> 출력 채널 = in * multiplier
+        folded_kernel = kernel * scale.reshape(1, kernel.shape[1], kernel.shape[2])
+    else:
+        # Conv1D (k, in, out), Dense (in, out) -> 마지막 축이 출력 채널
+        folded_kernel = kernel * scale
+
+    folded_bias = (bias - moving_mean) * scale + beta
+    return folded_kernel.astype(np.float32), folded_bias.astype(np.float32)
+
+
+def _node_input_tensors(layer):
+    """레이어 첫 번째 inbound node의 입력 텐서 목록 (Keras 2/3 공통)"""
+    tensors = layer._inbound_nodes[0].input_tensors
+    return list(tensors) if isinstance(tensors, (list, tuple)) else [tensors]
+
+
+def _tensor_key(tensor):
+    """텐서를 만든 (레이어 이름, 출력 인덱스)"""
+    history = tensor._keras_history
+    return history[0].name, history[2]
+
+
+def _is_last_axis_batchnorm(layer):
+    """채널(마지막) 축 BatchNorm 여부"""
+    config = layer.get_config()
+    axis = config.get('axis', -1)
+    if isinstance(axis, (list, tuple)):
+        if len(axis) != 1:
+            return False
+        axis = axis[0]
+    rank = len(_node_input_tensors(layer)[0].shape)
+    return axis in (-1, rank - 1) and not config.get('renorm', False)
+
+
+def find_foldable_batchnorms(model):
+    """접을 수 있는 BatchNorm -> 직전 레이어 이름 매핑
+
+    직전 레이어가 선형 활성화의 Conv1D/DepthwiseConv1D/Dense이고
+    그 출력을 BatchNorm만 사용하는 경우에만 접습니다.
+    """
+    layers_by_name = {layer.name: layer for layer in model.layers}
+
+    # 텐서별 소비자 수 (모델 출력도 소비자로 계산)
+    consumers = {}
+    for layer in model.layers:
+        if layer.__class__.__name__ == 'InputLayer':
+            continue
+        for tensor in _node_input_tensors(layer):
+            key = _tensor_key(tensor)
+            consumers[key] = consumers.get(key, 0) + 1
+    for tensor in model.outputs:
+        key = _tensor_key(tensor)
+        consumers[key] = consumers.get(key, 0) + 1
+
+    foldable = {}
+    for layer in model.layers:
+        if layer.__class__.__name__ != 'BatchNormalization' or not _is_last_axis_batchnorm(layer):
+            continue
+
+        producer_key = _tensor_key(_node_input_tensors(layer)[0])
+        producer = layers_by_name[producer_key[0]]
+        config = producer.get_config()
+
+        if producer.__class__.__name__ not in FOLDABLE_LAYER_TYPES:
+            continue
+        if config.get('activation', 'linear') != 'linear' or config.get('data_format', 'channels_last') != 'channels_last':
+            continue
+        if config.get('groups', 1) != 1 or consumers.get(producer_key, 0) != 1:
+            continue
+
+        foldable[layer.name] = producer.name
+
+    return foldable
+
+
+def fold_batchnorm(model):
+    """BatchNorm을 직전 Conv/Dense에 접고 Dropout을 제거한 추론용 모델 생성 -> (모델, 리포트)
+
+    접지 않는 레이어는 원본 레이어 객체를 그대로 재사용합니다.
+    """
+    from tensorflow import keras
+
+    foldable = find_foldable_batchnorms(model)
+    folded_producers = {producer: bn for bn, producer in foldable.items()}
+    layers_by_name = {layer.name: layer for layer in model.layers}
+
+    tensor_map = {}
+    inputs = []
+    for tensor in model.inputs:
+        new_input = keras.Input(shape=tuple(tensor.shape[1:]), name=_tensor_key(tensor)[0])
+        tensor_map[_tensor_key(tensor)] = new_input
+        inputs.append(new_input)
+
+    removed_dropout = 0
+    for layer in model.layers:
+        layer_type = layer.__class__.__name__
+        if layer_type == 'InputLayer':
+            continue
+
+        layer_inputs = [tensor_map[_tensor_key(tensor)] for tensor in _node_input_tensors(layer)]
+
+        if layer_type == 'Dropout':
+            # 추론 시 항등 함수
+            tensor_map[(layer.name, 0)] = layer_inputs[0]
+            removed_dropout += 1
+            continue
+
+        if layer.name in foldable:
+            # 직전 레이어에 이미 접힘
+            tensor_map[(layer.name, 0)] = layer_inputs[0]
+            continue
+
+        if layer.name in folded_producers:
+            config = layer.get_config()
+            config['use_bias'] = True
+            folded_layer = layer.__class__.from_config(config)
+            output = folded_layer(layer_inputs[0])
+
+            gamma, beta, moving_mean, moving_variance, epsilon = _batchnorm_params(
+                layers_by_name[folded_producers[layer.name]]
+            )
+            weights = layer.get_weights()
+            kernel = weights[0]
+            bias = weights[1] if len(weights) > 1 else np.zeros_like(moving_mean)
+            folded_layer.set_weights(list(fold_conv_batchnorm(
+                layer_type, kernel, bias, gamma, beta, moving_mean, moving_variance, epsilon
+            )))
+
+            tensor_map[(layer.name, 0)] = output
+            continue
+
+        output = layer(layer_inputs if len(layer_inputs) > 1 else layer_inputs[0])
+        tensor_map[(layer.name, 0)] = output
+
+    outputs = [tensor_map[_tensor_key(tensor)] for tensor in model.outputs]
+    optimized_model = keras.Model(
+        inputs=inputs if len(inputs) > 1 else inputs[0],
+        outputs=outputs if len(outputs) > 1 else outputs[0],
+        name=f"{model.name}_folded"
+    )
+
+    num_batchnorm = sum(1 for layer in model.layers if layer.__class__.__name__ == 'BatchNormalization')
+    report = {
+        'folded_batchnorm': len(foldable),
+        'remaining_batchnorm': num_batchnorm - len(foldable),
+        'removed_dropout': removed_dropout,
+        'original_layers': len(model.layers),
+        'optimized_layers': len(optimized_model.layers),
+        'original_parameters': int(model.count_params()),
+        'optimized_parameters': int(optimized_model.count_params())
+    }
+
+    return optimized_model, report
+
+
+def validate_folded_model(optimized_model, model, inputs, atol=1e-4, min_top1_agreement=1.0):
+    """최적화 모델 출력과 원본 모델 출력 비교
+
+    BatchNorm 접기는 부동소수점 연산 순서를 바꾸므로 최대 오차와 top-1 일치율로 검증합니다.
+    """
+    inputs = np.asarray(inputs, dtype=np.float32)
+    expected = np.asarray(model(inputs, training=False))
+    actual = np.asarray(optimized_model(inputs, training=False))
+
+    max_abs_diff = float(np.max(np.abs(expected - actual)))
+    top1_agreement = float(np.mean(np.argmax(expected, axis=1) == np.argmax(actual, axis=1)))
+
+    return {
+        'num_samples': int(len(inputs)),
+        'bit_exact': bool(np.array_equal(expected, actual)),
+        'max_abs_diff': max_abs_diff,
+        'top1_agreement': top1_agreement,
+        'tolerance': atol,
+        'passed': max_abs_diff <= atol and top1_agreement >= min_top1_agreement
+    }
@@ -0,0 +1,241 @@
+"""
+실시간 추론 엔진
+model.predict 대신 고정 입력 시그니처로 미리 트레이싱한 tf.function을 직접 호출하여
+단일 프레임 추론의 프레임워크 오버헤드를 줄입니다.
+"""
+
+import time
+import numpy as np
+
+
+class KerasInferenceEngine:
+    """Keras 모델을 미리 트레이싱된 tf.function으로 감싼 추론 엔진"""
+
+    backend = 'keras'
+
+    def __init__(self, model, input_shape=(21, 3), use_tf_function=True):
+        import tensorflow as tf
+
+        self._tf = tf
+        self.model = model
+        self.input_shape = tuple(input_shape)
+        self.use_tf_function = use_tf_function
+        self.warmup_time_ms = None
+
+        if use_tf_function:
+            # 배치 크기만 가변인 고정 시그니처 -> 재트레이싱 없음
+            self._forward = tf.function(
+                lambda x: model(x, training=False),
+                input_signature=[tf.TensorSpec(shape=(None,) + self.input_shape, dtype=tf.float32)]
+            )
+        else:
+            self._forward = lambda x: model(x, training=False)
+
+    def warm_up(self, batch_sizes=(1,)):
+        """트레이싱 및 첫 실행 비용을 로드 시점에 미리 지불"""
+        start = time.perf_counter()
+        for batch_size in batch_sizes:
+            self.predict(np.zeros((batch_size,) + self.input_shape, dtype=np.float32))
+        self.warmup_time_ms = (time.perf_counter() - start) * 1000
+        return self.warmup_time_ms
+
+    def predict(self, input_data):
+        """배치 추론 -> (확률 배열, 순수 연산 시간 ms)"""
+        input_tensor = self._tf.convert_to_tensor(input_data, dtype=self._tf.float32)
+
+        start = time.perf_counter()
+        probabilities = self._forward(input_tensor).numpy()
+        compute_time_ms = (time.perf_counter() - start) * 1000
+
+        return probabilities, compute_time_ms
+
+    def memory_bytes(self):
+        """모델 가중치 메모리 (bytes)"""
+        return sum(weight.nbytes for weight in self.model.get_weights())
+
+    def describe(self):
+        """엔진 정보"""
+        return {
+            'backend': self.backend,
+            'tf_function': self.use_tf_function,
+            'warmup_time_ms': self.warmup_time_ms
+        }
+
+
+class FusedInferenceEngine:
+    """여러 Keras 모델을 하나의 tf.function 그래프로 묶은 추론 엔진
+
+    공유 입력 (B, 21, 3)을 받아 모든 모델의 softmax를 한 번의 호출로 반환하므로
+    Python/디스패치 오버헤드를 프레임당 한 번만 지불하고, 모델 간 연산은 TF가 함께 스케줄링합니다.
+    """
+
+    backend = 'fused'
+
+    def __init__(self, models, input_shape=(21, 3)):
+        import tensorflow as tf
+
+        self._tf = tf
+        self.model_files = list(models.keys())
+        self.input_shape = tuple(input_shape)
+        self.warmup_time_ms = None
+
+        model_list = [models[model_file] for model_file in self.model_files]
+        self._forward = tf.function(
+            lambda x: tuple(model(x, training=False) for model in model_list),
+            input_signature=[tf.TensorSpec(shape=(None,) + self.input_shape, dtype=tf.float32)]
+        )
+
+    def warm_up(self, batch_sizes=(1,)):
+        """트레이싱 및 첫 실행 비용을 로드 시점에 미리 지불"""
+        start = time.perf_counter()
+        for batch_size in batch_sizes:
+            self.predict(np.zeros((batch_size,) + self.input_shape, dtype=np.float32))
+        self.warmup_time_ms = (time.perf_counter() - start) * 1000
+        return self.warmup_time_ms
+
+    def predict(self, input_data):
+        """배치 추론 -> ({model_file: 확률 배열}, 순수 연산 시간 ms)"""
+        input_tensor = self._tf.convert_to_tensor(input_data, dtype=self._tf.float32)
+
+        start = time.perf_counter()
+        outputs = self._forward(input_tensor)
+        probabilities = {
+            model_file: output.numpy()
+            for model_file, output in zip(self.model_files, outputs)
+        }
+        compute_time_ms = (time.perf_counter() - start) * 1000
+
+        return probabilities, compute_time_ms
+
+    def describe(self):
+        """엔진 정보"""
+        return {
+            'backend': self.backend,
+            'model_files': self.model_files,
+            'warmup_time_ms': self.warmup_time_ms
+        }
+
+
+class StreamingInferenceEngine:
+    """스트리밍 시퀀스 모델 추론 엔진 (프레임 + 상태 -> 확률 + 새 상태)
+
+    프레임마다 스텝 모델을 한 번만 호출하므로 비용이 윈도우 길이와 무관합니다 (프레임당 O(1)).
+    상태는 엔진이 아닌 호출자(세션)가 보관하므로 여러 세션이 엔진 하나를 공유합니다.
+
+    학습 윈도우(window_length 프레임)보다 긴 문맥을 보지 않도록, 윈도우 상태는 시작 시점이 한 프레임씩
+    엇갈린 window_length 개의 상태를 한 번의 배치 스텝으로 함께 갱신하고, 윈도우 길이에 도달한 상태의 출력을
+    사용한 뒤 빈 상태로 다시 시작합니다 (출력 = 마지막 window_length 프레임 윈도우의 학습 모델 출력).
+    """
+
+    backend = 'keras'
+    streaming = True
+
+    def __init__(self, model, step_model, input_shape=(21, 3), use_tf_function=True, window_length=16):
+        import tensorflow as tf
+
+        self._tf = tf
+        self.model = model
+        self.step_model = step_model
+        self.input_shape = tuple(input_shape)
+        self.window_length = int(window_length)
+        self.state_size = int(step_model.inputs[1].shape[-1])
+        self.use_tf_function = use_tf_function
+        self.warmup_time_ms = None
+
+        if use_tf_function:
+            self._step = tf.function(
+                lambda x, state: step_model([x, state], training=False),
+                input_signature=[
+                    tf.TensorSpec(shape=(None,) + self.input_shape, dtype=tf.float32),
+                    tf.TensorSpec(shape=(None, self.state_size), dtype=tf.float32)
+                ]
+            )
+        else:
+            self._step = lambda x, state: step_model([x, state], training=False)
+
+    def initial_state(self, batch_size=1):
+        """빈 상태 (시퀀스 시작)"""
+        return np.zeros((batch_size, self.state_size), dtype=np.float32)
+
+    def warm_up(self, batch_sizes=(1,)):
+        """트레이싱 및 첫 실행 비용을 로드 시점에 미리 지불"""
+        start = time.perf_counter()
+        for batch_size in batch_sizes:
+            self.predict(np.zeros((batch_size,) + self.input_shape, dtype=np.float32))
+        self.warmup_time_ms = (time.perf_counter() - start) * 1000
+        return self.warmup_time_ms
+
+    def step(self, input_data, state):
+        """프레임 배치 한 스텝 -> (확률 배열, 새 상태, 순수 연산 시간 ms)"""
+        input_tensor = self._tf.convert_to_tensor(input_data, dtype=self._tf.float32)
+        state_tensor = self._tf.convert_to_tensor(state, dtype=self._tf.float32)
+
+        start = time.perf_counter()
+        probabilities, new_state = self._step(input_tensor, state_tensor)
+        probabilities, new_state = probabilities.numpy(), new_state.numpy()
+        compute_time_ms = (time.perf_counter() - start) * 1000
+
+        return probabilities, new_state, compute_time_ms
+
+    def predict(self, input_data):
+        """상태 없는 배치 추론 (각 프레임을 길이 1 시퀀스로 처리) -> (확률 배열, 순수 연산 시간 ms)"""
+        probabilities, _, compute_time_ms = self.step(input_data, self.initial_state(len(input_data)))
+        return probabilities, compute_time_ms
+
+    def start_window(self, frame):
+        """새 녹화 구간의 윈도우 상태 (학습 윈도우처럼 구간 시작은 첫 프레임 (1, 21, 3)을 반복해 채움)
+
+        상태 i 는 첫 프레임을 i 번 본 상태로 시작하므로, 구간의 k 번째 프레임 출력은
+        [첫 프레임] * (window_length - k) + 구간 프레임 윈도우의 출력과 같습니다.
+        """
+        states = [self.initial_state()]
+        for _ in range(self.window_length - 1):
+            _, state, _ = self.step(frame, states[-1])
+            states.append(state)
+        return {
+            'states': np.concatenate(states),
+            'steps': np.arange(self.window_length)
+        }
+
+    def step_window(self, input_data, window):
+        """윈도우 상태로 프레임 한 스텝 -> (확률 배열, 새 윈도우 상태, 순수 연산 시간 ms)"""
+        probabilities, states, compute_time_ms = self.step(
+            np.repeat(input_data, self.window_length, axis=0), window['states']
+        )
+        steps = window['steps'] + 1
+
+        # 윈도우 길이에 도달한 상태가 응답하고 빈 상태로 다시 시작
+        ready = int(np.argmax(steps))
+        states = np.where((steps == self.window_length)[:, np.newaxis], 0.0, states).astype(np.float32)
+        steps[ready] = 0
+
+        return probabilities[ready:ready + 1], {'states': states, 'steps': steps}, compute_time_ms
+
+    def predict_sequence(self, frames, window=None):
+        """순서가 있는 프레임 (N, 21, 3)을 하나의 녹화 구간으로 추론 -> (프레임별 확률, 윈도우 상태, 순수 연산 시간 ms)
+
+        프레임마다 마지막 window_length 프레임 윈도우의 출력이며, 윈도우 상태를 넘기면 이어서 추론합니다.
+        """
+        window = self.start_window(frames[:1]) if window is None else window
+        outputs = []
+        compute_time_ms = 0.0
+        for frame in frames:
+            probabilities, window, step_time_ms = self.step_window(frame[np.newaxis, ...], window)
+            outputs.append(probabilities[0])
+            compute_time_ms += step_time_ms
+        return np.stack(outputs), window, compute_time_ms
+
+    def memory_bytes(self):
+        """모델 가중치 메모리 (bytes, 스텝 모델은 가중치를 공유)"""
+        return sum(weight.nbytes for weight in self.model.get_weights())
+
+    def describe(self):
+        """엔진 정보"""
+        return {
+            'backend': self.backend,
+            'streaming': True,
+            'state_size': self.state_size,
+            'window_length': self.window_length,
+            'tf_function': self.use_tf_function,
+            'warmup_time_ms': self.warmup_time_ms
+        }
@@ -0,0 +1,123 @@
+"""
+지연 import 유틸리티
+TensorFlow, scikit-learn, 모델 모듈을 처음 사용할 때 로드하고
+서버 시작 시간 구성을 기록합니다.
+"""
+
+import importlib
+import importlib.util
+import threading
+import time
+from collections.abc import Mapping
+
+
+class StartupProfiler:
+    """서버 시작/지연 import 단계별 소요 시간 기록"""
+
+    def __init__(self, start_time=None):
+        self.start_time = start_time if start_time is not None else time.time()
+        self._lock = threading.Lock()
+        self._phases = []
+        self.ready_time = None
+
+    def record(self, name, duration, category='startup'):
+        """단계 소요 시간 기록"""
+        with self._lock:
+            self._phases.append({
+                'name': name,
+                'category': category,
+                'duration_ms': duration * 1000,
+                'at_ms': (time.time() - self.start_time) * 1000
+            })
+
+    def mark_ready(self):
+        """요청 처리 가능 시점 기록"""
+        self.ready_time = time.time()
+
+    def report(self):
+        """단계별 소요 시간 리포트"""
+        with self._lock:
+            phases = list(self._phases)
+        return {
+            'time_to_ready_ms': (self.ready_time - self.start_time) * 1000 if self.ready_time else None,
+            'uptime_s': time.time() - self.start_time,
+            'phases': phases
+        }
+
+
+STARTUP_PROFILER = StartupProfiler()
+
+
+class LazyModule:
+    """처음 속성에 접근할 때 import 되는 모듈 프록시"""
+
+    def __init__(self, name, loader=None, depends=()):
+        self._name = name
+        self._loader = loader
+        self._depends = depends
+        self._module = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """모듈 로드 (이미 로드된 경우 캐시 반환)"""
+        if self._module is None:
+            for dependency in self._depends:
+                dependency.load()
+
+            with self._lock:
+                if self._module is None:
+                    start = time.time()
+                    if self._loader is not None:
+                        module = self._loader()
+                    else:
+                        module = importlib.import_module(self._name)
+                    STARTUP_PROFILER.record(self._name, time.time() - start, category='lazy_import')
+                    self._module = module
+        return self._module
+
+    @property
+    def is_loaded(self):
+        return self._module is not None
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+    def __repr__(self):
+        state = 'loaded' if self.is_loaded else 'not loaded'
+        return f"<LazyModule '{self._name}' ({state})>"
+
+
+class LazyClassRegistry(Mapping):
+    """키 -> 'module:ClassName' 매핑을 가진 지연 로드 클래스 레지스트리"""
+
+    def __init__(self, class_paths, depends=()):
+        self._class_paths = dict(class_paths)
+        self._depends = depends
+        self._modules = {}
+
+    def module_name(self, key):
+        return self._class_paths[key].split(':')[0]
+
+    def source_file(self, key):
+        """클래스를 import 하지 않고 소스 파일 경로 조회"""
+        spec = importlib.util.find_spec(self.module_name(key))
+        return spec.origin if spec else None
+
+    def is_loaded(self, key):
+        module = self._modules.get(self.module_name(key))
+        return module is not None and module.is_loaded
+
+    def __getitem__(self, key):
+        module_name, class_name = self._class_paths[key].split(':')
+        if module_name not in self._modules:
+            self._modules[module_name] = LazyModule(module_name, depends=self._depends)
+        return getattr(self._modules[module_name], class_name)
+
+    def __contains__(self, key):
+        return key in self._class_paths
+
+    def __iter__(self):
+        return iter(self._class_paths)
+
+    def __len__(self):
+        return len(self._class_paths)
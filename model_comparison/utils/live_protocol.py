@@ -0,0 +1,160 @@
+"""
+실시간 추론 바이너리 프로토콜
+WebSocket 스트리밍 프레임: [seq: uint32 LE][랜드마크 (21, 3) float32 LE = 252 bytes]
+HTTP 요청: application/octet-stream (랜드마크 252 bytes, 배치는 N x 252 bytes) 또는 application/msgpack
+HTTP 응답: application/octet-stream 또는 application/msgpack (top-k 인덱스 + float16 점수)
+"""
+
+import struct
+import numpy as np
+
+try:
+    import msgpack
+except ImportError:  # MessagePack 형식 비활성화 (JSON/바이너리만 사용)
+    msgpack = None
+
+
+LANDMARK_SHAPE = (21, 3)
+LANDMARK_FRAME_BYTES = LANDMARK_SHAPE[0] * LANDMARK_SHAPE[1] * 4
+FRAME_HEADER = struct.Struct('<I')
+STREAM_FRAME_BYTES = FRAME_HEADER.size + LANDMARK_FRAME_BYTES
+
+
+def decode_stream_frame(message):
+    """스트리밍 프레임 -> (seq, (21, 3) float32 랜드마크)"""
+    if len(message) != STREAM_FRAME_BYTES:
+        raise ValueError(f'Invalid frame size: {len(message)} bytes (expected {STREAM_FRAME_BYTES})')
+
+    (seq,) = FRAME_HEADER.unpack_from(message)
+    landmarks = np.frombuffer(message, dtype='<f4', offset=FRAME_HEADER.size).reshape(LANDMARK_SHAPE)
+    return seq, landmarks
+
+
+def encode_stream_frame(seq, landmarks):
+    """(seq, 랜드마크) -> 스트리밍 프레임 (클라이언트/벤치마크용)"""
+    payload = np.asarray(landmarks, dtype='<f4').reshape(LANDMARK_SHAPE).tobytes()
+    return FRAME_HEADER.pack(seq & 0xFFFFFFFF) + payload
+
+
+MIME_JSON = 'application/json'
+MIME_BINARY = 'application/octet-stream'
+MIME_MSGPACK = 'application/msgpack'
+MSGPACK_MIMETYPES = (MIME_MSGPACK, 'application/x-msgpack')
+
+# 바이너리 응답: 헤더 [version uint16][num_models uint16][k uint16][preprocess_ms f32][total_ms f32]
+#               모델별 [success uint8][inference_ms f32][top-k 인덱스 uint16 x k][top-k 점수 float16 x k]
+BINARY_RESPONSE_VERSION = 1
+RESPONSE_HEADER = struct.Struct('<HHHff')
+MODEL_RESULT_HEADER = struct.Struct('<Bf')
+MISSING_INDEX = 0xFFFF
+
+
+def response_mimetypes():
+    """지원하는 응답 형식 (첫 번째가 기본값)"""
+    mimetypes = [MIME_JSON, MIME_BINARY]
+    if msgpack is not None:
+        mimetypes.extend(MSGPACK_MIMETYPES)
+    return mimetypes
+
+
+def decode_landmark_payload(body):
+    """application/octet-stream 요청 본문 -> (21, 3) float32 랜드마크"""
+    if len(body) != LANDMARK_FRAME_BYTES:
+        raise ValueError(f'Invalid payload size: {len(body)} bytes (expected {LANDMARK_FRAME_BYTES})')
+    return np.frombuffer(body, dtype='<f4').reshape(LANDMARK_SHAPE)
+
+
+def decode_landmark_batch_payload(body):
+    """application/octet-stream 배치 요청 본문 (N x 252 bytes) -> (N, 21, 3) float32 랜드마크"""
+    if len(body) == 0 or len(body) % LANDMARK_FRAME_BYTES != 0:
+        raise ValueError(f'Invalid payload size: {len(body)} bytes (expected a multiple of {LANDMARK_FRAME_BYTES})')
+    return np.frombuffer(body, dtype='<f4').reshape((-1,) + LANDMARK_SHAPE)
+
+
+def decode_msgpack_request(body):
+    """application/msgpack 요청 본문 -> 랜드마크 ({'landmarks': 중첩 리스트 또는 252 bytes})"""
+    if msgpack is None:
+        raise ValueError('MessagePack is not available')
+
+    payload = msgpack.unpackb(body)
+    if not isinstance(payload, dict):
+        raise ValueError('MessagePack body must be a map')
+    landmarks = payload.get('landmarks')
+    if isinstance(landmarks, (bytes, bytearray)):
+        return decode_landmark_payload(landmarks)
+    return landmarks
+
+
+def _top_k_arrays(prediction, k):
+    """예측 결과 -> (uint16 인덱스, float16 점수) 길이 k 배열"""
+    indices = np.full(k, MISSING_INDEX, dtype='<u2')
+    scores = np.zeros(k, dtype='<f2')
+    if prediction.get('success'):
+        top_indices = prediction['top_indices'][:k]
+        indices[:len(top_indices)] = top_indices
+        scores[:len(top_indices)] = [item['confidence'] for item in prediction['top_5'][:k]]
+    return indices, scores
+
+
+def encode_predictions_binary(predictions, model_files, preprocess_time_ms, total_time_ms, k=5):
+    """예측 결과 -> 바이너리 응답 (모델 순서는 model_files)"""
+    chunks = [RESPONSE_HEADER.pack(
+        BINARY_RESPONSE_VERSION, len(model_files), k, preprocess_time_ms, total_time_ms
+    )]
+    for model_file in model_files:
+        prediction = predictions.get(model_file, {})
+        indices, scores = _top_k_arrays(prediction, k)
+        chunks.append(MODEL_RESULT_HEADER.pack(
+            1 if prediction.get('success') else 0, prediction.get('inference_time_ms', 0.0)
+        ))
+        chunks.append(indices.tobytes())
+        chunks.append(scores.tobytes())
+    return b''.join(chunks)
+
+
+def decode_predictions_binary(body):
+    """바이너리 응답 -> 딕셔너리 (클라이언트/벤치마크용)"""
+    version, num_models, k, preprocess_time_ms, total_time_ms = RESPONSE_HEADER.unpack_from(body)
+    offset = RESPONSE_HEADER.size
+    models = []
+    for _ in range(num_models):
+        success, inference_time_ms = MODEL_RESULT_HEADER.unpack_from(body, offset)
+        offset += MODEL_RESULT_HEADER.size
+        indices = np.frombuffer(body, dtype='<u2', count=k, offset=offset)
+        offset += 2 * k
+        scores = np.frombuffer(body, dtype='<f2', count=k, offset=offset)
+        offset += 2 * k
+        models.append({
+            'success': bool(success),
+            'inference_time_ms': inference_time_ms,
+            'top_indices': indices[indices != MISSING_INDEX].tolist(),
+            'top_scores': scores[indices != MISSING_INDEX].astype(np.float32).tolist()
+        })
+    return {
+        'version': version,
+        'preprocess_time_ms': preprocess_time_ms,
+        'total_time_ms': total_time_ms,
+        'models': models
+    }
+
+
+def encode_predictions_msgpack(predictions, model_files, preprocess_time_ms, total_time_ms, k=5):
+    """예측 결과 -> MessagePack 응답 (점수는 float16 바이트)"""
+    models = []
+    for model_file in model_files:
+        prediction = predictions.get(model_file, {})
+        indices, scores = _top_k_arrays(prediction, k)
+        valid = indices != MISSING_INDEX
+        models.append({
+            'model_file': model_file,
+            'success': bool(prediction.get('success')),
+            'inference_time_ms': prediction.get('inference_time_ms', 0.0),
+            'top_indices': indices[valid].tolist(),
+            'top_scores': scores[valid].tobytes()
+        })
+    return msgpack.packb({
+        'success': True,
+        'preprocess_time_ms': preprocess_time_ms,
+        'total_time_ms': total_time_ms,
+        'models': models
+    })
@@ -0,0 +1,248 @@
+"""
+실시간 추론 세션 상태
+클라이언트(세션)별로 마지막으로 추론한 정규화 프레임과 예측 결과를 유지하고,
+손이 거의 움직이지 않은 프레임은 모델을 다시 실행하지 않고 이전 결과를 재사용합니다.
+추론이 밀리면 세션당 대기 슬롯 하나만 두고 더 새로운 프레임이 오래된 대기 프레임을 대체합니다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+
+class FrameGate:
+    """움직임 기반 프레임 게이트 (마지막으로 추론한 프레임과 비교)
+
+    이전 프레임이 아닌 마지막 추론 프레임과 비교하므로 느린 이동도 누적되어 결국 재추론됩니다.
+    max_reuse_age_s 가 지나면 움직임과 관계없이 재추론합니다.
+    """
+
+    def __init__(self, motion_threshold=0.02, max_reuse_age_s=1.0):
+        self.motion_threshold = float(motion_threshold)
+        self.max_reuse_age_s = float(max_reuse_age_s)
+        self.frames = 0
+        self.reused = 0
+
+        self._last_input = None
+        self._last_predictions = None
+        self._last_version = None
+        self._last_inferred_at = 0.0
+        self._lock = threading.Lock()
+
+    def check(self, input_data, model_set_version):
+        """재사용 가능한 예측 결과 조회 -> (예측 결과 또는 None, 움직임 크기)"""
+        with self._lock:
+            self.frames += 1
+            if self._last_input is None:
+                return None, None
+
+            motion = float(np.max(np.abs(input_data - self._last_input)))
+            if (
+                self.motion_threshold <= 0
+                or motion >= self.motion_threshold
+                or model_set_version != self._last_version
+                or time.perf_counter() - self._last_inferred_at > self.max_reuse_age_s
+            ):
+                return None, motion
+
+            self.reused += 1
+            return self._last_predictions, motion
+
+    def update(self, input_data, model_set_version, predictions):
+        """추론 결과 저장 (실패한 모델이 있으면 재사용하지 않음)"""
+        with self._lock:
+            if not all(prediction.get('success') for prediction in predictions.values()):
+                self._last_input = None
+                return
+            self._last_input = np.array(input_data, dtype=np.float32)
+            self._last_predictions = predictions
+            self._last_version = model_set_version
+            self._last_inferred_at = time.perf_counter()
+
+    def stats(self):
+        return {
+            'frames': self.frames,
+            'reused': self.reused,
+            'skip_ratio': self.reused / self.frames if self.frames else 0.0
+        }
+
+
+class LatestFrameMailbox:
+    """세션당 단일 슬롯 메일박스 (latest-frame-wins 백프레셔)
+
+    세션별로 추론은 한 번에 하나만 실행하고, 실행 중에 도착한 프레임은 슬롯 하나에서 대기합니다.
+    대기 중에 더 새로운 프레임이 오면 기존 대기 프레임은 대체(superseded)되어 즉시 반환되므로
+    지연 시간은 처리 중 1개 + 대기 1개 이하로 제한됩니다.
+    """
+
+    def __init__(self):
+        self.admitted = 0
+        self.waited = 0
+        self.superseded = 0
+        self.timed_out = 0
+
+        self._busy = False
+        self._waiting_ticket = None
+        self._next_ticket = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, timeout=None):
+        """추론 차례 획득 -> (결과, 대기 시간 ms, 대기 여부)
+
+        결과는 'admitted' (획득), 'superseded' (더 새로운 프레임에 대체), 'timed_out' (대기 시간 초과)이며
+        획득하지 못한 경우는 release를 호출하지 않습니다.
+        """
+        start = time.perf_counter()
+        with self._cond:
+            if not self._busy:
+                self._busy = True
+                self.admitted += 1
+                return 'admitted', 0.0, False
+
+            # 슬롯에 대기 중인 이전 프레임이 있으면 대체
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            if self._waiting_ticket is not None:
+                self.superseded += 1
+            self._waiting_ticket = ticket
+            self.waited += 1
+            self._cond.notify_all()
+
+            deadline = None if timeout is None else start + timeout
+            while True:
+                if self._waiting_ticket != ticket:
+                    return 'superseded', (time.perf_counter() - start) * 1000, True
+                if not self._busy:
+                    self._busy = True
+                    self._waiting_ticket = None
+                    self.admitted += 1
+                    return 'admitted', (time.perf_counter() - start) * 1000, True
+
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    self._waiting_ticket = None
+                    self.timed_out += 1
+                    return 'timed_out', (time.perf_counter() - start) * 1000, True
+                self._cond.wait(remaining)
+
+    def record_superseded(self, count):
+        """외부에서 버린 프레임 수 기록 (WebSocket 수신 버퍼 정리)"""
+        with self._cond:
+            self.superseded += count
+
+    def release(self):
+        """추론 완료 (대기 프레임 깨우기)"""
+        with self._cond:
+            self._busy = False
+            self._cond.notify_all()
+
+    def stats(self):
+        return {
+            'admitted': self.admitted,
+            'waited': self.waited,
+            'superseded': self.superseded,
+            'timed_out': self.timed_out
+        }
+
+
+class LiveSession:
+    """클라이언트별 실시간 추론 상태"""
+
+    def __init__(self, session_id, motion_threshold=0.02, max_reuse_age_s=1.0):
+        self.session_id = session_id
+        self.gate = FrameGate(motion_threshold, max_reuse_age_s)
+        self.mailbox = LatestFrameMailbox()
+        self.created_at = time.time()
+        self.last_seen = self.created_at
+
+        # 스트리밍 시퀀스 모델의 모델별 윈도우 상태 + 마지막 프레임 시각 (모델 세트가 바뀌면 초기화)
+        self._stream_states = {}
+        self._stream_version = None
+
+    def get_stream_states(self, model_set_version):
+        """모델 파일 -> 스트리밍 상태 딕셔너리 (세션 내 추론은 메일박스로 직렬화되므로 잠금 불필요)"""
+        if model_set_version != self._stream_version:
+            self._stream_states = {}
+            self._stream_version = model_set_version
+        return self._stream_states
+
+
+class LiveSessionStore:
+    """세션 저장소 (최대 개수 초과 또는 유휴 시간 초과 시 오래된 세션부터 제거, 스레드 안전)"""
+
+    def __init__(self, max_sessions=256, idle_timeout_s=300.0, motion_threshold=0.02, max_reuse_age_s=1.0):
+        self.max_sessions = int(max_sessions)
+        self.idle_timeout_s = float(idle_timeout_s)
+        self.motion_threshold = float(motion_threshold)
+        self.max_reuse_age_s = float(max_reuse_age_s)
+
+        # 제거된 세션 통계도 전체 재사용 비율/대체 프레임 수에 포함
+        self._retired_frames = 0
+        self._retired_reused = 0
+        self._retired_superseded = 0
+
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id):
+        """세션 조회 (없으면 생성, 최근 사용으로 이동)"""
+        now = time.time()
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = LiveSession(session_id, self.motion_threshold, self.max_reuse_age_s)
+                self._sessions[session_id] = session
+            self._sessions.move_to_end(session_id)
+            session.last_seen = now
+            self._expire(now)
+            return session
+
+    def _expire(self, now):
+        """유휴/초과 세션 제거 (잠금 보유 상태에서 호출)"""
+        for session_id in list(self._sessions):
+            session = self._sessions[session_id]
+            if len(self._sessions) <= self.max_sessions and now - session.last_seen <= self.idle_timeout_s:
+                break
+            self._retire(self._sessions.pop(session_id))
+
+    def _retire(self, session):
+        self._retired_frames += session.gate.frames
+        self._retired_reused += session.gate.reused
+        self._retired_superseded += session.mailbox.superseded
+
+    def discard(self, session_id):
+        """세션 제거 (WebSocket 연결 종료 시)"""
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+            if session is not None:
+                self._retire(session)
+
+    def stats(self):
+        """세션 수와 전체/세션별 재사용 비율, 백프레셔로 대체된 프레임 수"""
+        with self._lock:
+            sessions = {
+                session_id: {
+                    **session.gate.stats(),
+                    'backpressure': session.mailbox.stats(),
+                    'last_seen': session.last_seen
+                }
+                for session_id, session in reversed(self._sessions.items())
+            }
+            frames = self._retired_frames + sum(s['frames'] for s in sessions.values())
+            reused = self._retired_reused + sum(s['reused'] for s in sessions.values())
+            superseded = self._retired_superseded + sum(
+                s['backpressure']['superseded'] for s in sessions.values()
+            )
+
+        return {
+            'motion_threshold': self.motion_threshold,
+            'max_reuse_age_s': self.max_reuse_age_s,
+            'num_sessions': len(sessions),
+            'frames': frames,
+            'reused': reused,
+            'skip_ratio': reused / frames if frames else 0.0,
+            'superseded': superseded,
+            'sessions': sessions
+        }
@@ -0,0 +1,186 @@
+"""
+동적 마이크로 배칭 스케줄러
+여러 요청 스레드의 단일 프레임을 짧은 시간 창 안에서 모아 한 번의 배치 추론으로 처리하고
+결과를 각 요청 스레드에 돌려줍니다.
+"""
+
+import queue
+import threading
+import time
+import numpy as np
+
+
+QUEUE_WAIT_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 25, 50, 100)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+
+class Histogram:
+    """고정 구간 히스토그램 (스레드 안전)"""
+
+    def __init__(self, bounds):
+        self.bounds = tuple(bounds)
+        self._counts = [0] * (len(self.bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        """값 기록"""
+        index = len(self.bounds)
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                index = i
+                break
+
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            self._max = max(self._max, value)
+
+    def snapshot(self):
+        """현재 분포 조회"""
+        with self._lock:
+            counts = list(self._counts)
+            count, total, maximum = self._count, self._sum, self._max
+
+        buckets = [{'le': bound, 'count': n} for bound, n in zip(self.bounds, counts)]
+        buckets.append({'le': 'inf', 'count': counts[-1]})
+        return {
+            'count': count,
+            'mean': total / count if count else 0.0,
+            'max': maximum,
+            'buckets': buckets
+        }
+
+
+class _PendingRequest:
+    """배치 대기 중인 단일 요청"""
+
+    __slots__ = ('sample', 'enqueue_time', 'event', 'result', 'error', 'info')
+
+    def __init__(self, sample):
+        self.sample = sample
+        self.enqueue_time = time.perf_counter()
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.info = None
+
+
+class MicroBatcher:
+    """모델별 마이크로 배칭 스케줄러 (전용 워커 스레드 1개)"""
+
+    def __init__(self, engine, window_ms=2.0, max_batch_size=16, name='micro-batcher'):
+        self.engine = engine
+        self.window_ms = float(window_ms)
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.queue_wait_histogram = Histogram(QUEUE_WAIT_BUCKETS_MS)
+        self.batch_size_histogram = Histogram(BATCH_SIZE_BUCKETS)
+        self.num_batches = 0
+        self.num_requests = 0
+
+        self._queue = queue.Queue()
+        self._stopped = False
+        # submit 의 확인/등록과 stop 을 직렬화 (종료 후 큐에 들어간 요청이 응답 없이 남지 않도록)
+        self._submit_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, sample, timeout=None):
+        """단일 샘플 추론 요청 -> (확률 벡터, 배치 정보). 결과가 나올 때까지 대기"""
+        pending = _PendingRequest(sample)
+        with self._submit_lock:
+            if self._stopped:
+                raise RuntimeError('Micro-batcher is stopped')
+            self._queue.put(pending)
+
+        if not pending.event.wait(timeout):
+            raise TimeoutError('Micro-batch inference timed out')
+        if pending.error is not None:
+            raise pending.error
+
+        return pending.result, pending.info
+
+    def _collect_batch(self, first):
+        """첫 요청 도착 후 시간 창 또는 최대 배치 크기까지 요청 수집"""
+        batch = [first]
+        deadline = first.enqueue_time + self.window_ms / 1000
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                pending = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if pending is None:
+                self._stopped = True
+                break
+            batch.append(pending)
+
+        return batch
+
+    def _run(self):
+        while not self._stopped:
+            first = self._queue.get()
+            if first is None:
+                break
+
+            batch = self._collect_batch(first)
+            dispatch_time = time.perf_counter()
+
+            try:
+                inputs = np.stack([pending.sample for pending in batch]).astype(np.float32)
+                probabilities, compute_time_ms = self.engine.predict(inputs)
+            except Exception as e:
+                for pending in batch:
+                    pending.error = e
+                    pending.event.set()
+                continue
+
+            self.num_batches += 1
+            self.num_requests += len(batch)
+            self.batch_size_histogram.observe(len(batch))
+
+            # 결과를 각 요청 스레드로 분배
+            for i, pending in enumerate(batch):
+                queue_wait_ms = (dispatch_time - pending.enqueue_time) * 1000
+                self.queue_wait_histogram.observe(queue_wait_ms)
+                pending.result = probabilities[i]
+                pending.info = {
+                    'batch_size': len(batch),
+                    'queue_wait_ms': queue_wait_ms,
+                    'compute_time_ms': compute_time_ms
+                }
+                pending.event.set()
+
+        # 종료 시 남은 요청 실패 처리
+        while True:
+            try:
+                pending = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if pending is not None:
+                pending.error = RuntimeError('Micro-batcher is stopped')
+                pending.event.set()
+
+    def stop(self):
+        """워커 스레드 종료 (이후 submit 은 즉시 실패, 대기 중인 요청은 워커가 실패 처리)"""
+        with self._submit_lock:
+            self._stopped = True
+            self._queue.put(None)
+
+    def stats(self):
+        """배칭 통계 (대기 시간/배치 크기 히스토그램)"""
+        return {
+            'window_ms': self.window_ms,
+            'max_batch_size': self.max_batch_size,
+            'num_batches': self.num_batches,
+            'num_requests': self.num_requests,
+            'avg_batch_size': self.num_requests / self.num_batches if self.num_batches else 0.0,
+            'queue_wait_ms': self.queue_wait_histogram.snapshot(),
+            'batch_size': self.batch_size_histogram.snapshot()
+        }
@@ -0,0 +1,143 @@
+"""
+실시간 추론용 모델 캐시
+로드된 모델/추론 엔진을 키별로 유지하고, 메모리 예산을 넘으면
+가장 오래 사용하지 않은 항목부터 해제합니다 (LRU).
+"""
+
+import gc
+import threading
+import time
+from collections import OrderedDict
+
+
+class ModelCache:
+    """메모리 예산 기반 LRU 모델 캐시 (스레드 안전)"""
+
+    def __init__(self, max_memory_mb=1024.0):
+        self.max_memory_mb = float(max_memory_mb)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def _get_key_lock(self, key):
+        with self._lock:
+            if key not in self._key_locks:
+                self._key_locks[key] = threading.Lock()
+            return self._key_locks[key]
+
+    def _lookup(self, key):
+        """캐시 조회 (적중 시 최근 사용으로 이동)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                entry['hits'] += 1
+                entry['last_used'] = time.time()
+                self.hits += 1
+            return entry
+
+    def get_or_load(self, key, loader, pinned=()):
+        """캐시된 항목 반환, 없으면 loader()로 로드 -> (항목, 적중 여부)
+
+        loader는 'memory_mb' 키를 포함한 딕셔너리를 반환하며, 그대로 캐시 항목에 저장됩니다.
+        같은 키는 동시에 한 번만 로드하며, pinned 키는 예산 초과 시에도 해제하지 않습니다.
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            return entry, True
+
+        with self._get_key_lock(key):
+            # 다른 스레드가 먼저 로드했을 수 있음
+            entry = self._lookup(key)
+            if entry is not None:
+                return entry, True
+
+            start = time.perf_counter()
+            loaded = loader()
+            entry = {
+                **loaded,
+                'key': key,
+                'load_time_ms': (time.perf_counter() - start) * 1000,
+                'hits': 0,
+                'last_used': time.time()
+            }
+
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = entry
+                self._evict(pinned=set(pinned) | {key})
+
+        return entry, False
+
+    def _evict(self, pinned):
+        """예산을 넘는 동안 LRU 순서로 해제 (pinned 제외, 잠금 보유 상태에서 호출)"""
+        evicted = []
+        for key in list(self._entries):
+            if self._total_memory_mb() <= self.max_memory_mb:
+                break
+            if key in pinned:
+                continue
+            evicted.append(self._entries.pop(key))
+            self.evictions += 1
+
+        if evicted:
+            del evicted
+            gc.collect()
+
+    def _total_memory_mb(self):
+        return sum(entry['memory_mb'] for entry in self._entries.values())
+
+    def set_budget(self, max_memory_mb, pinned=()):
+        """메모리 예산 변경 (즉시 해제 적용)"""
+        with self._lock:
+            self.max_memory_mb = float(max_memory_mb)
+            self._evict(pinned=set(pinned))
+
+    def discard_prefix(self, prefix):
+        """키가 prefix로 시작하는 항목 해제 (모델 파일 삭제 시)"""
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+        gc.collect()
+
+    def clear(self):
+        """전체 해제"""
+        with self._lock:
+            self._entries.clear()
+        gc.collect()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def stats(self):
+        """적중/미스/해제 횟수 및 항목별 메모리"""
+        with self._lock:
+            entries = [
+                {
+                    'key': entry['key'],
+                    'memory_mb': entry['memory_mb'],
+                    'load_time_ms': entry['load_time_ms'],
+                    'warmup_time_ms': entry.get('warmup_time_ms'),
+                    'hits': entry['hits'],
+                    'last_used': entry['last_used']
+                }
+                for entry in reversed(self._entries.values())
+            ]
+            total_memory_mb = self._total_memory_mb()
+
+        lookups = self.hits + self.misses
+        return {
+            'max_memory_mb': self.max_memory_mb,
+            'total_memory_mb': total_memory_mb,
+            'num_entries': len(entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': entries
+        }
@@ -0,0 +1,138 @@
+"""
+모델 아키텍처 메타데이터 캐시
+파라미터 수와 FLOPs를 (모델, 클래스 수, 입력 형태)별로 한 번만 계산하고
+디스크에 저장해 재사용합니다.
+"""
+
+import gc
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class ModelMetadataCache:
+    """모델 아키텍처 메타데이터(파라미터 수, FLOPs) 캐시"""
+
+    def __init__(self, cache_file):
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._entries = self._load()
+        self._warmup_thread = None
+
+    def _load(self):
+        """디스크에서 캐시 로드"""
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f).get('entries', {})
+            except (OSError, ValueError):
+                return {}
+        return {}
+
+    def _save(self):
+        """캐시를 디스크에 저장 (임시 파일 후 교체)"""
+        tmp_file = self.cache_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'entries': self._entries}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, self.cache_file)
+
+    @staticmethod
+    def make_key(model_key, num_classes, input_shape):
+        """캐시 키 생성"""
+        shape = 'x'.join(str(dim) for dim in input_shape)
+        return f"{model_key}|{num_classes}|{shape}"
+
+    @staticmethod
+    def architecture_version(model_classes, model_key):
+        """모델 소스 파일 해시 (아키텍처가 바뀌면 캐시 무효화, 모델 import 불필요)"""
+        try:
+            with open(model_classes.source_file(model_key), 'rb') as f:
+                return hashlib.sha1(f.read()).hexdigest()[:12]
+        except (OSError, TypeError):
+            return None
+
+    def _get_key_lock(self, cache_key):
+        with self._lock:
+            if cache_key not in self._key_locks:
+                self._key_locks[cache_key] = threading.Lock()
+            return self._key_locks[cache_key]
+
+    def get(self, model_classes, model_key, num_classes, input_shape):
+        """캐시된 메타데이터 조회 (없거나 오래된 경우 None)"""
+        cache_key = self.make_key(model_key, num_classes, input_shape)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+        if entry and entry.get('architecture_version') == self.architecture_version(model_classes, model_key):
+            return entry
+        return None
+
+    def get_or_compute(self, model_classes, model_key, num_classes, input_shape):
+        """캐시된 메타데이터 반환, 없으면 계산 (같은 키는 한 번만 계산)"""
+        entry = self.get(model_classes, model_key, num_classes, input_shape)
+        if entry is not None:
+            return entry
+
+        cache_key = self.make_key(model_key, num_classes, input_shape)
+        with self._get_key_lock(cache_key):
+            # 다른 스레드(워밍업)가 먼저 계산했을 수 있음
+            entry = self.get(model_classes, model_key, num_classes, input_shape)
+            if entry is not None:
+                return entry
+            return self._compute(cache_key, model_classes, model_key, num_classes, input_shape)
+
+    def _compute(self, cache_key, model_classes, model_key, num_classes, input_shape):
+        """모델을 한 번 생성하여 메타데이터 계산 후 그래프 해제"""
+        start_time = time.time()
+        model_class = model_classes[model_key]
+
+        from .resource_monitor import ResourceMonitor
+        model_instance = model_class(num_classes=num_classes, input_shape=tuple(input_shape))
+        model = model_instance.build_model()
+
+        parameters = int(model.count_params())
+        try:
+            flops = ResourceMonitor().calculate_flops(model, tuple(model_instance.input_shape))
+            flops = int(flops) if flops else None
+        except Exception:
+            flops = None
+
+        entry = {
+            'key': model_key,
+            'name': model_instance.name,
+            'parameters': parameters,
+            'flops': flops,
+            'num_classes': num_classes,
+            'input_shape': list(input_shape),
+            'architecture_version': self.architecture_version(model_classes, model_key),
+            'compute_time_s': time.time() - start_time
+        }
+
+        # 메타데이터 계산용 그래프 해제
+        del model, model_instance, model_class
+        gc.collect()
+
+        with self._lock:
+            self._entries[cache_key] = entry
+            self._save()
+
+        return entry
+
+    def warm_up(self, model_classes, num_classes, input_shape, background=True):
+        """모든 모델의 메타데이터를 미리 계산 (기본: 백그라운드 스레드)"""
+        def run():
+            for model_key in model_classes:
+                try:
+                    self.get_or_compute(model_classes, model_key, num_classes, input_shape)
+                except Exception as e:
+                    print(f"메타데이터 계산 실패 ({model_key}): {e}")
+
+        if not background:
+            run()
+            return None
+
+        self._warmup_thread = threading.Thread(target=run, name='model-metadata-warmup', daemon=True)
+        self._warmup_thread.start()
+        return self._warmup_thread
@@ -0,0 +1,264 @@
+"""
+NumPy 추론 백엔드 (Dense 구조 모델 전용)
+Flatten + Dense/BatchNormalization/Activation/Dropout 으로 구성된 모델(Baseline, SLIVE)의
+BatchNorm을 직전 Dense에 접어 넣고 Dropout을 제거한 가중치 팩을 만들고,
+TensorFlow 없이 NumPy만으로 배치 추론합니다.
+"""
+
+import json
+import time
+import numpy as np
+
+
+WEIGHT_PACK_VERSION = 1
+SUPPORTED_ACTIVATIONS = ('linear', 'relu', 'sigmoid', 'tanh', 'swish', 'softmax')
+
+
+def _activation_name(activation):
+    """Keras activation 객체/문자열 -> 이름"""
+    if activation is None:
+        return 'linear'
+    if isinstance(activation, str):
+        return activation
+    return getattr(activation, '__name__', str(activation))
+
+
+def fold_dense_batchnorm(kernel, bias, gamma, beta, moving_mean, moving_variance, epsilon):
+    """BatchNorm(Dense(x)) == Dense'(x) 가 되도록 가중치 변환"""
+    scale = gamma / np.sqrt(moving_variance + epsilon)
+    folded_kernel = kernel * scale[np.newaxis, :]
+    folded_bias = (bias - moving_mean) * scale + beta
+    return folded_kernel.astype(np.float32), folded_bias.astype(np.float32)
+
+
+def _batchnorm_params(layer):
+    """BatchNormalization 레이어의 (gamma, beta, mean, variance, epsilon)"""
+    config = layer.get_config()
+    weights = layer.get_weights()
+    num_features = weights[-1].shape[0]
+
+    index = 0
+    gamma = np.ones(num_features, dtype=np.float32)
+    beta = np.zeros(num_features, dtype=np.float32)
+    if config.get('scale', True):
+        gamma = weights[index]
+        index += 1
+    if config.get('center', True):
+        beta = weights[index]
+        index += 1
+    moving_mean, moving_variance = weights[index], weights[index + 1]
+
+    return gamma, beta, moving_mean, moving_variance, config.get('epsilon', 1e-3)
+
+
+def export_dense_weight_pack(model):
+    """Keras Dense 구조 모델 -> BatchNorm 접기/Dropout 제거된 가중치 팩"""
+    dense_layers = []
+
+    for layer in model.layers:
+        layer_type = layer.__class__.__name__
+
+        if layer_type in ('InputLayer', 'Flatten', 'Dropout'):
+            continue
+
+        if layer_type == 'Dense':
+            kernel, bias = (layer.get_weights() + [None])[:2]
+            if bias is None:
+                bias = np.zeros(kernel.shape[1], dtype=np.float32)
+            dense_layers.append({
+                'kernel': kernel.astype(np.float32),
+                'bias': bias.astype(np.float32),
+                'activation': _activation_name(layer.activation)
+            })
+
+        elif layer_type == 'BatchNormalization':
+            if not dense_layers or dense_layers[-1]['activation'] != 'linear':
+                raise ValueError('BatchNormalization must directly follow a linear Dense layer')
+            previous = dense_layers[-1]
+            previous['kernel'], previous['bias'] = fold_dense_batchnorm(
+                previous['kernel'], previous['bias'], *_batchnorm_params(layer)
+            )
+
+        elif layer_type == 'Activation':
+            if not dense_layers or dense_layers[-1]['activation'] != 'linear':
+                raise ValueError('Activation must directly follow a linear Dense layer')
+            dense_layers[-1]['activation'] = _activation_name(layer.activation)
+
+        else:
+            raise ValueError(f'Unsupported layer for NumPy backend: {layer_type}')
+
+    for dense_layer in dense_layers:
+        if dense_layer['activation'] not in SUPPORTED_ACTIVATIONS:
+            raise ValueError(f"Unsupported activation for NumPy backend: {dense_layer['activation']}")
+
+    return {
+        'version': WEIGHT_PACK_VERSION,
+        'input_shape': [int(dim) for dim in model.input_shape[1:]],
+        'quantization': None,
+        'layers': dense_layers
+    }
+
+
+def quantize_weight_pack_int8(pack):
+    """출력 채널별 대칭 int8 양자화 (커널만 양자화, 바이어스는 float32 유지)"""
+    quantized_layers = []
+    for dense_layer in pack['layers']:
+        kernel = dense_layer['kernel']
+        scale = np.max(np.abs(kernel), axis=0) / 127.0
+        scale[scale == 0] = 1.0
+        quantized_layers.append({
+            'kernel': np.clip(np.round(kernel / scale), -127, 127).astype(np.int8),
+            'kernel_scale': scale.astype(np.float32),
+            'bias': dense_layer['bias'],
+            'activation': dense_layer['activation']
+        })
+
+    return {**pack, 'quantization': 'int8', 'layers': quantized_layers}
+
+
+def save_weight_pack(pack, path):
+    """가중치 팩을 .npz로 저장"""
+    arrays = {}
+    for i, dense_layer in enumerate(pack['layers']):
+        arrays[f'layer{i}_kernel'] = dense_layer['kernel']
+        arrays[f'layer{i}_bias'] = dense_layer['bias']
+        if 'kernel_scale' in dense_layer:
+            arrays[f'layer{i}_kernel_scale'] = dense_layer['kernel_scale']
+
+    meta = {
+        'version': pack['version'],
+        'input_shape': pack['input_shape'],
+        'quantization': pack['quantization'],
+        'activations': [dense_layer['activation'] for dense_layer in pack['layers']]
+    }
+    arrays['meta'] = np.array(json.dumps(meta))
+
+    with open(path, 'wb') as f:
+        np.savez(f, **arrays)
+
+
+def load_weight_pack(path):
+    """.npz 가중치 팩 로드"""
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(str(data['meta']))
+        layers = []
+        for i, activation in enumerate(meta['activations']):
+            dense_layer = {
+                'kernel': data[f'layer{i}_kernel'],
+                'bias': data[f'layer{i}_bias'],
+                'activation': activation
+            }
+            if f'layer{i}_kernel_scale' in data:
+                dense_layer['kernel_scale'] = data[f'layer{i}_kernel_scale']
+            layers.append(dense_layer)
+
+    return {
+        'version': meta['version'],
+        'input_shape': meta['input_shape'],
+        'quantization': meta['quantization'],
+        'layers': layers
+    }
+
+
+def _apply_activation(x, activation):
+    if activation == 'relu':
+        return np.maximum(x, 0)
+    if activation == 'softmax':
+        x = x - np.max(x, axis=-1, keepdims=True)
+        e = np.exp(x)
+        return e / np.sum(e, axis=-1, keepdims=True)
+    if activation == 'sigmoid':
+        return 1.0 / (1.0 + np.exp(-x))
+    if activation == 'tanh':
+        return np.tanh(x)
+    if activation == 'swish':
+        return x / (1.0 + np.exp(-x))
+    return x
+
+
+class NumpyInferenceEngine:
+    """TensorFlow 없이 NumPy로 Dense 가중치 팩을 배치 추론하는 엔진"""
+
+    backend = 'numpy'
+
+    def __init__(self, pack):
+        self.pack = pack
+        self.input_shape = tuple(pack['input_shape'])
+        self.quantization = pack['quantization']
+        self.warmup_time_ms = None
+
+        # int8 커널은 로드 시 float32로 변환해 두고, 스케일은 matmul 이후 곱함
+        self._layers = []
+        for dense_layer in pack['layers']:
+            self._layers.append((
+                dense_layer['kernel'].astype(np.float32, copy=False),
+                dense_layer.get('kernel_scale'),
+                dense_layer['bias'],
+                dense_layer['activation']
+            ))
+
+    @classmethod
+    def from_file(cls, path):
+        return cls(load_weight_pack(path))
+
+    def forward(self, input_data):
+        """순수 NumPy 순전파 (B, 21, 3) -> (B, num_classes)"""
+        x = np.asarray(input_data, dtype=np.float32).reshape(len(input_data), -1)
+        for kernel, kernel_scale, bias, activation in self._layers:
+            x = x @ kernel
+            if kernel_scale is not None:
+                x = x * kernel_scale
+            x = _apply_activation(x + bias, activation)
+        return x
+
+    def warm_up(self, batch_sizes=(1,)):
+        start = time.perf_counter()
+        for batch_size in batch_sizes:
+            self.predict(np.zeros((batch_size,) + self.input_shape, dtype=np.float32))
+        self.warmup_time_ms = (time.perf_counter() - start) * 1000
+        return self.warmup_time_ms
+
+    def predict(self, input_data):
+        """배치 추론 -> (확률 배열, 순수 연산 시간 ms)"""
+        start = time.perf_counter()
+        probabilities = self.forward(input_data)
+        compute_time_ms = (time.perf_counter() - start) * 1000
+        return probabilities, compute_time_ms
+
+    def memory_bytes(self):
+        """가중치 메모리 (bytes, int8 커널은 로드 시 float32로 변환된 크기)"""
+        return sum(
+            kernel.nbytes + bias.nbytes + (kernel_scale.nbytes if kernel_scale is not None else 0)
+            for kernel, kernel_scale, bias, _ in self._layers
+        )
+
+    def describe(self):
+        return {
+            'backend': self.backend,
+            'quantization': self.quantization,
+            'num_layers': len(self._layers),
+            'warmup_time_ms': self.warmup_time_ms
+        }
+
+
+def validate_weight_pack(engine, model, inputs, atol=1e-4, min_top1_agreement=1.0):
+    """NumPy 엔진 출력과 Keras 모델 출력 비교
+
+    BatchNorm 접기는 부동소수점 연산 순서를 바꾸므로 일반적으로 비트 단위로 동일하지 않습니다.
+    bit_exact 여부와 함께 최대 오차, top-1 일치율로 검증합니다.
+    """
+    inputs = np.asarray(inputs, dtype=np.float32)
+    expected = np.asarray(model(inputs, training=False))
+    actual = engine.forward(inputs)
+
+    max_abs_diff = float(np.max(np.abs(expected - actual)))
+    top1_agreement = float(np.mean(np.argmax(expected, axis=1) == np.argmax(actual, axis=1)))
+
+    return {
+        'num_samples': int(len(inputs)),
+        'bit_exact': bool(np.array_equal(expected, actual)),
+        'max_abs_diff': max_abs_diff,
+        'top1_agreement': top1_agreement,
+        'tolerance': atol,
+        'passed': max_abs_diff <= atol and top1_agreement >= min_top1_agreement
+    }
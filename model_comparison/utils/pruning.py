@@ -0,0 +1,169 @@
+"""
+크기 기반 점진적 가지치기 (Gradual Magnitude Pruning)
+학습 중 Dense/Conv1D 커널의 희소도를 0에서 목표 희소도까지 다항 스케줄(Zhu & Gupta, 2017)로 늘리며
+레이어별로 절댓값이 작은 가중치부터 0으로 고정합니다.
+가지치기된 모델은 커널을 [비트마스크 | 0이 아닌 값] 으로 저장하는 희소 가중치 파일로 내보냅니다.
+"""
+
+import json
+
+import numpy as np
+import tensorflow as tf
+from tensorflow.keras.callbacks import Callback
+
+
+PRUNABLE_LAYER_TYPES = ('Dense', 'Conv1D')
+SPARSE_WEIGHTS_VERSION = 1
+
+
+def polynomial_sparsity(step, begin_step, end_step, target_sparsity, power=3):
+    """step 시점의 희소도 (초반에 빠르게, 목표에 가까울수록 천천히 증가)"""
+    if step <= begin_step:
+        return 0.0
+    if step >= end_step:
+        return float(target_sparsity)
+    progress = (step - begin_step) / (end_step - begin_step)
+    return float(target_sparsity * (1.0 - (1.0 - progress) ** power))
+
+
+def get_prunable_layers(model):
+    """가지치기 대상 레이어 (Dense/Conv1D, 중첩 모델 포함)"""
+    prunable = []
+    for layer in model.layers:
+        if isinstance(layer, tf.keras.Model):
+            prunable.extend(get_prunable_layers(layer))
+        elif layer.__class__.__name__ in PRUNABLE_LAYER_TYPES:
+            prunable.append(layer)
+    return prunable
+
+
+def magnitude_mask(kernel, sparsity):
+    """절댓값 하위 sparsity 비율을 0으로 만드는 마스크"""
+    num_pruned = int(round(kernel.size * sparsity))
+    if num_pruned == 0:
+        return np.ones(kernel.shape, dtype=np.float32)
+    magnitudes = np.abs(kernel).ravel()
+    pruned = np.argpartition(magnitudes, num_pruned - 1)[:num_pruned]
+    mask = np.ones(kernel.size, dtype=np.float32)
+    mask[pruned] = 0.0
+    return mask.reshape(kernel.shape)
+
+
+class MagnitudePruningCallback(Callback):
+    """학습 중 점진적 크기 기반 가지치기 Callback
+
+    frequency 스텝마다 현재 스케줄의 희소도로 마스크를 다시 계산하고,
+    매 배치 후 마스크를 적용해 옵티마이저 업데이트로 되살아난 가중치를 다시 0으로 만듭니다.
+    end_step 이후에는 목표 희소도로 고정된 마스크에서 남은 가중치만 미세 조정됩니다.
+    """
+
+    def __init__(self, target_sparsity, end_step, begin_step=0, frequency=10):
+        super().__init__()
+        if not 0.0 < target_sparsity < 1.0:
+            raise ValueError('target_sparsity must be in (0, 1)')
+        self.target_sparsity = float(target_sparsity)
+        self.begin_step = int(begin_step)
+        self.end_step = max(int(end_step), self.begin_step + 1)
+        # 스케줄 동안 마스크를 최소 10번은 갱신 (작은 데이터셋에서 한 번에 목표 희소도로 뛰지 않도록)
+        self.frequency = max(min(int(frequency), (self.end_step - self.begin_step) // 10), 1)
+
+        self.step = 0
+        self.current_sparsity = 0.0
+        self.layers = []
+        self.masks = {}
+        self.sparsity_history = []
+
+    def on_train_begin(self, logs=None):
+        self.layers = get_prunable_layers(self.model)
+
+    def _update_masks(self, sparsity):
+        self.current_sparsity = sparsity
+        for layer in self.layers:
+            self.masks[layer.name] = magnitude_mask(layer.kernel.numpy(), sparsity)
+
+    def _apply_masks(self):
+        for layer in self.layers:
+            mask = self.masks.get(layer.name)
+            if mask is not None:
+                layer.kernel.assign(layer.kernel * mask)
+
+    def on_train_batch_end(self, batch, logs=None):
+        self.step += 1
+        if self.step % self.frequency == 0 or self.step == self.end_step:
+            sparsity = polynomial_sparsity(self.step, self.begin_step, self.end_step, self.target_sparsity)
+            if sparsity != self.current_sparsity:
+                self._update_masks(sparsity)
+        self._apply_masks()
+
+    def on_epoch_end(self, epoch, logs=None):
+        self.sparsity_history.append(self.current_sparsity)
+
+    def on_train_end(self, logs=None):
+        # 스케줄이 끝나기 전에 학습이 끝나도 저장되는 모델은 목표 희소도
+        if self.current_sparsity != self.target_sparsity:
+            self._update_masks(self.target_sparsity)
+        self._apply_masks()
+
+
+def compute_sparsity(model):
+    """가지치기 대상 커널의 실제 희소도 (전체/레이어별)"""
+    layers = {}
+    zeros = 0
+    total = 0
+    for layer in get_prunable_layers(model):
+        kernel = layer.kernel.numpy()
+        layer_zeros = int(np.sum(kernel == 0))
+        layers[layer.name] = layer_zeros / kernel.size
+        zeros += layer_zeros
+        total += kernel.size
+
+    return {
+        'sparsity': zeros / total if total else 0.0,
+        'pruned_parameters': zeros,
+        'prunable_parameters': total,
+        'layers': layers
+    }
+
+
+def export_sparse_weights(model, path):
+    """가지치기된 모델 가중치 -> 희소 가중치 파일 (.npz)
+
+    가지치기 대상 커널은 비트마스크(가중치당 1비트) + 0이 아닌 float32 값으로,
+    나머지 가중치(바이어스, BatchNorm 등)는 그대로 저장합니다.
+    인덱스 목록(CSR) 대신 비트마스크를 쓰므로 밀도가 1/32 이상이면 더 작습니다.
+    """
+    prunable_kernels = {id(layer.kernel) for layer in get_prunable_layers(model)}
+    arrays = {}
+    entries = []
+
+    for i, variable in enumerate(model.weights):
+        value = np.asarray(variable.numpy(), dtype=np.float32)
+        if id(variable) in prunable_kernels:
+            nonzero = value != 0
+            arrays[f'w{i}_mask'] = np.packbits(nonzero.ravel())
+            arrays[f'w{i}_values'] = value[nonzero]
+            entries.append({'shape': list(value.shape), 'sparse': True})
+        else:
+            arrays[f'w{i}'] = value
+            entries.append({'shape': list(value.shape), 'sparse': False})
+
+    arrays['meta'] = np.array(json.dumps({'version': SPARSE_WEIGHTS_VERSION, 'weights': entries}))
+    with open(path, 'wb') as f:
+        np.savez(f, **arrays)
+
+
+def load_sparse_weights(path):
+    """희소 가중치 파일 -> model.weights 순서의 dense 배열 목록 (model.set_weights 용)"""
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(str(data['meta']))
+        weights = []
+        for i, entry in enumerate(meta['weights']):
+            if not entry['sparse']:
+                weights.append(data[f'w{i}'])
+                continue
+            size = int(np.prod(entry['shape']))
+            nonzero = np.unpackbits(data[f'w{i}_mask'], count=size).astype(bool)
+            value = np.zeros(size, dtype=np.float32)
+            value[nonzero] = data[f'w{i}_values']
+            weights.append(value.reshape(entry['shape']))
+    return weights
@@ -114,8 +114,13 @@ class ResourceMonitor:
             return size_bytes / (1024 * 1024)  # Bytes to MB
         return None
 
-    def measure_inference_time_detailed(self, model, sample_data, num_runs=100):
-        """추론 시간 상세 측정"""
+    def measure_inference_time_detailed(self, model, sample_data, num_runs=100, inference_fn=None):
+        """추론 시간 상세 측정 (inference_fn 이 없으면 XLA 없는 tf.function, 실행 모드와 관계없이 같은 호출 경로)"""
+        if inference_fn is None:
+            inference_fn = tf.function(lambda x: model(x, training=False))
+        sample_data = tf.convert_to_tensor(sample_data, dtype=tf.float32)
+        inference_fn(sample_data)  # 트레이싱/XLA 컴파일은 측정에서 제외
+
         times = []
         memory_before = []
         memory_after = []
@@ -125,7 +130,7 @@ class ResourceMonitor:
             memory_before.append(mem_before)
 
             start = time.time()
-            _ = model.predict(sample_data, verbose=0)
+            _ = inference_fn(sample_data).numpy()
             elapsed = (time.time() - start) * 1000  # ms
             times.append(elapsed)
 
@@ -233,7 +238,7 @@ def get_system_info():
     }
 
 
-def measure_all_resources(model, model_path, sample_data, input_shape):
+def measure_all_resources(model, model_path, sample_data, input_shape, inference_fn=None):
     """모든 리소스 측정"""
     monitor = ResourceMonitor()
 
@@ -244,7 +249,9 @@ def measure_all_resources(model, model_path, sample_data, input_shape):
     model_size_mb = monitor.get_model_size(model_path)
 
     # 추론 시간 상세 측정
-    inference_stats = monitor.measure_inference_time_detailed(model, sample_data, num_runs=100)
+    inference_stats = monitor.measure_inference_time_detailed(
+        model, sample_data, num_runs=100, inference_fn=inference_fn
+    )
 
     # GPU 메모리
     gpu_memory = monitor.get_gpu_memory_usage()
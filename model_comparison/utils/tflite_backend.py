@@ -0,0 +1,150 @@
+"""
+TFLite 양자화 백엔드
+Keras 모델을 TFLite 변환기로 dynamic-range / float16 / full-int8 양자화하고
+TFLite 인터프리터로 배치 추론합니다.
+"""
+
+import os
+import threading
+import time
+import numpy as np
+
+
+TFLITE_QUANTIZATION_MODES = ('dynamic', 'float16', 'int8')
+
+
+def convert_to_tflite(model, mode, representative_data=None, num_calibration_samples=200):
+    """Keras 모델 -> 양자화된 TFLite flatbuffer (bytes)
+
+    mode=int8 은 대표 데이터셋으로 활성화 범위를 보정하며, 입출력까지 int8인 모델을 만듭니다.
+    """
+    import tensorflow as tf
+
+    if mode not in TFLITE_QUANTIZATION_MODES:
+        raise ValueError(f'Invalid TFLite quantization mode: {mode}')
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+
+    if mode == 'float16':
+        converter.target_spec.supported_types = [tf.float16]
+
+    elif mode == 'int8':
+        if representative_data is None or len(representative_data) == 0:
+            raise ValueError('int8 quantization requires a representative dataset')
+        calibration_data = np.asarray(representative_data[:num_calibration_samples], dtype=np.float32)
+
+        def representative_dataset():
+            for sample in calibration_data:
+                yield [sample[np.newaxis, ...]]
+
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+
+    return converter.convert()
+
+
+def _load_interpreter_class():
+    """tflite_runtime이 설치되어 있으면 사용, 없으면 TensorFlow 내장 인터프리터"""
+    try:
+        from tflite_runtime.interpreter import Interpreter
+    except ImportError:
+        import tensorflow as tf
+        Interpreter = tf.lite.Interpreter
+    return Interpreter
+
+
+class TFLiteInferenceEngine:
+    """TFLite 인터프리터 추론 엔진 (int8 입출력은 양자화/역양자화 처리)"""
+
+    backend = 'tflite'
+
+    def __init__(self, model_path, num_threads=None):
+        Interpreter = _load_interpreter_class()
+
+        self.model_path = model_path
+        self.interpreter = Interpreter(model_path=model_path, num_threads=num_threads)
+        self.interpreter.allocate_tensors()
+        self.warmup_time_ms = None
+
+        self._input_detail = self.interpreter.get_input_details()[0]
+        self._output_detail = self.interpreter.get_output_details()[0]
+        self.input_shape = tuple(int(dim) for dim in self._input_detail['shape'][1:])
+        self._batch_size = int(self._input_detail['shape'][0])
+
+        # 인터프리터는 스레드 안전하지 않음
+        self._lock = threading.Lock()
+
+    @property
+    def input_dtype(self):
+        return np.dtype(self._input_detail['dtype']).name
+
+    def _resize(self, batch_size):
+        """배치 크기가 바뀌면 입력 텐서 크기 재할당"""
+        if batch_size != self._batch_size:
+            self.interpreter.resize_tensor_input(self._input_detail['index'], (batch_size,) + self.input_shape)
+            self.interpreter.allocate_tensors()
+            self._batch_size = batch_size
+
+    def _quantize_input(self, input_data):
+        dtype = self._input_detail['dtype']
+        if dtype == np.float32:
+            return input_data
+        scale, zero_point = self._input_detail['quantization']
+        info = np.iinfo(dtype)
+        return np.clip(np.round(input_data / scale + zero_point), info.min, info.max).astype(dtype)
+
+    def _dequantize_output(self, output):
+        if self._output_detail['dtype'] == np.float32:
+            return output
+        scale, zero_point = self._output_detail['quantization']
+        return (output.astype(np.float32) - zero_point) * scale
+
+    def warm_up(self, batch_sizes=(1,)):
+        """텐서 할당 및 첫 실행 비용을 로드 시점에 미리 지불"""
+        start = time.perf_counter()
+        for batch_size in batch_sizes:
+            self.predict(np.zeros((batch_size,) + self.input_shape, dtype=np.float32))
+        self.warmup_time_ms = (time.perf_counter() - start) * 1000
+        return self.warmup_time_ms
+
+    def predict(self, input_data):
+        """배치 추론 -> (확률 배열, 순수 연산 시간 ms)"""
+        input_data = np.asarray(input_data, dtype=np.float32)
+
+        with self._lock:
+            start = time.perf_counter()
+            self._resize(len(input_data))
+            self.interpreter.set_tensor(self._input_detail['index'], self._quantize_input(input_data))
+            self.interpreter.invoke()
+            output = self.interpreter.get_tensor(self._output_detail['index'])
+            probabilities = self._dequantize_output(output)
+            compute_time_ms = (time.perf_counter() - start) * 1000
+
+        return probabilities, compute_time_ms
+
+    def memory_bytes(self):
+        """flatbuffer 모델 크기 (bytes, 인터프리터 텐서 arena 제외)"""
+        return os.path.getsize(self.model_path)
+
+    def describe(self):
+        """엔진 정보"""
+        return {
+            'backend': self.backend,
+            'input_dtype': self.input_dtype,
+            'warmup_time_ms': self.warmup_time_ms
+        }
+
+
+def evaluate_accuracy(predict_fn, inputs, labels, batch_size=64):
+    """정확도 평가 (predict_fn: 배치 입력 -> 확률 배열)"""
+    inputs = np.asarray(inputs, dtype=np.float32)
+    true_classes = np.argmax(labels, axis=1)
+
+    predicted = []
+    for start in range(0, len(inputs), batch_size):
+        predicted.append(np.argmax(predict_fn(inputs[start:start + batch_size]), axis=1))
+
+    return float(np.mean(np.concatenate(predicted) == true_classes))
@@ -0,0 +1,75 @@
+"""
+빠른 모델 로드용 아티팩트 (아키텍처 키 + 생성자 인자 + mmap 가능한 가중치 파일)
+JSON 헤더에 모델 클래스 키/생성자 인자/가중치 목록(형태, dtype, 오프셋)을 저장하고,
+가중치는 하나의 평탄한 바이너리 파일에 이어 붙입니다.
+바이너리는 파일 시작(페이지 경계)부터 각 가중치를 64바이트 경계에 정렬하므로 np.memmap 뷰로 복사 없이 읽을 수 있고,
+같은 파일을 여는 여러 프로세스는 OS 페이지 캐시의 가중치 페이지를 공유합니다.
+"""
+
+import json
+import os
+
+import numpy as np
+
+
+WEIGHT_STORE_VERSION = 1
+WEIGHT_ALIGNMENT = 64
+
+
+def _align(offset, alignment=WEIGHT_ALIGNMENT):
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def save_weight_store(header_path, weights_path, model_key, constructor_args, weights, names=None):
+    """가중치 배열 목록 -> 평탄한 바이너리 + JSON 헤더
+
+    헤더는 바이너리를 다 쓴 뒤에 저장하므로 저장 중 중단되어도 불완전한 아티팩트가 로드되지 않습니다.
+    """
+    entries = []
+    offset = 0
+    with open(weights_path, 'wb') as f:
+        for i, weight in enumerate(weights):
+            array = np.ascontiguousarray(weight)
+            aligned = _align(offset)
+            f.write(b'\0' * (aligned - offset))
+            f.write(array.tobytes())
+            entries.append({
+                'name': names[i] if names is not None else f'w{i}',
+                'shape': list(array.shape),
+                'dtype': array.dtype.str,
+                'offset': aligned,
+                'nbytes': int(array.nbytes)
+            })
+            offset = aligned + array.nbytes
+
+    header = {
+        'version': WEIGHT_STORE_VERSION,
+        'model_key': model_key,
+        'constructor_args': constructor_args,
+        'weights_file': os.path.basename(weights_path),
+        'weights_bytes': offset,
+        'alignment': WEIGHT_ALIGNMENT,
+        'weights': entries
+    }
+    with open(header_path, 'w', encoding='utf-8') as f:
+        json.dump(header, f, indent=2)
+    return header
+
+
+def load_weight_store(header_path):
+    """JSON 헤더 + 가중치 memmap 뷰 목록 (읽기 전용, 복사 없음) -> (헤더, 가중치 목록)"""
+    with open(header_path, 'r', encoding='utf-8') as f:
+        header = json.load(f)
+    if header.get('version') != WEIGHT_STORE_VERSION:
+        raise ValueError(f"Unsupported weight store version: {header.get('version')}")
+
+    weights_path = os.path.join(os.path.dirname(header_path), header['weights_file'])
+    if os.path.getsize(weights_path) != header['weights_bytes']:
+        raise ValueError(f"Weight file size mismatch: {weights_path}")
+
+    buffer = np.memmap(weights_path, dtype=np.uint8, mode='r')
+    weights = [
+        buffer[entry['offset']:entry['offset'] + entry['nbytes']].view(np.dtype(entry['dtype'])).reshape(entry['shape'])
+        for entry in header['weights']
+    ]
+    return header, weights